@@ -77,6 +77,7 @@ def train(
     loop: "Optional[asyncio.AbstractEventLoop]" = None,
     model_to_finetune: "Optional[Text]" = None,
     finetuning_epoch_fraction: float = 1.0,
+    concurrent_training: bool = False,
 ) -> "TrainingResult":
     """Runs Rasa Core and NLU training in `async` loop.
 
@@ -99,6 +100,8 @@ def train(
             a directory in case the latest trained model should be used.
         finetuning_epoch_fraction: The fraction currently specified training epochs
             in the model configuration which should be used for finetuning.
+        concurrent_training: If `True`, NLU and Core are trained concurrently in
+            separate processes in case Core doesn't depend on the NLU model.
 
     Returns:
         An instance of `TrainingResult`.
@@ -120,6 +123,7 @@ def train(
             nlu_additional_arguments=nlu_additional_arguments,
             model_to_finetune=model_to_finetune,
             finetuning_epoch_fraction=finetuning_epoch_fraction,
+            concurrent_training=concurrent_training,
         ),
         loop,
     )
@@ -25,11 +25,13 @@ def set_train_arguments(parser: argparse.ArgumentParser) -> None:
     add_debug_plots_param(parser)
 
     _add_num_threads_param(parser)
+    _add_cache_dir_param(parser)
 
     _add_model_name_param(parser)
     add_persist_nlu_data_param(parser)
     add_force_param(parser)
     add_finetune_params(parser)
+    _add_concurrent_training_param(parser)
 
 
 def set_train_core_arguments(parser: argparse.ArgumentParser) -> None:
@@ -60,6 +62,7 @@ def set_train_nlu_arguments(parser: argparse.ArgumentParser) -> None:
     add_nlu_data_param(parser, help_text="File or folder containing your NLU data.")
 
     _add_num_threads_param(parser)
+    _add_cache_dir_param(parser)
 
     _add_model_name_param(parser)
     add_persist_nlu_data_param(parser)
@@ -181,6 +184,31 @@ def _add_num_threads_param(
     )
 
 
+def _add_cache_dir_param(
+    parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
+) -> None:
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory where trained tokenizers and featurizers of the NLU "
+        "pipeline are cached. Unchanged components are restored from this cache "
+        "instead of being trained again.",
+    )
+
+
+def _add_concurrent_training_param(
+    parser: Union[argparse.ArgumentParser, argparse._ActionsContainer]
+) -> None:
+    parser.add_argument(
+        "--concurrent-training",
+        action="store_true",
+        help="Train the NLU and the Core model at the same time in separate "
+        "processes if both need to be retrained. This is only done if the Core "
+        "training doesn't use the features of the NLU model.",
+    )
+
+
 def _add_model_name_param(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--fixed-model-name",
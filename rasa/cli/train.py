@@ -101,6 +101,7 @@ def run_training(args: argparse.Namespace, can_exit: bool = False) -> Optional[T
         nlu_additional_arguments=extract_nlu_additional_arguments(args),
         model_to_finetune=_model_for_finetuning(args),
         finetuning_epoch_fraction=args.epoch_fraction,
+        concurrent_training=getattr(args, "concurrent_training", False),
     )
     if training_result.code != 0 and can_exit:
         sys.exit(training_result.code)
@@ -223,6 +224,8 @@ def extract_nlu_additional_arguments(args: argparse.Namespace) -> Dict:
 
     if "num_threads" in args:
         arguments["num_threads"] = args.num_threads
+    if "cache_dir" in args:
+        arguments["cache_dir"] = args.cache_dir
 
     return arguments
 
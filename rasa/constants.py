@@ -1,6 +1,9 @@
 import os
 
 DEFAULT_REQUEST_TIMEOUT = 60 * 5  # 5 minutes
+DEFAULT_CONNECTION_POOL_SIZE = 100  # connections per endpoint
+DEFAULT_KEEPALIVE_TIMEOUT = 30  # seconds idle connections are kept open
+DEFAULT_DNS_CACHE_TTL = 300  # seconds resolved host names are cached
 DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 TEST_DATA_FILE = "test.md"
@@ -35,6 +38,10 @@ DEFAULT_SANIC_WORKERS = 1
 ENV_SANIC_WORKERS = "SANIC_WORKERS"
 ENV_SANIC_BACKLOG = "SANIC_BACKLOG"
 
+# maximum size of the NLU training cache in megabytes
+DEFAULT_NLU_TRAINING_CACHE_MAX_SIZE = 1024
+ENV_NLU_TRAINING_CACHE_MAX_SIZE = "RASA_NLU_TRAINING_CACHE_MAX_SIZE"
+
 ENV_GPU_CONFIG = "TF_GPU_MEMORY_ALLOC"
 ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
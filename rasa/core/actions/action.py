@@ -1,7 +1,10 @@
+import asyncio
 import copy
+import itertools
 import json
 import logging
-from typing import List, Text, Optional, Dict, Any, TYPE_CHECKING
+from collections import OrderedDict
+from typing import List, Text, Optional, Dict, Any, Set, Tuple, TYPE_CHECKING
 
 import aiohttp
 
@@ -569,27 +572,165 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+# conversations for which the event watermark of an action server is remembered
+MAX_ACTION_SERVER_WATERMARKS = 10000
+
+
+class _ActionServerCache:
+    """What an action server which accepts delta requests has cached."""
+
+    def __init__(self) -> None:
+        self.domain_digests: Set[Text] = set()
+        # number of cached events and timestamp of the last one for every sender
+        self.event_watermarks: "OrderedDict[Text, Tuple[int, float]]" = OrderedDict()
+
+    def events_offset(self, tracker: "DialogueStateTracker") -> int:
+        """Returns the number of events of the tracker the action server has."""
+        watermark = self.event_watermarks.get(tracker.sender_id)
+        if not watermark:
+            return 0
+
+        number_of_events, last_timestamp = watermark
+        # the events can't be used if the tracker was changed in the meantime
+        if (
+            number_of_events > len(tracker.events)
+            or tracker.events[number_of_events - 1].timestamp != last_timestamp
+        ):
+            return 0
+        return number_of_events
+
+    def update(
+        self,
+        response: Dict[Text, Any],
+        tracker: "DialogueStateTracker",
+        domain_digest: Text,
+    ) -> None:
+        """Remembers what the action server acknowledged to have cached."""
+        if response.get("domain_digest") == domain_digest:
+            self.domain_digests.add(domain_digest)
+
+        number_of_events = response.get("events_watermark")
+        self.event_watermarks.pop(tracker.sender_id, None)
+        if isinstance(number_of_events, int) and (
+            0 < number_of_events <= len(tracker.events)
+        ):
+            self.event_watermarks[tracker.sender_id] = (
+                number_of_events,
+                tracker.events[number_of_events - 1].timestamp,
+            )
+            if len(self.event_watermarks) > MAX_ACTION_SERVER_WATERMARKS:
+                self.event_watermarks.popitem(last=False)
+
+    def forget(self, tracker: "DialogueStateTracker", domain_digest: Text) -> None:
+        self.domain_digests.discard(domain_digest)
+        self.event_watermarks.pop(tracker.sender_id, None)
+
+
+# caches of the action servers by their URL
+_action_server_caches: Dict[Text, _ActionServerCache] = {}
+
+
 class RemoteAction(Action):
+    """Runs a custom action on an action server.
+
+    If `delta_requests` is set in the action endpoint configuration, requests only
+    contain the fingerprint of the domain and the events the action server has not
+    seen yet. The action server acknowledges what it cached with the
+    `domain_digest` and `events_watermark` keys of its response, and replies with a
+    409 status if its cache can't serve a request, which is then sent again in full.
+    """
+
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
         self._name = name
         self.action_endpoint = action_endpoint
 
+    def _uses_delta_requests(self) -> bool:
+        return bool(
+            self.action_endpoint and self.action_endpoint.kwargs.get("delta_requests")
+        )
+
+    def _action_server_cache(self) -> _ActionServerCache:
+        return _action_server_caches.setdefault(
+            self.action_endpoint.url, _ActionServerCache()
+        )
+
     def _action_call_format(
-        self, tracker: "DialogueStateTracker", domain: "Domain"
+        self,
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        send_full_state: bool = False,
     ) -> Dict[Text, Any]:
-        """Create the request json send to the action server."""
-        from rasa.shared.core.trackers import EventVerbosity
+        """Create the request json send to the action server.
 
-        tracker_state = tracker.current_state(EventVerbosity.ALL)
+        Args:
+            tracker: The tracker of the conversation.
+            domain: The domain of the model.
+            send_full_state: Whether to send the domain and all events even if the
+                action server accepts delta requests and has them cached.
 
-        return {
+        Returns:
+            The request body.
+        """
+        from rasa.shared.core.trackers import EventVerbosity
+
+        if not self._uses_delta_requests():
+            return {
+                "next_action": self._name,
+                "sender_id": tracker.sender_id,
+                "tracker": tracker.current_state(EventVerbosity.ALL),
+                "domain": domain.as_dict(),
+                "version": rasa.__version__,
+            }
+
+        cache = self._action_server_cache()
+        domain_digest = domain.fingerprint()
+        events_offset = 0 if send_full_state else cache.events_offset(tracker)
+
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        tracker_state["events"] = [
+            event.as_dict()
+            for event in itertools.islice(tracker.events, events_offset, None)
+        ]
+        json_body = {
             "next_action": self._name,
             "sender_id": tracker.sender_id,
             "tracker": tracker_state,
-            "domain": domain.as_dict(),
+            "events_offset": events_offset,
+            "domain_digest": domain_digest,
             "version": rasa.__version__,
         }
+        if send_full_state or domain_digest not in cache.domain_digests:
+            json_body["domain"] = domain.as_dict()
+        return json_body
+
+    async def _call_action_server(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Dict[Text, Any]:
+        json_body = self._action_call_format(tracker, domain)
+        try:
+            response = await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+        except ClientResponseError as e:
+            if e.status != 409 or not self._uses_delta_requests():
+                raise
+            # the action server lost the domain or the events it acknowledged
+            logger.debug(
+                f"Action server misses cached data to run action '{self.name()}'. "
+                f"Sending the full request."
+            )
+            self._action_server_cache().forget(tracker, json_body["domain_digest"])
+            json_body = self._action_call_format(tracker, domain, send_full_state=True)
+            response = await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+
+        if self._uses_delta_requests() and isinstance(response, dict):
+            self._action_server_cache().update(
+                response, tracker, json_body["domain_digest"]
+            )
+        return response
 
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
@@ -630,7 +771,7 @@ class RemoteAction(Action):
         tracker: "DialogueStateTracker",
     ) -> List[BotUttered]:
         """Use the responses generated by the action endpoint and utter them."""
-        bot_messages = []
+        generated_responses = []
         for response in responses:
             generated_response = response.pop("response", None)
             generated_template = response.pop("template", None)
@@ -644,15 +785,33 @@ class RemoteAction(Action):
                     docs=f"{rasa.shared.constants.DOCS_BASE_URL_ACTION_SERVER}"
                     f"/sdk-dispatcher",
                 )
+            generated_responses.append(generated_response)
+
+        async def generate(
+            generated_response: Optional[Text], response: Dict[Text, Any]
+        ) -> Optional[Dict[Text, Any]]:
+            if not generated_response:
+                return {}
+            return await nlg.generate(
+                generated_response, tracker, output_channel.name(), **response
+            )
+
+        # the responses are generated concurrently in case the NLG is a remote one
+        drafts = await asyncio.gather(
+            *[
+                generate(generated_response, response)
+                for generated_response, response in zip(generated_responses, responses)
+            ]
+        )
+
+        bot_messages = []
+        for generated_response, response, draft in zip(
+            generated_responses, responses, drafts
+        ):
             if generated_response:
-                draft = await nlg.generate(
-                    generated_response, tracker, output_channel.name(), **response
-                )
                 if not draft:
                     continue
                 draft["utter_action"] = generated_response
-            else:
-                draft = {}
 
             buttons = response.pop("buttons", []) or []
             if buttons:
@@ -674,7 +833,6 @@ class RemoteAction(Action):
         domain: "Domain",
     ) -> List[Event]:
         """Runs action. Please see parent class for the full docstring."""
-        json_body = self._action_call_format(tracker, domain)
         if not self.action_endpoint:
             raise RasaException(
                 f"Failed to execute custom action '{self.name()}' "
@@ -689,9 +847,7 @@ class RemoteAction(Action):
             logger.debug(
                 "Calling action endpoint to run action '{}'.".format(self.name())
             )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
+            response = await self._call_action_server(tracker, domain)
 
             self._validate_action_result(response)
 
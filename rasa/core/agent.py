@@ -190,56 +190,57 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
-        try:
-            params = model_server.combine_parameters()
-            async with session.request(
-                "GET",
-                model_server.url,
-                timeout=DEFAULT_REQUEST_TIMEOUT,
-                headers=headers,
-                params=params,
-            ) as resp:
-
-                if resp.status in [204, 304]:
-                    logger.debug(
-                        "Model server returned {} status code, "
-                        "indicating that no new model is available. "
-                        "Current fingerprint: {}"
-                        "".format(resp.status, fingerprint)
-                    )
-                    return None
-                elif resp.status == 404:
-                    logger.debug(
-                        "Model server could not find a model at the requested "
-                        "endpoint '{}'. It's possible that no model has been "
-                        "trained, or that the requested tag hasn't been "
-                        "assigned.".format(model_server.url)
-                    )
-                    return None
-                elif resp.status != 200:
-                    logger.debug(
-                        "Tried to fetch model from server, but server response "
-                        "status code is {}. We'll retry later..."
-                        "".format(resp.status)
-                    )
-                    return None
-
-                rasa.utils.io.unarchive(await resp.read(), model_directory)
+    # the connections to the model server are reused by every poll
+    session = model_server.pooled_session()
+    try:
+        params = model_server.combine_parameters()
+        async with session.request(
+            "GET",
+            model_server.url,
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+            headers=headers,
+            params=params,
+        ) as resp:
+
+            if resp.status in [204, 304]:
                 logger.debug(
-                    "Unzipped model to '{}'".format(os.path.abspath(model_directory))
+                    "Model server returned {} status code, "
+                    "indicating that no new model is available. "
+                    "Current fingerprint: {}"
+                    "".format(resp.status, fingerprint)
                 )
+                return None
+            elif resp.status == 404:
+                logger.debug(
+                    "Model server could not find a model at the requested "
+                    "endpoint '{}'. It's possible that no model has been "
+                    "trained, or that the requested tag hasn't been "
+                    "assigned.".format(model_server.url)
+                )
+                return None
+            elif resp.status != 200:
+                logger.debug(
+                    "Tried to fetch model from server, but server response "
+                    "status code is {}. We'll retry later..."
+                    "".format(resp.status)
+                )
+                return None
 
-                # return the new fingerprint
-                return resp.headers.get("ETag")
-
-        except aiohttp.ClientError as e:
+            rasa.utils.io.unarchive(await resp.read(), model_directory)
             logger.debug(
-                "Tried to fetch model from server, but "
-                "couldn't reach server. We'll retry later... "
-                "Error: {}.".format(e)
+                "Unzipped model to '{}'".format(os.path.abspath(model_directory))
             )
-            return None
+
+            # return the new fingerprint
+            return resp.headers.get("ETag")
+
+    except aiohttp.ClientError as e:
+        logger.debug(
+            "Tried to fetch model from server, but "
+            "couldn't reach server. We'll retry later... "
+            "Error: {}.".format(e)
+        )
+        return None
 
 
 async def _run_model_pulling_worker(
@@ -424,10 +425,15 @@ class Agent:
         model_directory: Optional[Text] = None,
     ) -> None:
         self.domain = self._create_domain(domain)
+        if self.policy_ensemble and policy_ensemble is not self.policy_ensemble:
+            self.policy_ensemble.close()
         self.policy_ensemble = policy_ensemble
 
         if interpreter:
-            self.interpreter = rasa.core.interpreter.create_interpreter(interpreter)
+            interpreter = rasa.core.interpreter.create_interpreter(interpreter)
+            if interpreter is not self.interpreter:
+                self.interpreter.close()
+            self.interpreter = interpreter
 
         self._set_fingerprint(fingerprint)
 
@@ -517,6 +523,17 @@ class Agent:
             path_to_model_archive=path_to_model_archive,
         )
 
+    def close_model(self) -> None:
+        """Releases the resources of the loaded model.
+
+        Call this when the agent is replaced or the server shuts down, e.g. to stop
+        the pools which run the NLU pipeline and the inference queues of the
+        policies.
+        """
+        self.interpreter.close()
+        if self.policy_ensemble:
+            self.policy_ensemble.close()
+
     def is_core_ready(self) -> bool:
         """Check if all necessary components and policies are ready to use the agent."""
         return self.is_ready() and self.policy_ensemble is not None
@@ -560,6 +577,20 @@ class Agent:
         message = UserMessage(message_data)
         return await processor.parse_message(message, tracker)
 
+    async def parse_messages_using_nlu_interpreter(
+        self, texts: List[Text]
+    ) -> List[Dict[Text, Any]]:
+        """Parses multiple texts at once using the NLU interpreter.
+
+        Args:
+            texts: The texts to parse.
+
+        Returns:
+            The parsed messages in the same order as the texts.
+        """
+        processor = self.create_processor()
+        return await processor.parse_messages(texts)
+
     async def handle_message(
         self,
         message: UserMessage,
@@ -700,6 +731,7 @@ class Agent:
         use_story_concatenation: bool = True,
         debug_plots: bool = False,
         exclusion_percentage: Optional[int] = None,
+        story_generation_workers: int = 1,
     ) -> List[DialogueStateTracker]:
         """Load training data from a resource."""
 
@@ -733,6 +765,7 @@ class Agent:
             use_story_concatenation,
             debug_plots,
             exclusion_percentage=exclusion_percentage,
+            story_generation_workers=story_generation_workers,
         )
 
     def train(
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Text, Optional, Union
+from typing import Any, Dict, List, Text, Optional, Union
 
 import aiormq
 
@@ -61,6 +61,20 @@ class EventBroker:
         """Publishes a json-formatted Rasa Core event into an event queue."""
         raise NotImplementedError("Event broker must implement the `publish` method.")
 
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes multiple json-formatted Rasa Core events at once.
+
+        Used by the `BufferedEventBroker`. Publishes the events one by one by default.
+        Event brokers which can publish batches more efficiently should override
+        this. Implementations should raise an exception if publishing failed, so
+        that the events can be published again later.
+
+        Args:
+            events: The events to publish in the order in which they happened.
+        """
+        for event in events:
+            self.publish(event)
+
     def is_ready(self) -> bool:
         """Determine whether or not the event broker is ready.
 
@@ -79,6 +93,17 @@ async def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig], event_loop: Optional[AbstractEventLoop]
 ) -> Optional["EventBroker"]:
     """Instantiate an event broker based on its configuration."""
+    from rasa.core.brokers.buffered import BUFFER_CONFIG_KEY, BufferedEventBroker
+
+    buffer_config = None
+    if endpoint_config is not None and BUFFER_CONFIG_KEY in endpoint_config.kwargs:
+        # the brokers themselves don't know about buffering
+        buffer_config = endpoint_config.kwargs[BUFFER_CONFIG_KEY]
+        broker_type = endpoint_config.type
+        endpoint_config = endpoint_config.copy()
+        endpoint_config.type = broker_type
+        del endpoint_config.kwargs[BUFFER_CONFIG_KEY]
+
     if endpoint_config is None:
         broker = None
     elif endpoint_config.type is None or endpoint_config.type.lower() == "pika":
@@ -103,6 +128,8 @@ async def _create_from_endpoint_config(
 
     if broker:
         logger.debug(f"Instantiated event broker to '{broker.__class__.__name__}'.")
+        if buffer_config:
+            broker = BufferedEventBroker.from_config(broker, buffer_config)
     return broker
 
 
@@ -0,0 +1,441 @@
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Text, Tuple, Union
+
+from rasa.core.brokers.broker import EventBroker
+from rasa.shared.utils.io import DEFAULT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+# key of the event broker configuration which enables buffering
+BUFFER_CONFIG_KEY = "buffer"
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_MAX_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_IN_SECONDS = 0.5
+DEFAULT_RETRY_DELAY_IN_SECONDS = 5
+DEFAULT_CLOSE_TIMEOUT_IN_SECONDS = 30
+
+
+class EventSpool:
+    """Append-only file which keeps events that couldn't be published yet.
+
+    Every line of the file is one JSON serialized event. Replayed events are
+    skipped by remembering the read position, and the file is truncated once all of
+    its events were replayed.
+    """
+
+    def __init__(self, path: Union[Text, Path]) -> None:
+        """Creates the spool.
+
+        Args:
+            path: Path of the spool file. Events which are still in the file (e.g.
+                from a previous run) will be replayed.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._read_position = 0
+        with self.path.open("rb") as spool_file:
+            self._number_of_events = sum(1 for line in spool_file if line.strip())
+
+    def __len__(self) -> int:
+        """Returns the number of events which weren't replayed yet."""
+        return self._number_of_events
+
+    @staticmethod
+    def _serialize(events: List[Dict[Text, Any]]) -> bytes:
+        return "".join(json.dumps(event) + "\n" for event in events).encode(
+            DEFAULT_ENCODING
+        )
+
+    def append(self, events: List[Dict[Text, Any]]) -> None:
+        """Appends events to the end of the spool.
+
+        Args:
+            events: The events to append.
+        """
+        with self._lock:
+            with self.path.open("ab") as spool_file:
+                spool_file.write(self._serialize(events))
+            self._number_of_events += len(events)
+
+    def read(self, max_events: int) -> Tuple[List[Dict[Text, Any]], int]:
+        """Reads the next events which weren't replayed yet.
+
+        Args:
+            max_events: The maximum number of events to read.
+
+        Returns:
+            The events and the position after the events, which has to be passed to
+            `mark_replayed` once the events were published.
+        """
+        events = []
+        with self._lock:
+            with self.path.open("rb") as spool_file:
+                spool_file.seek(self._read_position)
+                while len(events) < max_events:
+                    line = spool_file.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        events.append(json.loads(line.decode(DEFAULT_ENCODING)))
+                    except ValueError:
+                        # e.g. a line which was only partially written before a crash
+                        logger.warning(
+                            f"Skipping invalid line in event spool '{self.path}'."
+                        )
+                        self._number_of_events -= 1
+                return events, spool_file.tell()
+
+    def mark_replayed(self, position: int, number_of_events: int) -> None:
+        """Marks the events up to `position` as replayed.
+
+        Args:
+            position: The position returned by `read`.
+            number_of_events: The number of events which were read.
+        """
+        with self._lock:
+            self._read_position = position
+            self._number_of_events -= number_of_events
+            if self._read_position >= self.path.stat().st_size:
+                # everything was replayed
+                self.path.write_bytes(b"")
+                self._read_position = 0
+                self._number_of_events = 0
+
+    def prepend(self, events: List[Dict[Text, Any]]) -> None:
+        """Puts events in front of all events which weren't replayed yet.
+
+        This rewrites the whole file and should only be used when the broker became
+        unreachable or when shutting down.
+
+        Args:
+            events: The events to prepend.
+        """
+        with self._lock:
+            with self.path.open("rb") as spool_file:
+                spool_file.seek(self._read_position)
+                remaining = spool_file.read()
+            self.path.write_bytes(self._serialize(events) + remaining)
+            self._read_position = 0
+            self._number_of_events += len(events)
+
+
+class BufferedEventBrokerMetrics:
+    """Keeps track of the events which went through a `BufferedEventBroker`."""
+
+    def __init__(self, max_queue_size: int) -> None:
+        """Creates the metrics.
+
+        Args:
+            max_queue_size: The maximum number of events in the in-memory queue.
+        """
+        self.max_queue_size = max_queue_size
+        self.queue_size = 0
+        self.spool_size = 0
+        self.number_of_published_events = 0
+        self.number_of_batches = 0
+        self.number_of_failed_batches = 0
+        self.number_of_spooled_events = 0
+        self.number_of_dropped_events = 0
+
+    @property
+    def queue_fill(self) -> float:
+        """The fraction of the in-memory queue which is used."""
+        return self.queue_size / self.max_queue_size
+
+    def as_dict(self) -> Dict[Text, Union[int, float]]:
+        """Returns the metrics as a dictionary, e.g. for logging them."""
+        return {
+            "queue_size": self.queue_size,
+            "queue_fill": self.queue_fill,
+            "spool_size": self.spool_size,
+            "published_events": self.number_of_published_events,
+            "batches": self.number_of_batches,
+            "failed_batches": self.number_of_failed_batches,
+            "spooled_events": self.number_of_spooled_events,
+            "dropped_events": self.number_of_dropped_events,
+        }
+
+
+class BufferedEventBroker(EventBroker):
+    """Publishes events in batches with another event broker from a background thread.
+
+    `publish` only puts the event into a bounded in-memory queue, so it never blocks
+    the handling of messages. A background thread takes the events from the queue
+    and publishes them in batches with `EventBroker.publish_batch` of the wrapped
+    broker. If the queue is full or the broker is unreachable, events are spilled to
+    an append-only spool file. The spool is replayed once the broker is reachable
+    again (also after a restart). Events are published in the order in which they
+    were passed to `publish`.
+    """
+
+    def __init__(
+        self,
+        broker: EventBroker,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_IN_SECONDS,
+        retry_delay_in_seconds: float = DEFAULT_RETRY_DELAY_IN_SECONDS,
+        spool_path: Optional[Text] = None,
+        close_timeout: float = DEFAULT_CLOSE_TIMEOUT_IN_SECONDS,
+    ) -> None:
+        """Creates the broker.
+
+        Args:
+            broker: The broker which publishes the batches of events.
+            max_queue_size: The maximum number of events in the in-memory queue.
+            max_batch_size: The maximum number of events which are published at once.
+            flush_interval: Maximum time in seconds an event waits for more events to
+                fill its batch.
+            retry_delay_in_seconds: Time in seconds between attempts to publish to an
+                unreachable broker.
+            spool_path: Path of the spool file. If `None`, events are dropped if the
+                in-memory queue is full.
+            close_timeout: Maximum time in seconds to wait for the background
+                thread when closing the broker.
+        """
+        self.broker = broker
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.retry_delay_in_seconds = retry_delay_in_seconds
+        self.close_timeout = close_timeout
+        self.metrics = BufferedEventBrokerMetrics(max_queue_size)
+
+        self._queue: "queue.Queue[Dict[Text, Any]]" = queue.Queue(max_queue_size)
+        self._spool = EventSpool(spool_path) if spool_path else None
+        # events which are being published, they are kept until publishing succeeds
+        self._current_batch: List[Dict[Text, Any]] = []
+
+        # guards switching between the queue and the spool in `publish`
+        self._lock = threading.Lock()
+        # while `True`, new events go to the spool to keep them behind the spooled
+        # events
+        self._spilling = self._spool is not None and len(self._spool) > 0
+        self._update_metrics()
+
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._run,
+            name=f"{broker.__class__.__name__}-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    @classmethod
+    def from_config(
+        cls, broker: EventBroker, buffer_config: Union[Dict[Text, Any], bool]
+    ) -> "BufferedEventBroker":
+        """Creates a buffered broker from the `buffer` key of the broker config.
+
+        Args:
+            broker: The broker which publishes the batches of events.
+            buffer_config: Keyword arguments of the buffered broker or `True` to use
+                the defaults.
+
+        Returns:
+            The buffered broker.
+        """
+        if not isinstance(buffer_config, dict):
+            buffer_config = {}
+        return cls(broker, **buffer_config)
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        """Queues the event for publishing without blocking.
+
+        Args:
+            event: The serialized event.
+        """
+        with self._lock:
+            if not self._spilling:
+                try:
+                    self._queue.put_nowait(event)
+                    self.metrics.queue_size = self._queue.qsize()
+                    return
+                except queue.Full:
+                    if self._spool is None:
+                        self.metrics.number_of_dropped_events += 1
+                        logger.error(
+                            f"Dropped event as the queue of the event broker is full. "
+                            f"Configure a 'spool_path' to keep events in that case."
+                        )
+                        return
+
+                    logger.warning(
+                        f"The queue of the event broker is full. Spilling events "
+                        f"to '{self._spool.path}'."
+                    )
+                    self._spilling = True
+
+            self._spool.append([event])
+            self.metrics.number_of_spooled_events += 1
+            self.metrics.spool_size = len(self._spool)
+
+    def _run(self) -> None:
+        while not self._closed.is_set():
+            if not self._flush():
+                # the broker is unreachable, wait before trying again
+                self._closed.wait(self.retry_delay_in_seconds)
+
+    def _flush(self, wait: bool = True) -> bool:
+        """Publishes the next batch of events.
+
+        The batch which failed before comes first, then the events of the queue and
+        only then the spooled events, as they were published later.
+
+        Args:
+            wait: If `True`, waits `flush_interval` for more events to fill the batch.
+
+        Returns:
+            `False` if publishing the batch failed.
+        """
+        if not self._current_batch:
+            # don't wait while replaying the spool, as the queue stays empty then
+            self._current_batch = self._next_batch(wait and not self._spilling)
+
+        if self._current_batch:
+            if not self._publish_batch(self._current_batch):
+                self._spill_unpublished_events()
+                return False
+            self._current_batch = []
+            return True
+
+        if self._spool is None or not self._spilling:
+            return True
+
+        events, position = self._spool.read(self.max_batch_size)
+        if events and not self._publish_batch(events):
+            return False
+        self._spool.mark_replayed(position, len(events))
+        self.metrics.spool_size = len(self._spool)
+
+        with self._lock:
+            if not len(self._spool) and self._queue.empty():
+                logger.debug("Replayed all spooled events.")
+                self._spilling = False
+        return True
+
+    def _spill_unpublished_events(self) -> None:
+        """Moves the failed batch and the queued events to the spool.
+
+        Keeps the events of an outage on disk instead of in memory, where they'd be
+        lost if Rasa crashed before the broker is reachable again.
+        """
+        if self._spool is None:
+            return
+
+        with self._lock:
+            unpublished = self._current_batch
+            while not self._queue.empty():
+                unpublished += self._next_batch(wait=False)
+            self._current_batch = []
+
+            # these events were published before the events which are in the spool
+            self._spool.prepend(unpublished)
+            self._spilling = True
+
+        self.metrics.number_of_spooled_events += len(unpublished)
+        self.metrics.spool_size = len(self._spool)
+
+    def _next_batch(self, wait: bool) -> List[Dict[Text, Any]]:
+        batch = []
+        deadline = time.monotonic() + (self.flush_interval if wait else 0)
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        self.metrics.queue_size = self._queue.qsize()
+        return batch
+
+    def _publish_batch(self, events: List[Dict[Text, Any]]) -> bool:
+        try:
+            self.broker.publish_batch(events)
+        except Exception as e:
+            self.metrics.number_of_failed_batches += 1
+            logger.error(
+                f"Failed to publish {len(events)} events with "
+                f"'{self.broker.__class__.__name__}'. Retrying in "
+                f"{self.retry_delay_in_seconds} seconds. Error: {e}"
+            )
+            return False
+
+        self.metrics.number_of_batches += 1
+        self.metrics.number_of_published_events += len(events)
+        logger.debug(
+            f"Published a batch of {len(events)} events. Event broker metrics: "
+            f"{self.metrics.as_dict()}."
+        )
+        return True
+
+    def _update_metrics(self) -> None:
+        self.metrics.queue_size = self._queue.qsize()
+        self.metrics.spool_size = len(self._spool) if self._spool else 0
+
+    def is_ready(self) -> bool:
+        """Returns whether the wrapped broker is ready."""
+        return self.broker.is_ready()
+
+    def _has_unpublished_events(self) -> bool:
+        return bool(
+            self._current_batch
+            or not self._queue.empty()
+            or (self._spilling and len(self._spool))
+        )
+
+    def _flush_on_close(self) -> None:
+        self._closed.set()
+        self._flusher.join(self.close_timeout)
+
+        # try once more to publish everything which is left
+        while self._has_unpublished_events() and self._flush(wait=False):
+            pass
+
+        unpublished = self._current_batch
+        while not self._queue.empty():
+            unpublished += self._next_batch(wait=False)
+        self._current_batch = []
+
+        if not unpublished:
+            return
+
+        if self._spool is not None:
+            # the spool only contains events which were published later
+            self._spool.prepend(unpublished)
+            logger.warning(
+                f"Kept {len(unpublished)} unpublished events in '{self._spool.path}'. "
+                f"They will be published when Rasa is started again."
+            )
+        else:
+            self.metrics.number_of_dropped_events += len(unpublished)
+            logger.error(
+                f"Dropped {len(unpublished)} events which couldn't be published "
+                f"before the event broker was closed."
+            )
+
+    async def close(self) -> None:
+        """Publishes the remaining events and closes the wrapped broker."""
+        # the wrapped broker might publish on the event loop (e.g. the
+        # `PikaEventBroker`), hence the remaining events can't be published from it
+        await asyncio.get_event_loop().run_in_executor(None, self._flush_on_close)
+
+        if asyncio.iscoroutinefunction(self.broker.close):
+            await self.broker.close()
+        else:
+            self.broker.close()
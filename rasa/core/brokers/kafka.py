@@ -1,13 +1,16 @@
 import json
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Text, List, Optional, Union, Dict
+from typing import Any, Text, List, Optional, Union, Dict, TYPE_CHECKING
 import time
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.endpoints import EndpointConfig
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import ConnectionException, RasaException
+
+if TYPE_CHECKING:
+    from kafka.producer.future import FutureRecordMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,8 @@ class KafkaEventBroker(EventBroker):
         ssl_check_hostname: bool = False,
         security_protocol: Text = "SASL_PLAINTEXT",
         loglevel: Union[int, Text] = logging.ERROR,
+        compression_type: Optional[Text] = None,
+        send_timeout_in_seconds: float = 30,
         **kwargs: Any,
     ) -> None:
         """Kafka event broker.
@@ -68,6 +73,10 @@ class KafkaEventBroker(EventBroker):
             security_protocol: Protocol used to communicate with brokers.
                 Valid values are: PLAINTEXT, SSL, SASL_PLAINTEXT, SASL_SSL.
             loglevel: Logging level of the kafka logger.
+            compression_type: Compression of the batches of events which are sent
+                to Kafka. Valid values are: gzip, snappy, lz4, zstd or `None`.
+            send_timeout_in_seconds: Maximum time in seconds to wait for Kafka to
+                acknowledge a batch of events published with `publish_batch`.
 
         """
         import kafka
@@ -85,6 +94,8 @@ class KafkaEventBroker(EventBroker):
         self.ssl_certfile = ssl_certfile
         self.ssl_keyfile = ssl_keyfile
         self.ssl_check_hostname = ssl_check_hostname
+        self.compression_type = compression_type
+        self.send_timeout_in_seconds = send_timeout_in_seconds
 
         logging.getLogger("kafka").setLevel(loglevel)
 
@@ -138,6 +149,31 @@ class KafkaEventBroker(EventBroker):
 
         logger.error("Failed to publish Kafka event.")
 
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes events and waits until Kafka acknowledged all of them.
+
+        In contrast to `publish`, a failure is not retried but raised, so that the
+        caller can publish the events again later.
+
+        Args:
+            events: The events to publish.
+
+        Raises:
+            `ConnectionException` if Kafka can't be reached.
+        """
+        if self.producer is None:
+            self._create_producer()
+        if not self.producer.bootstrap_connected():
+            self._close()
+            self.producer = None
+            raise ConnectionException(f"Cannot connect to kafka url '{self.url}'.")
+
+        futures = [self._publish(event) for event in events]
+        self.producer.flush(timeout=self.send_timeout_in_seconds)
+        for future in futures:
+            # raises if sending the event failed
+            future.get(timeout=0)
+
     def _create_producer(self) -> None:
         import kafka
 
@@ -182,6 +218,7 @@ class KafkaEventBroker(EventBroker):
                 client_id=self.client_id,
                 bootstrap_servers=self.url,
                 value_serializer=lambda v: json.dumps(v).encode(DEFAULT_ENCODING),
+                compression_type=self.compression_type,
                 **authentication_params,
             )
         except AssertionError as e:
@@ -189,7 +226,7 @@ class KafkaEventBroker(EventBroker):
                 f"Cannot initialise `KafkaEventBroker`: {e}"
             )
 
-    def _publish(self, event: Dict[Text, Any]) -> None:
+    def _publish(self, event: Dict[Text, Any]) -> "FutureRecordMetadata":
         if self.partition_by_sender:
             partition_key = bytes(event.get("sender_id"), encoding=DEFAULT_ENCODING)
         else:
@@ -198,7 +235,7 @@ class KafkaEventBroker(EventBroker):
         logger.debug(
             f"Calling kafka send({self.topic}, value={event}, key={partition_key!s})"
         )
-        self.producer.send(self.topic, value=event, key=partition_key)
+        return self.producer.send(self.topic, value=event, key=partition_key)
 
     def _close(self) -> None:
         self.producer.close()
@@ -10,7 +10,7 @@ from typing import Deque, Dict, Optional, Text, Union, Any, List, Tuple
 import aio_pika
 
 from rasa.constants import DEFAULT_LOG_LEVEL_LIBRARIES, ENV_LOG_LEVEL_LIBRARIES
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import ConnectionException, RasaException
 from rasa.shared.constants import DOCS_URL_PIKA_EVENT_BROKER
 from rasa.core.brokers.broker import EventBroker
 import rasa.shared.utils.io
@@ -259,7 +259,39 @@ class PikaEventBroker(EventBroker):
                 can be retrieved in the consumer from the `headers` attribute of the
                 message's `BasicProperties`.
         """
-        self._loop.create_task(self._publish(event, headers))
+        # `publish` might be called from a thread of an executor (e.g. if a tracker
+        # store is saved by `AsyncTrackerStore`)
+        asyncio.run_coroutine_threadsafe(self._publish(event, headers), self._loop)
+
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Publishes events and waits until RabbitMQ received all of them.
+
+        Has to be called from a different thread than the one running the event loop
+        of the broker (e.g. from the thread of the `BufferedEventBroker`).
+
+        Args:
+            events: The events to publish.
+
+        Raises:
+            `ConnectionException` if there is no connection to RabbitMQ.
+        """
+        asyncio.run_coroutine_threadsafe(
+            self._publish_batch(events), self._loop
+        ).result()
+
+    async def _publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        if self._exchange is None or not self.is_ready():
+            raise ConnectionException(
+                f"Cannot publish events as there is no connection to '{self.host}'."
+            )
+
+        await asyncio.gather(
+            *[self._exchange.publish(self._message(event, None), "") for event in events]
+        )
+        logger.debug(
+            f"Published {len(events)} Pika events to exchange '{self.exchange_name}' "
+            f"on host '{self.host}'."
+        )
 
     async def _publish(
         self, event: Dict[Text, Any], headers: Optional[Dict[Text, Text]] = None
@@ -2,21 +2,28 @@ import contextlib
 import json
 import logging
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, Optional, Text, Generator
+from typing import Any, Dict, Generator, List, Optional, Text, Union, TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
 from rasa.core.brokers.broker import EventBroker
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine.url import URL
+
 logger = logging.getLogger(__name__)
 
+# SQLite allows at most 999 bound parameters per statement in older versions,
+# every row of the `events` table binds two
+MAX_ROWS_PER_INSERT = 400
+
 
 class SQLEventBroker(EventBroker):
     """Save events into an SQL database.
 
-    All events will be stored in a table called `events`.
-
+    All events will be stored in a table called `events`. Configure a `buffer` for
+    the event broker to insert the events in batches instead of one by one.
     """
 
     from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
@@ -51,10 +58,38 @@ class SQLEventBroker(EventBroker):
 
         logger.debug(f"SQLEventBroker: Connecting to database: '{engine_url}'.")
 
-        self.engine = sqlalchemy.create_engine(engine_url)
+        self.engine = sqlalchemy.create_engine(
+            engine_url, **self._create_engine_kwargs(engine_url)
+        )
         self.Base.metadata.create_all(self.engine)
         self.sessionmaker = sqlalchemy.orm.sessionmaker(bind=self.engine)
 
+    @staticmethod
+    def _create_engine_kwargs(engine_url: Union[Text, "URL"]) -> Dict[Text, Any]:
+        from rasa.core.tracker_store import create_engine_kwargs
+        from sqlalchemy.engine.url import make_url
+        from sqlalchemy.pool import StaticPool
+
+        url = make_url(engine_url)
+        if url.drivername == "sqlite" and url.database in (
+            None,
+            "",
+            ":memory:",
+        ):
+            # batches might be inserted from another thread, which has to use the
+            # same connection as otherwise it wouldn't see the in-memory database
+            return {
+                "connect_args": {"check_same_thread": False},
+                "poolclass": StaticPool,
+            }
+
+        # use a connection pool of the same size as the `SQLTrackerStore` for
+        # PostgreSQL. The events are still written to the default schema though.
+        kwargs = create_engine_kwargs(engine_url)
+        return {
+            key: kwargs[key] for key in ["pool_size", "max_overflow"] if key in kwargs
+        }
+
     @classmethod
     async def from_endpoint_config(
         cls,
@@ -82,3 +117,27 @@ class SQLEventBroker(EventBroker):
                 )
             )
             session.commit()
+
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        """Inserts the events with multi-row inserts in a single transaction.
+
+        Args:
+            events: The events to insert in the order in which they happened.
+        """
+        rows = [
+            {"sender_id": event.get("sender_id"), "data": json.dumps(event)}
+            for event in events
+        ]
+        table = self.SQLBrokerEvent.__table__
+
+        with self.engine.begin() as connection:
+            # the ids are assigned in insertion order, which keeps the order of
+            # the events of each conversation
+            for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+                connection.execute(
+                    table.insert().values(rows[start : start + MAX_ROWS_PER_INSERT])
+                )
+
+    async def close(self) -> None:
+        """Closes the connections of the connection pool."""
+        self.engine.dispose()
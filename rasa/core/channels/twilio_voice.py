@@ -8,6 +8,7 @@ import rasa.utils.io
 import rasa.shared.utils.io
 from rasa.shared.core.events import BotUttered
 from rasa.shared.exceptions import InvalidConfigException
+from rasa.core.tracker_store import AsyncTrackerStore
 from rasa.core.channels.channel import (
     InputChannel,
     CollectingOutputChannel,
@@ -248,7 +249,9 @@ class TwilioVoiceInput(InputChannel):
             # If the user doesn't respond resend the last message.
             else:
                 # Get last user utterance from tracker.
-                tracker = request.app.agent.tracker_store.retrieve(sender_id)
+                tracker = await AsyncTrackerStore(
+                    request.app.agent.tracker_store
+                ).retrieve(sender_id)
                 last_response = None
                 if tracker:
                     last_response = next(
@@ -4,6 +4,7 @@ from typing import Optional, Text, List, Dict, Union, Tuple, Any, TYPE_CHECKING
 
 import rasa.shared.utils.io
 import rasa.shared.utils.cli
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.core.constants import (
     DEFAULT_NLU_FALLBACK_THRESHOLD,
     DEFAULT_CORE_FALLBACK_THRESHOLD,
@@ -22,6 +23,8 @@ import rasa.utils.io
 from rasa.shared.constants import (
     DEFAULT_NLU_FALLBACK_INTENT_NAME,
     LATEST_TRAINING_DATA_FORMAT_VERSION,
+    CONFIG_KEY_DATA,
+    CONFIG_KEY_STORY_GENERATION_WORKERS,
 )
 from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
     YAMLStoryReader,
@@ -49,6 +52,43 @@ def load(config_file: Union[Text, Dict]) -> List["Policy"]:
     return PolicyEnsemble.from_dict(config_data)
 
 
+def load_data_generation_arguments(config_file: Union[Text, Dict]) -> Dict[Text, Any]:
+    """Load the options for the generation of training data from the `data` section.
+
+    Args:
+        config_file: The model configuration or the path to it.
+
+    Returns:
+        Keyword arguments for `Agent.load_data`.
+    """
+    config_data = {}
+    if isinstance(config_file, str) and os.path.isfile(config_file):
+        config_data = rasa.shared.utils.io.read_model_configuration(config_file)
+    elif isinstance(config_file, Dict):
+        config_data = config_file
+
+    # `data` is not part of the config schema as existing configs might contain an
+    # empty `data` key
+    data_config = config_data.get(CONFIG_KEY_DATA) or {}
+    if not isinstance(data_config, dict):
+        raise InvalidConfigException(
+            f"The '{CONFIG_KEY_DATA}' section of the model configuration has to be a "
+            f"mapping of options."
+        )
+
+    arguments = {}
+    workers = data_config.get(CONFIG_KEY_STORY_GENERATION_WORKERS)
+    if workers is not None:
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+            raise InvalidConfigException(
+                f"'{CONFIG_KEY_STORY_GENERATION_WORKERS}' has to be a positive "
+                f"integer, but it is '{workers}'."
+            )
+        arguments["story_generation_workers"] = workers
+
+    return arguments
+
+
 def migrate_fallback_policies(config: Dict) -> Tuple[Dict, Optional["StoryStep"]]:
     """Migrate the deprecated fallback policies to their `RulePolicy` counterpart.
 
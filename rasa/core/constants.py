@@ -69,3 +69,19 @@ REPORT_STORIES_FILE = "story_report.json"
 FAILED_STORIES_FILE = "failed_test_stories.yml"
 SUCCESSFUL_STORIES_FILE = "successful_test_stories.yml"
 STORIES_WITH_WARNINGS_FILE = "stories_with_warnings.yml"
+
+# Names of the environment variables configuring where and how the NLU pipeline of
+# a `RasaNLUInterpreter` runs when messages are parsed
+NLU_INFERENCE_EXECUTOR = "NLU_INFERENCE_EXECUTOR"
+NLU_INFERENCE_WORKERS = "NLU_INFERENCE_WORKERS"
+NLU_INFERENCE_MAX_BATCH_SIZE = "NLU_INFERENCE_MAX_BATCH_SIZE"
+NLU_INFERENCE_MAX_WAIT_TIME = "NLU_INFERENCE_MAX_WAIT_TIME"
+
+NLU_INFERENCE_EXECUTOR_NONE = "none"
+NLU_INFERENCE_EXECUTOR_THREAD = "thread"
+NLU_INFERENCE_EXECUTOR_PROCESS = "process"
+DEFAULT_NLU_INFERENCE_EXECUTOR = NLU_INFERENCE_EXECUTOR_THREAD
+DEFAULT_NLU_INFERENCE_WORKERS = 1
+# a batch size of 1 disables micro-batching of parse requests
+DEFAULT_NLU_INFERENCE_MAX_BATCH_SIZE = 1
+DEFAULT_NLU_INFERENCE_MAX_WAIT_TIME = 0.005  # in seconds
@@ -1,8 +1,9 @@
 import logging
+import threading
 import numpy as np
 import scipy.sparse
-from typing import List, Optional, Dict, Text, Set, Any
-from collections import defaultdict
+from typing import List, Optional, Dict, Text, Set, Any, Hashable
+from collections import defaultdict, OrderedDict
 
 import rasa.shared.utils.io
 from rasa.nlu.extractors.extractor import EntityTagSpec
@@ -30,6 +31,77 @@ from rasa.utils.tensorflow import model_data_utils
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _SubStateFeaturesCache:
+    """Least recently used cache of the features of sub states.
+
+    Trackers share most of their sub states (e.g. the same intents and actions), so
+    the NLU pipeline only has to featurize every distinct sub state once. The
+    cached features are only valid for the interpreter which created them. The
+    cache is cleared if a different interpreter is used.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._interpreter: Optional[Any] = None
+        self._features: "OrderedDict[Hashable, Dict[Text, List[Features]]]" = (
+            OrderedDict()
+        )
+        # predictions of multiple conversations might run in separate threads
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _interpreter_key(interpreter: NaturalLanguageInterpreter) -> Any:
+        # `RegexInterpreter`s don't have any state, hence they all create the
+        # same features
+        if type(interpreter) is RegexInterpreter:
+            return RegexInterpreter
+        return interpreter
+
+    def get(
+        self, key: Hashable, interpreter: NaturalLanguageInterpreter
+    ) -> Optional[Dict[Text, List[Features]]]:
+        with self._lock:
+            if self._interpreter is not self._interpreter_key(interpreter):
+                return None
+
+            features = self._features.get(key)
+            if features is not None:
+                self._features.move_to_end(key)
+            return features
+
+    def set(
+        self,
+        key: Hashable,
+        interpreter: NaturalLanguageInterpreter,
+        features: Dict[Text, List[Features]],
+    ) -> None:
+        with self._lock:
+            interpreter_key = self._interpreter_key(interpreter)
+            if self._interpreter is not interpreter_key:
+                self._features.clear()
+                self._interpreter = interpreter_key
+
+            self._features[key] = features
+            if len(self._features) > self.max_size:
+                self._features.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._features.clear()
+            self._interpreter = None
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+
 class SingleStateFeaturizer:
     """Base class to transform the dialogue state into an ML format.
 
@@ -40,6 +112,9 @@ class SingleStateFeaturizer:
     featurized into a list of `rasa.utils.features.Features`.
     """
 
+    # maximum number of sub states whose features are cached
+    MAX_CACHED_SUB_STATES = 10_000
+
     def __init__(self) -> None:
         """Initialize the single state featurizer."""
         # rasa core can be trained separately, therefore interpreter during training
@@ -50,6 +125,23 @@ class SingleStateFeaturizer:
         self._default_feature_states = {}
         self.action_texts = []
         self.entity_tag_specs = []
+        self._sub_state_features_cache = _SubStateFeaturesCache(
+            self.MAX_CACHED_SUB_STATES
+        )
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # the cached features are not persisted with the featurizer
+        state = self.__dict__.copy()
+        state.pop("_sub_state_features_cache", None)
+        return state
+
+    def _features_cache(self) -> _SubStateFeaturesCache:
+        # loaded featurizers don't have a cache yet
+        if getattr(self, "_sub_state_features_cache", None) is None:
+            self._sub_state_features_cache = _SubStateFeaturesCache(
+                self.MAX_CACHED_SUB_STATES
+            )
+        return self._sub_state_features_cache
 
     def _create_entity_tag_specs(
         self, bilou_tagging: bool = False
@@ -125,6 +217,8 @@ class SingleStateFeaturizer:
         self._default_feature_states[ACTIVE_LOOP] = convert_to_dict(domain.form_names)
         self.action_texts = domain.action_texts
         self.entity_tag_specs = self._create_entity_tag_specs(bilou_tagging)
+        # the cached features were created for the previous feature states
+        self._features_cache().clear()
 
     def _state_features_for_attribute(
         self, sub_state: SubState, attribute: Text
@@ -240,6 +334,24 @@ class SingleStateFeaturizer:
         ):
             interpreter = RegexInterpreter()
 
+        cache_key = (_freeze(sub_state), sparse)
+        cache = self._features_cache()
+        cached_features = cache.get(cache_key, interpreter)
+        if cached_features is None:
+            cached_features = self._featurize_sub_state(sub_state, interpreter, sparse)
+            cache.set(cache_key, interpreter, cached_features)
+
+        # states share the `Features`, but not the lists containing them
+        return {
+            attribute: list(features) for attribute, features in cached_features.items()
+        }
+
+    def _featurize_sub_state(
+        self,
+        sub_state: SubState,
+        interpreter: NaturalLanguageInterpreter,
+        sparse: bool = False,
+    ) -> Dict[Text, List[Features]]:
         message = Message(data=sub_state)
         # remove entities from possible attributes
         attributes = set(
@@ -260,7 +372,7 @@ class SingleStateFeaturizer:
                 sub_state, name_attribute, sparse
             )
 
-        return output
+        return dict(output)
 
     def encode_state(
         self, state: State, interpreter: NaturalLanguageInterpreter
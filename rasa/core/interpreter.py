@@ -1,9 +1,12 @@
 import aiohttp
-
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import functools
 import logging
+import multiprocessing
 
 import os
-from typing import Text, Dict, Any, Union, Optional
+from typing import Text, Dict, Any, List, Union, Optional, TYPE_CHECKING
 
 from rasa.core import constants
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -12,8 +15,12 @@ import rasa.shared.utils.io
 import rasa.shared.utils.common
 import rasa.shared.nlu.interpreter
 from rasa.shared.nlu.training_data.message import Message
+from rasa.utils.batching import MicroBatcher
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from rasa.nlu.model import Interpreter
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,11 +125,76 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         model_directory: Text,
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        inference_executor: Optional[Text] = None,
+        inference_workers: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        max_wait_time_in_seconds: Optional[float] = None,
     ):
+        """Creates an interpreter which parses messages with a trained NLU model.
+
+        Args:
+            model_directory: Directory containing the trained NLU model.
+            config_file: Path to the NLU model configuration.
+            lazy_init: If `True` the model is only loaded on the first use.
+            inference_executor: Where messages are parsed. `thread` and `process`
+                run the NLU pipeline in a pool so that it doesn't block the event
+                loop, `none` runs it on the event loop. Defaults to the value of
+                the environment variable `NLU_INFERENCE_EXECUTOR` or `thread`.
+            inference_workers: Number of threads / processes in the pool.
+            max_batch_size: Maximum number of concurrently received messages which
+                are sent through the NLU pipeline together. `1` disables batching.
+            max_wait_time_in_seconds: How long a message waits for other messages
+                to join its batch.
+        """
         self.model_directory = model_directory
         self.lazy_init = lazy_init
         self.config_file = config_file
 
+        self.inference_executor = (
+            inference_executor
+            or os.environ.get(
+                constants.NLU_INFERENCE_EXECUTOR,
+                constants.DEFAULT_NLU_INFERENCE_EXECUTOR,
+            )
+        ).lower()
+        if self.inference_executor not in (
+            constants.NLU_INFERENCE_EXECUTOR_NONE,
+            constants.NLU_INFERENCE_EXECUTOR_THREAD,
+            constants.NLU_INFERENCE_EXECUTOR_PROCESS,
+        ):
+            raise ValueError(
+                f"Unknown NLU inference executor '{self.inference_executor}'. "
+                f"Please use one of '{constants.NLU_INFERENCE_EXECUTOR_NONE}', "
+                f"'{constants.NLU_INFERENCE_EXECUTOR_THREAD}' or "
+                f"'{constants.NLU_INFERENCE_EXECUTOR_PROCESS}'."
+            )
+        self.inference_workers = inference_workers or int(
+            os.environ.get(
+                constants.NLU_INFERENCE_WORKERS, constants.DEFAULT_NLU_INFERENCE_WORKERS
+            )
+        )
+
+        max_batch_size = max_batch_size or int(
+            os.environ.get(
+                constants.NLU_INFERENCE_MAX_BATCH_SIZE,
+                constants.DEFAULT_NLU_INFERENCE_MAX_BATCH_SIZE,
+            )
+        )
+        if max_wait_time_in_seconds is None:
+            max_wait_time_in_seconds = float(
+                os.environ.get(
+                    constants.NLU_INFERENCE_MAX_WAIT_TIME,
+                    constants.DEFAULT_NLU_INFERENCE_MAX_WAIT_TIME,
+                )
+            )
+
+        self._executor: Optional[Executor] = None
+        self._batcher: Optional[MicroBatcher] = None
+        if max_batch_size > 1:
+            self._batcher = MicroBatcher(
+                self._parse_batch, max_batch_size, max_wait_time_in_seconds
+            )
+
         if not lazy_init:
             self._load_interpreter()
         else:
@@ -142,9 +214,72 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         if self.lazy_init and self.interpreter is None:
             self._load_interpreter()
 
-        result = self.interpreter.parse(text)
+        if self._batcher:
+            return await self._batcher.submit(text)
 
-        return result
+        if self.inference_executor == constants.NLU_INFERENCE_EXECUTOR_NONE:
+            return self.interpreter.parse(text)
+
+        results = await self._parse_batch([text])
+        return results[0]
+
+    async def parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        """Parses multiple text messages with the batched NLU pipeline.
+
+        In contrast to `parse`, the texts are always parsed off the event loop, even
+        if no inference executor was configured, as parsing many texts takes a while.
+
+        Args:
+            texts: The texts to parse.
+
+        Returns:
+            The parse results in the same order as the texts.
+        """
+        if self.lazy_init and self.interpreter is None:
+            self._load_interpreter()
+
+        if self.inference_executor == constants.NLU_INFERENCE_EXECUTOR_NONE:
+            return await asyncio.get_event_loop().run_in_executor(
+                None, _parse_texts, self.interpreter, texts
+            )
+
+        return await self._parse_batch(texts)
+
+    async def _parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        if self.inference_executor == constants.NLU_INFERENCE_EXECUTOR_NONE:
+            return _parse_texts(self.interpreter, texts)
+
+        if self.inference_executor == constants.NLU_INFERENCE_EXECUTOR_PROCESS:
+            parse = functools.partial(_parse_texts_in_worker_process, texts)
+        else:
+            parse = functools.partial(_parse_texts, self.interpreter, texts)
+
+        return await asyncio.get_event_loop().run_in_executor(
+            self._get_executor(), parse
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.inference_executor == constants.NLU_INFERENCE_EXECUTOR_PROCESS:
+                # every worker process loads its own copy of the model. The
+                # processes are spawned as the TensorFlow runtime can't be forked.
+                self._executor = ProcessPoolExecutor(
+                    self.inference_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_load_worker_process_interpreter,
+                    initargs=(self.model_directory,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.inference_workers, thread_name_prefix="nlu-inference"
+                )
+        return self._executor
+
+    def close(self) -> None:
+        """Shuts down the pool which runs the NLU pipeline (if one was started)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def featurize_message(self, message: Message) -> Optional[Message]:
         """Featurize message using a trained NLU pipeline.
@@ -165,6 +300,27 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         self.interpreter = Interpreter.load(self.model_directory)
 
 
+def _parse_texts(
+    interpreter: "Interpreter", texts: List[Text]
+) -> List[Dict[Text, Any]]:
+    return interpreter.parse_batch(texts)
+
+
+# the interpreter of a worker process in case the NLU pipeline runs in a process pool
+_worker_process_interpreter: Optional["Interpreter"] = None
+
+
+def _load_worker_process_interpreter(model_directory: Text) -> None:
+    from rasa.nlu.model import Interpreter
+
+    global _worker_process_interpreter
+    _worker_process_interpreter = Interpreter.load(model_directory)
+
+
+def _parse_texts_in_worker_process(texts: List[Text]) -> List[Dict[Text, Any]]:
+    return _parse_texts(_worker_process_interpreter, texts)
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig],
 ) -> rasa.shared.nlu.interpreter.NaturalLanguageInterpreter:
@@ -5,6 +5,7 @@ import math
 import os
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Text, Optional, Any, List, Dict, Tuple, Type, Union, Callable
@@ -71,6 +72,49 @@ class PolicyEnsemble:
 
         self._set_rule_only_data()
 
+        self._prediction_executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def prediction_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Returns the executor which predictions of the ensemble should run in.
+
+        Policies with an inference queue gather the predictions of concurrent
+        conversations into batches. This only works if the predictions don't block
+        each other, hence they have to run in separate threads.
+
+        Returns:
+            The executor or `None` if no policy batches its predictions or the
+            ensemble was closed.
+        """
+        if self._closed:
+            return None
+
+        batch_sizes = [
+            policy.inference_queue.max_batch_size
+            for policy in self.policies
+            if getattr(policy, "inference_queue", None) is not None
+        ]
+        if not batch_sizes:
+            return None
+
+        if self._prediction_executor is None:
+            # allow enough concurrent predictions to fill the next batch while the
+            # current one is predicted
+            self._prediction_executor = ThreadPoolExecutor(
+                max_workers=2 * max(batch_sizes), thread_name_prefix="prediction"
+            )
+        return self._prediction_executor
+
+    def close(self) -> None:
+        """Releases the resources of the policies and the prediction executor."""
+        self._closed = True
+        for policy in self.policies:
+            policy.close()
+
+        if self._prediction_executor is not None:
+            self._prediction_executor.shutdown(wait=False)
+            self._prediction_executor = None
+
     def _set_rule_only_data(self) -> None:
         rule_only_data = {}
         for policy in self.policies:
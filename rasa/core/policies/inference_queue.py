@@ -0,0 +1,180 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Text, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceQueueMetrics:
+    """Keeps track of how well an `InferenceQueue` fills its batches."""
+
+    def __init__(self, max_batch_size: int) -> None:
+        """Creates the metrics.
+
+        Args:
+            max_batch_size: The maximum size of a batch.
+        """
+        self.max_batch_size = max_batch_size
+        self.number_of_batches = 0
+        self.number_of_predictions = 0
+
+    def record_batch(self, batch_size: int) -> None:
+        """Records a batch which was predicted.
+
+        Args:
+            batch_size: The number of predictions in the batch.
+        """
+        self.number_of_batches += 1
+        self.number_of_predictions += batch_size
+
+    @property
+    def average_batch_size(self) -> float:
+        """The average number of predictions per batch."""
+        if not self.number_of_batches:
+            return 0.0
+        return self.number_of_predictions / self.number_of_batches
+
+    @property
+    def average_batch_fill(self) -> float:
+        """The average fraction of the maximum batch size which batches used."""
+        return self.average_batch_size / self.max_batch_size
+
+
+class InferenceQueue:
+    """Gathers concurrent predictions of a policy into batches.
+
+    Callers block in `predict` until their result is available. A worker thread
+    collects the pending predictions until either the maximum batch size is reached
+    or the first prediction of the batch waited for the maximum wait time. Then all
+    predictions of the batch are run at once and the results are handed back to the
+    callers.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int,
+        max_wait: float,
+        name: Text = "inference-queue",
+    ) -> None:
+        """Creates the queue.
+
+        Args:
+            predict_batch: Function which predicts a batch of inputs. It has to
+                return one result per input in the same order.
+            max_batch_size: The maximum number of predictions in one batch.
+            max_wait: The maximum time in seconds which a prediction waits for more
+                predictions to fill its batch.
+            name: The name of the worker thread.
+        """
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.name = name
+        self.metrics = InferenceQueueMetrics(max_batch_size)
+
+        # `None` tells the worker to stop
+        self._pending: "queue.Queue[Optional[Tuple[Any, Future]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._closed = False
+
+    def predict(self, inputs: Any) -> Any:
+        """Predicts the inputs as part of the next batch.
+
+        Once the queue was closed, the inputs are predicted on their own.
+
+        Args:
+            inputs: The inputs of a single prediction.
+
+        Returns:
+            The result of the prediction.
+        """
+        future = Future()
+        with self._worker_lock:
+            # nothing is queued behind the stop signal of `close`
+            queued = not self._closed
+            if queued:
+                self._start_worker()
+                self._pending.put((inputs, future))
+
+        if not queued:
+            return self.predict_batch([inputs])[0]
+        return future.result()
+
+    def _start_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._worker.start()
+
+    def close(self) -> None:
+        """Stops the worker once it predicted the pending predictions.
+
+        The worker references the policy through `predict_batch`, so the policy can
+        only be freed once the queue is closed.
+        """
+        with self._worker_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._worker is not None:
+                self._pending.put(None)
+                self._worker = None
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                self._predict(batch)
+            if stop:
+                return
+
+    def _next_batch(self) -> Tuple[List[Tuple[Any, Future]], bool]:
+        """Collects the next batch.
+
+        Returns:
+            The batch and whether the worker should stop after predicting it.
+        """
+        first = self._pending.get()
+        if first is None:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._pending.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _predict(self, batch: List[Tuple[Any, Future]]) -> None:
+        try:
+            results = self.predict_batch([inputs for inputs, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+        self.metrics.record_batch(len(batch))
+        logger.debug(
+            f"'{self.name}' predicted a batch of {len(batch)} / "
+            f"{self.max_batch_size} predictions (average batch fill: "
+            f"{self.metrics.average_batch_fill:.2f})."
+        )
@@ -310,6 +310,13 @@ class Policy:
         """
         raise NotImplementedError("Policy must have the capacity to predict.")
 
+    def close(self) -> None:
+        """Releases the resources of the policy (e.g. background threads).
+
+        Called when the model is replaced or the server shuts down.
+        """
+        pass
+
     def _prediction(
         self,
         probabilities: List[float],
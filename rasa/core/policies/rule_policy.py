@@ -1,4 +1,3 @@
-import functools
 import logging
 from typing import Any, List, Dict, Text, Optional, Set, Tuple, TYPE_CHECKING
 
@@ -44,9 +43,10 @@ from rasa.shared.core.constants import (
     ACTIVE_LOOP,
     RULE_ONLY_SLOTS,
     RULE_ONLY_LOOPS,
+    USER,
 )
 from rasa.shared.core.domain import InvalidDomain, State, Domain
-from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT, INTENT_NAME_KEY
 import rasa.core.test
 import rasa.core.training.training
 
@@ -89,6 +89,92 @@ class InvalidRule(RasaException):
         )
 
 
+class _RuleIndex:
+    """Index of the rules in a lookup keyed on the last state of each rule.
+
+    A rule can only be applicable if its last state matches the current
+    conversation state. The index groups the rules by the previous action, the
+    intent and the active loop of their last state, so that only the rules which
+    can match the current conversation state have to be checked in full.
+    """
+
+    # (sub state, attribute) pairs of the last rule state which the index uses
+    INDEXED_ATTRIBUTES = (
+        (PREVIOUS_ACTION, ACTION_NAME),
+        (USER, INTENT),
+        (ACTIVE_LOOP, LOOP_NAME),
+    )
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        """Compiles the index.
+
+        Args:
+            lookup: Lookup which maps the rule keys to the predicted actions.
+        """
+        self.lookup = lookup
+        self.size = len(lookup)
+        # the rule states are stored from the most recent to the oldest state
+        self.reversed_rule_states: Dict[Text, List[State]] = {}
+
+        # rules without a state and rules which start the conversation
+        self._rules_without_state: List[Text] = []
+        self._conversation_start_rules: List[Text] = []
+        self._rules_by_attributes: Dict[Tuple, List[Text]] = defaultdict(list)
+
+        for rule_key in lookup:
+            reversed_states = list(reversed(json.loads(rule_key)))
+            self.reversed_rule_states[rule_key] = reversed_states
+
+            if not reversed_states:
+                self._rules_without_state.append(rule_key)
+            elif not reversed_states[0].get(PREVIOUS_ACTION):
+                self._conversation_start_rules.append(rule_key)
+            else:
+                self._rules_by_attributes[
+                    self._rule_attributes(reversed_states[0])
+                ].append(rule_key)
+
+    @classmethod
+    def _rule_attributes(cls, rule_state: State) -> Tuple:
+        attributes = []
+        for state_type, attribute in cls.INDEXED_ATTRIBUTES:
+            value = rule_state.get(state_type, {}).get(attribute)
+            if isinstance(value, list):
+                # json dumps and loads tuples as lists
+                value = tuple(value)
+            if not value or value == SHOULD_NOT_BE_SET:
+                # rule doesn't require a specific value, `None` matches any value
+                value = None
+            attributes.append(value)
+        return tuple(attributes)
+
+    def candidates(self, conversation_state: State) -> List[Text]:
+        """Returns the rules whose last state can match the conversation state.
+
+        Args:
+            conversation_state: The current state of the conversation.
+
+        Returns:
+            Keys of the rules which have to be checked for the conversation.
+        """
+        candidates = list(self._rules_without_state)
+        if not conversation_state.get(PREVIOUS_ACTION):
+            return candidates + self._conversation_start_rules
+
+        # every indexed attribute either matches the value in the conversation
+        # state or isn't specified by the rule
+        keys = [()]
+        for state_type, attribute in self.INDEXED_ATTRIBUTES:
+            value = conversation_state.get(state_type, {}).get(attribute)
+            options = (value, None) if value else (None,)
+            keys = [key + (option,) for key in keys for option in options]
+
+        for key in keys:
+            candidates.extend(self._rules_by_attributes.get(key, []))
+
+        return [key for key in candidates if key in self.lookup]
+
+
 class RulePolicy(MemoizationPolicy):
     """Policy which handles all the rules"""
 
@@ -146,6 +232,7 @@ class RulePolicy(MemoizationPolicy):
         self._check_for_contradictions = check_for_contradictions
 
         self._rules_sources = defaultdict(list)
+        self._rule_indices: Dict[Text, _RuleIndex] = {}
 
         # max history is set to `None` in order to capture any lengths of rule stories
         super().__init__(
@@ -832,29 +919,23 @@ class RulePolicy(MemoizationPolicy):
 
         return True
 
-    @staticmethod
-    # This function is called a lot (e.g. for checking contradictions) so we cache
-    # its results.
-    @functools.lru_cache(maxsize=1000)
-    def _rule_key_to_state(rule_key: Text) -> List[State]:
-        return json.loads(rule_key)
-
     def _is_rule_applicable(
-        self, rule_key: Text, turn_index: int, conversation_state: State
+        self,
+        reversed_rule_states: List[State],
+        turn_index: int,
+        conversation_state: State,
     ) -> bool:
         """Check if rule is satisfied with current state at turn.
 
         Args:
-            rule_key: the textual representation of learned rule
+            reversed_rule_states: the states of the rule starting with the most
+                recent one
             turn_index: index of a current dialogue turn
             conversation_state: the state that corresponds to turn_index
 
         Returns:
             a boolean that says whether the rule is applicable to current state
         """
-        # turn_index goes back in time
-        reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
-
         # the rule must be applicable because we got (without any applicability issues)
         # further in the conversation history than the rule's length
         if turn_index >= len(reversed_rule_states):
@@ -884,18 +965,34 @@ class RulePolicy(MemoizationPolicy):
             reversed_rule_states[turn_index], conversation_state
         )
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
-        for i, state in enumerate(reversed(states)):
-            # find rule keys that correspond to current state
-            possible_keys = set(
-                filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
+    def _rule_index(self, lookup_key: Text) -> _RuleIndex:
+        lookup = self.lookup[lookup_key]
+        index = self._rule_indices.get(lookup_key)
+        # the lookups are replaced during training and rules might be removed from
+        # them, hence the index has to be compiled again in these cases
+        if index is None or index.lookup is not lookup or index.size != len(lookup):
+            index = _RuleIndex(lookup)
+            self._rule_indices[lookup_key] = index
+        return index
+
+    def _get_possible_keys(self, lookup_key: Text, states: List[State]) -> Set[Text]:
+        if not states:
+            return set(self.lookup[lookup_key].keys())
+
+        index = self._rule_index(lookup_key)
+        reversed_states = list(reversed(states))
+
+        # only the rules whose last state can match the current state are checked
+        return {
+            rule_key
+            for rule_key in index.candidates(reversed_states[0])
+            if all(
+                self._is_rule_applicable(
+                    index.reversed_rule_states[rule_key], i, state
                 )
+                for i, state in enumerate(reversed_states)
             )
-        return possible_keys
+        }
 
     @staticmethod
     def _find_action_from_default_actions(
@@ -998,7 +1095,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -1012,7 +1109,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -1026,7 +1123,9 @@ class RulePolicy(MemoizationPolicy):
             # Hence, we have to take care of that.
             predicted_listen_from_general_rule = (
                 predicted_action_name == ACTION_LISTEN_NAME
-                and not get_active_loop_name(self._rule_key_to_state(best_rule_key)[-1])
+                and not get_active_loop_name(
+                    self._rule_index(RULES).reversed_rule_states[best_rule_key][0]
+                )
             )
             if predicted_listen_from_general_rule:
                 if DO_NOT_PREDICT_LOOP_ACTION not in unhappy_path_conditions:
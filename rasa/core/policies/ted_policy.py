@@ -36,6 +36,7 @@ from rasa.shared.nlu.constants import (
     SPLIT_ENTITIES_BY_COMMA_DEFAULT_VALUE,
 )
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
+from rasa.core.policies.inference_queue import InferenceQueue
 from rasa.core.policies.policy import Policy, PolicyPrediction
 from rasa.core.constants import DEFAULT_POLICY_PRIORITY, DIALOGUE
 from rasa.shared.constants import DIAGNOSTIC_DATA
@@ -90,6 +91,7 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    PACKED_DATA_DIRECTORY,
     ENCODING_DIMENSION,
     UNIDIRECTIONAL_ENCODER,
     SEQUENCE,
@@ -108,6 +110,8 @@ from rasa.utils.tensorflow.constants import (
     MODEL_CONFIDENCE,
     SOFTMAX,
     BILOU_FLAG,
+    INFERENCE_BATCH_SIZE,
+    INFERENCE_MAX_WAIT,
 )
 from rasa.shared.core.events import EntitiesAdded, Event
 from rasa.shared.nlu.training_data.message import Message
@@ -285,6 +289,10 @@ class TEDPolicy(Policy):
         TENSORBOARD_LOG_LEVEL: "epoch",
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # Directory in which the training data is stored and memory mapped from
+        # during training, instead of keeping it in memory. If `None`, the training
+        # data is kept in memory.
+        PACKED_DATA_DIRECTORY: None,
         # Only pick e2e prediction if the policy is confident enough
         E2E_CONFIDENCE_THRESHOLD: 0.5,
         # Specify what features to use as sequence and sentence features.
@@ -308,6 +316,14 @@ class TEDPolicy(Policy):
         # ingredients in a recipe, but it doesn't make sense for the parts of
         # an address
         SPLIT_ENTITIES_BY_COMMA: SPLIT_ENTITIES_BY_COMMA_DEFAULT_VALUE,
+        # Maximum number of predictions of concurrent conversations which are
+        # gathered into one batch when the model is served. Only used together with
+        # the `MaxHistoryTrackerFeaturizer`. If set to 1, every prediction is run
+        # on its own.
+        INFERENCE_BATCH_SIZE: 1,
+        # Maximum time in seconds a prediction waits for more predictions to fill
+        # its batch.
+        INFERENCE_MAX_WAIT: 0.005,
     }
 
     @staticmethod
@@ -365,6 +381,29 @@ class TEDPolicy(Policy):
         if self.config[CHECKPOINT_MODEL]:
             self.tmp_checkpoint_dir = Path(rasa.utils.io.create_temporary_directory())
 
+        self.inference_queue = self._create_inference_queue()
+
+    def _create_inference_queue(self) -> Optional[InferenceQueue]:
+        if self.config[INFERENCE_BATCH_SIZE] <= 1:
+            return None
+
+        if not isinstance(self.featurizer, MaxHistoryTrackerFeaturizer):
+            # other featurizers predict every turn of a dialogue, which can't be
+            # batched with dialogues of a different length
+            shared_io_utils.raise_warning(
+                f"'{INFERENCE_BATCH_SIZE}' is ignored as '{self.__class__.__name__}' "
+                f"can only batch predictions if it uses the "
+                f"'{MaxHistoryTrackerFeaturizer.__name__}'."
+            )
+            return None
+
+        return InferenceQueue(
+            self._predict_batch,
+            self.config[INFERENCE_BATCH_SIZE],
+            self.config[INFERENCE_MAX_WAIT],
+            name=f"{self.__class__.__name__}-inference-queue",
+        )
+
     @staticmethod
     def model_class() -> Type["TED"]:
         """Gets the class of the model architecture to be used by the policy.
@@ -640,7 +679,8 @@ class TEDPolicy(Policy):
             data_generator,
             validation_data_generator,
         ) = rasa.utils.train_utils.create_data_generators(
-            model_data,
+            # packs the sequence features in case they weren't packed yet
+            model_data.packed(),
             self.config[BATCH_SIZES],
             self.config[EPOCHS],
             self.config[BATCH_STRATEGY],
@@ -703,7 +743,11 @@ class TEDPolicy(Policy):
             )
             return
 
-        self.run_training(model_data, label_ids)
+        with rasa.utils.train_utils.packed_data_directory(
+            self.config[PACKED_DATA_DIRECTORY]
+        ) as directory:
+            model_data = model_data.packed(directory)
+            self.run_training(model_data, label_ids)
 
     def _featurize_tracker_for_e2e(
         self,
@@ -797,8 +841,13 @@ class TEDPolicy(Policy):
         tracker_state_features = self._featurize_tracker_for_e2e(
             tracker, domain, interpreter
         )
-        model_data = self._create_model_data(tracker_state_features)
-        outputs: Dict[Text, np.ndarray] = self.model.run_inference(model_data)
+        if self.inference_queue is not None and not self._may_predict_entities(
+            tracker
+        ):
+            outputs = self.inference_queue.predict(tracker_state_features)
+        else:
+            model_data = self._create_model_data(tracker_state_features)
+            outputs: Dict[Text, np.ndarray] = self.model.run_inference(model_data)
 
         # take the last prediction in the sequence
         similarities = outputs["similarities"][:, -1, :]
@@ -826,6 +875,58 @@ class TEDPolicy(Policy):
             diagnostic_data=outputs.get(DIAGNOSTIC_DATA),
         )
 
+    def _may_predict_entities(self, tracker: DialogueStateTracker) -> bool:
+        # entities are only predicted for the latest user message, see
+        # `_create_optional_event_for_entities`
+        return (
+            self.config[ENTITY_RECOGNITION]
+            and tracker.latest_action_name == ACTION_LISTEN_NAME
+        )
+
+    def close(self) -> None:
+        """Stops the worker thread of the inference queue."""
+        if self.inference_queue is not None:
+            self.inference_queue.close()
+
+    def _predict_batch(
+        self, batch: List[List[List[Dict[Text, List["Features"]]]]]
+    ) -> List[Dict[Text, Any]]:
+        """Predicts the featurized trackers of multiple conversations at once.
+
+        Args:
+            batch: The featurized trackers of every conversation. Each conversation
+                can have multiple examples, see `_featurize_tracker_for_e2e`.
+
+        Returns:
+            The outputs of the model for every conversation. Entities are not
+            predicted, as they can't be assigned to the conversations.
+        """
+        tracker_state_features = [
+            example for conversation in batch for example in conversation
+        ]
+        model_data = self._create_model_data(tracker_state_features)
+        outputs = self.model.run_inference(
+            model_data, batch_size=len(tracker_state_features)
+        )
+
+        conversation_outputs = []
+        start = 0
+        for conversation in batch:
+            end = start + len(conversation)
+            conversation_outputs.append(
+                {
+                    "scores": outputs["scores"][start:end],
+                    "similarities": outputs["similarities"][start:end],
+                    DIAGNOSTIC_DATA: {
+                        name: value[start:end]
+                        for name, value in outputs.get(DIAGNOSTIC_DATA, {}).items()
+                    },
+                }
+            )
+            start = end
+
+        return conversation_outputs
+
     def _create_optional_event_for_entities(
         self,
         prediction_output: Dict[Text, tf.Tensor],
@@ -71,6 +71,7 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    PACKED_DATA_DIRECTORY,
     FEATURIZERS,
     ENTITY_RECOGNITION,
     IGNORE_INTENTS_LIST,
@@ -233,6 +234,10 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         TENSORBOARD_LOG_LEVEL: "epoch",
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # Directory in which the training data is stored and memory mapped from
+        # during training, instead of keeping it in memory. If `None`, the training
+        # data is kept in memory.
+        PACKED_DATA_DIRECTORY: None,
         # Specify what features to use as sequence and sentence features.
         # By default all features in the pipeline are used.
         FEATURIZERS: [],
@@ -300,6 +305,10 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
             IntentTokenizerSingleStateFeaturizer(), max_history=max_history
         )
 
+    def _create_inference_queue(self) -> None:
+        # the predictions of `UnexpecTEDIntentPolicy` aren't batched
+        return None
+
     @staticmethod
     def model_class() -> Type["IntentTED"]:
         """Gets the class of the model architecture to be used by the policy.
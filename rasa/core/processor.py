@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import time
@@ -81,6 +82,9 @@ class MessageProcessor:
         self.policy_ensemble = policy_ensemble
         self.domain = domain
         self.tracker_store = tracker_store
+        self.async_tracker_store = rasa.core.tracker_store.AsyncTrackerStore(
+            tracker_store
+        )
         self.lock_store = lock_store
         self.max_number_of_predictions = max_number_of_predictions
         self.message_preprocessor = message_preprocessor
@@ -97,7 +101,7 @@ class MessageProcessor:
 
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
             rasa.shared.utils.io.raise_warning(
                 "No policy ensemble or domain set. Skipping action prediction "
                 "and execution.",
@@ -108,7 +112,7 @@ class MessageProcessor:
         await self._predict_and_execute_next_action(message.output_channel, tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -130,7 +134,7 @@ class MessageProcessor:
         result = self.predict_next_with_tracker(tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         return result
 
@@ -236,7 +240,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker(sender_id)
 
         await self._update_tracker_session(tracker, output_channel, metadata)
 
@@ -259,7 +263,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker(sender_id)
 
         # run session start only if the tracker is empty
         if not tracker.events:
@@ -267,7 +271,7 @@ class MessageProcessor:
 
         return tracker
 
-    def get_tracker(self, conversation_id: Text) -> DialogueStateTracker:
+    async def get_tracker(self, conversation_id: Text) -> DialogueStateTracker:
         """Get the tracker for a conversation.
 
         In contrast to `fetch_tracker_and_update_session` this does not add any
@@ -284,11 +288,11 @@ class MessageProcessor:
         """
         conversation_id = conversation_id or DEFAULT_SENDER_ID
 
-        return self.tracker_store.get_or_create_tracker(
+        return await self.async_tracker_store.get_or_create_tracker(
             conversation_id, append_action_listen=False
         )
 
-    def get_trackers_for_all_conversation_sessions(
+    async def get_trackers_for_all_conversation_sessions(
         self, conversation_id: Text
     ) -> List[DialogueStateTracker]:
         """Fetches all trackers for a conversation.
@@ -305,7 +309,7 @@ class MessageProcessor:
         """
         conversation_id = conversation_id or DEFAULT_SENDER_ID
 
-        tracker = self.tracker_store.retrieve_full_tracker(conversation_id)
+        tracker = await self.async_tracker_store.retrieve_full_tracker(conversation_id)
 
         return rasa.shared.core.trackers.get_trackers_for_conversation_sessions(tracker)
 
@@ -328,7 +332,7 @@ class MessageProcessor:
 
         if should_save_tracker:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
 
         # bf >
         if message.output_channel.name() == 'bot_regression_test_output':
@@ -371,7 +375,7 @@ class MessageProcessor:
         await self._run_action(action, tracker, output_channel, nlg, prediction)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         return tracker
 
@@ -396,6 +400,22 @@ class MessageProcessor:
 
         return action, prediction
 
+    async def _predict_next_action_async(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
+        """Predicts the next action without blocking other conversations.
+
+        If the policies batch the predictions of concurrent conversations, the
+        prediction runs in a separate thread. Otherwise it runs directly.
+        """
+        executor = self.policy_ensemble.prediction_executor()
+        if executor is None:
+            return self.predict_next_action(tracker)
+
+        return await asyncio.get_event_loop().run_in_executor(
+            executor, self.predict_next_action, tracker
+        )
+
     @staticmethod
     def _is_reminder(e: Event, name: Text) -> bool:
         return isinstance(e, ReminderScheduled) and e.name == name
@@ -498,7 +518,7 @@ class MessageProcessor:
         )
         await self._predict_and_execute_next_action(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
     @staticmethod
     def _log_slots(tracker: DialogueStateTracker) -> None:
@@ -591,6 +611,42 @@ class MessageProcessor:
 
         return parse_data
 
+    async def parse_messages(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        """Interprets multiple texts at once using the NLU interpreter.
+
+        Texts in the `/intent{"entity": value}` format are parsed by the
+        `RegexInterpreter`, all others by one batched call of the NLU interpreter.
+
+        Arguments:
+            texts: The texts to parse.
+
+        Returns:
+            Parsed data extracted from the texts in the same order as the texts.
+        """
+        # preprocess messages if necessary
+        if self.message_preprocessor is not None:
+            texts = [self.message_preprocessor(text) for text in texts]
+
+        parse_data: List[Optional[Dict[Text, Any]]] = [None] * len(texts)
+        nlu_indices = []
+        for index, text in enumerate(texts):
+            if text.startswith(INTENT_MESSAGE_PREFIX):
+                parse_data[index] = await RegexInterpreter().parse(text)
+            else:
+                nlu_indices.append(index)
+
+        if nlu_indices:
+            nlu_parse_data = await self.interpreter.parse_batch(
+                [texts[index] for index in nlu_indices]
+            )
+            for index, data in zip(nlu_indices, nlu_parse_data):
+                parse_data[index] = data
+
+        for data in parse_data:
+            self._check_for_unseen_features(data)
+
+        return parse_data
+
     async def _handle_message_with_tracker(
         self, message: UserMessage, tracker: DialogueStateTracker
     ) -> None:
@@ -661,7 +717,7 @@ class MessageProcessor:
             and num_predicted_actions < self.max_number_of_predictions
         ):
             # this actually just calls the policy's method by the same name
-            action, prediction = self.predict_next_action(tracker)
+            action, prediction = await self._predict_next_action_async(tracker)
 
             should_predict_another_action = await self._run_action(
                 action, tracker, output_channel, self.nlg, prediction
@@ -904,8 +960,8 @@ class MessageProcessor:
 
         return has_expired
 
-    def _save_tracker(self, tracker: DialogueStateTracker) -> None:
-        self.tracker_store.save(tracker)
+    async def _save_tracker(self, tracker: DialogueStateTracker) -> None:
+        await self.async_tracker_store.save(tracker)
 
     def _get_next_action_probabilities(
         self, tracker: DialogueStateTracker
@@ -11,6 +11,7 @@ from rasa.shared.exceptions import RasaException
 import rasa.shared.utils.common
 import rasa.utils
 import rasa.utils.common
+import rasa.utils.endpoints
 import rasa.utils.io
 from rasa import model, server, telemetry
 from rasa.constants import ENV_SANIC_BACKLOG
@@ -300,11 +301,19 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
         app: The Sanic application.
         _: The current Sanic worker event loop.
     """
+    await rasa.utils.endpoints.close_sessions()
+
     current_agent = getattr(app, "agent", None)
     if not current_agent:
         logger.debug("No agent found when shutting down server.")
         return
 
+    current_agent.close_model()
+
+    # tracker stores might still have to write trackers before their event broker
+    # is closed
+    current_agent.tracker_store.close()
+
     event_broker = current_agent.tracker_store.event_broker
     if event_broker:
         if not asyncio.iscoroutinefunction(event_broker.close):
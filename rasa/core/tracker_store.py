@@ -1,9 +1,12 @@
+import asyncio
 import contextlib
+import functools
 import itertools
 import json
 import logging
 import os
 import pickle
+from concurrent.futures import Executor
 from datetime import datetime, timezone
 
 from time import sleep
@@ -16,6 +19,7 @@ from typing import (
     List,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
     Generator,
@@ -37,7 +41,7 @@ from rasa.core.constants import (
 )
 from rasa.shared.core.conversation import Dialogue
 from rasa.shared.core.domain import Domain
-from rasa.shared.core.events import SessionStarted
+from rasa.shared.core.events import Event, SessionStarted
 from rasa.shared.core.trackers import (
     ActionExecuted,
     DialogueStateTracker,
@@ -64,10 +68,19 @@ POSTGRESQL_DEFAULT_POOL_SIZE = 50
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
 
+# key infixes of the event log and session start index in RedisTrackerStore
+REDIS_EVENT_LOG_KEY_INFIX = "events:"
+REDIS_SESSION_START_KEY_INFIX = "session_start:"
+
 
 class TrackerStore:
     """Represents common behavior and interface for all `TrackerStore`s."""
 
+    # whether the methods of the tracker store wait for I/O, in which case
+    # `AsyncTrackerStore` runs them in executor threads. Only tracker stores which
+    # can be used by several threads at the same time may enable this.
+    performs_blocking_io = False
+
     def __init__(
         self,
         domain: Optional[Domain],
@@ -143,30 +156,43 @@ class TrackerStore:
 
         Args:
             sender_id: Conversation ID associated with the requested tracker.
-            max_event_history: Value to update the tracker store's max event history to.
+            max_event_history: Maximum number of events which a newly created
+                tracker keeps. The `max_event_history` of the tracker store is used
+                if `None`.
             append_action_listen: Whether or not to append an initial `action_listen`.
         """
-        self.max_event_history = max_event_history
-
         tracker = self.retrieve(sender_id)
 
         if tracker is None:
             tracker = self.create_tracker(
-                sender_id, append_action_listen=append_action_listen
+                sender_id,
+                append_action_listen=append_action_listen,
+                max_event_history=max_event_history,
             )
 
         return tracker
 
-    def init_tracker(self, sender_id: Text) -> "DialogueStateTracker":
-        """Returns a Dialogue State Tracker"""
+    def init_tracker(
+        self, sender_id: Text, max_event_history: Optional[int] = None
+    ) -> "DialogueStateTracker":
+        """Returns a Dialogue State Tracker.
+
+        Args:
+            sender_id: Conversation ID associated with the tracker.
+            max_event_history: Maximum number of events which the tracker keeps. The
+                `max_event_history` of the tracker store is used if `None`.
+        """
         return DialogueStateTracker(
             sender_id,
             self.domain.slots if self.domain else None,
-            max_event_history=self.max_event_history,
+            max_event_history=max_event_history or self.max_event_history,
         )
 
     def create_tracker(
-        self, sender_id: Text, append_action_listen: bool = True
+        self,
+        sender_id: Text,
+        append_action_listen: bool = True,
+        max_event_history: Optional[int] = None,
     ) -> DialogueStateTracker:
         """Creates a new tracker for `sender_id`.
 
@@ -175,11 +201,13 @@ class TrackerStore:
         Args:
             sender_id: Conversation ID associated with the tracker.
             append_action_listen: Whether or not to append an initial `action_listen`.
+            max_event_history: Maximum number of events which the tracker keeps. The
+                `max_event_history` of the tracker store is used if `None`.
 
         Returns:
             The newly created tracker for `sender_id`.
         """
-        tracker = self.init_tracker(sender_id)
+        tracker = self.init_tracker(sender_id, max_event_history)
 
         if append_action_listen:
             tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
@@ -237,9 +265,12 @@ class TrackerStore:
 
     def stream_events(self, tracker: DialogueStateTracker) -> None:
         """Streams events to a message broker"""
-        offset = self.number_of_existing_events(tracker.sender_id)
-        events = tracker.events
-        for event in list(itertools.islice(events, offset, len(events))):
+        events = tracker.unpersisted_events()
+        if events is None:
+            offset = self.number_of_existing_events(tracker.sender_id)
+            events = list(itertools.islice(tracker.events, offset, len(tracker.events)))
+
+        for event in events:
             body = {"sender_id": tracker.sender_id}
             body.update(event.as_dict())
             self.event_broker.publish(body)
@@ -254,6 +285,10 @@ class TrackerStore:
         """Returns the set of values for the tracker store's primary key"""
         raise NotImplementedError()
 
+    def close(self) -> None:
+        """Releases the resources of the tracker store when shutting down."""
+        pass
+
     @staticmethod
     def serialise_tracker(tracker: DialogueStateTracker) -> Text:
         """Serializes the tracker, returns representation of the tracker."""
@@ -291,6 +326,7 @@ class TrackerStore:
             )
 
         tracker.recreate_from_dialogue(dialogue)
+        tracker.mark_events_as_persisted()
 
         return tracker
 
@@ -298,6 +334,8 @@ class TrackerStore:
 class InMemoryTrackerStore(TrackerStore):
     """Stores conversation history in memory"""
 
+    performs_blocking_io = False
+
     def __init__(
         self,
         domain: Domain,
@@ -313,6 +351,7 @@ class InMemoryTrackerStore(TrackerStore):
             self.stream_events(tracker)
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        tracker.mark_events_as_persisted()
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         if sender_id in self.store:
@@ -329,7 +368,17 @@ class InMemoryTrackerStore(TrackerStore):
 
 
 class RedisTrackerStore(TrackerStore):
-    """Stores conversation history in Redis"""
+    """Stores conversation history in Redis.
+
+    By default every tracker is stored as a single serialised dialogue which is
+    overwritten on every save. If `use_event_log` is enabled, the events of each
+    conversation are stored in a Redis list instead. Saving then only appends the
+    new events and retrieving only reads the events of the latest conversation
+    session.
+    """
+
+    # the Redis client uses a thread-safe connection pool
+    performs_blocking_io = True
 
     def __init__(
         self,
@@ -342,6 +391,7 @@ class RedisTrackerStore(TrackerStore):
         record_exp: Optional[float] = None,
         key_prefix: Optional[Text] = None,
         use_ssl: bool = False,
+        use_event_log: bool = False,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import redis
@@ -350,6 +400,7 @@ class RedisTrackerStore(TrackerStore):
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        self.use_event_log = use_event_log
 
         self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
         if key_prefix:
@@ -370,6 +421,12 @@ class RedisTrackerStore(TrackerStore):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _events_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + REDIS_EVENT_LOG_KEY_INFIX + sender_id
+
+    def _session_start_key(self, sender_id: Text) -> Text:
+        return self.key_prefix + REDIS_SESSION_START_KEY_INFIX + sender_id
+
     def save(
         self, tracker: DialogueStateTracker, timeout: Optional[float] = None
     ) -> None:
@@ -380,11 +437,152 @@ class RedisTrackerStore(TrackerStore):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
-        serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
-            self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+        if self.use_event_log:
+            self._append_events(tracker, timeout)
+        else:
+            serialised_tracker = self.serialise_tracker(tracker)
+            self.red.set(
+                self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
+            )
+
+        tracker.mark_events_as_persisted()
+
+    def _append_events(
+        self, tracker: DialogueStateTracker, timeout: Optional[float]
+    ) -> None:
+        """Appends the events which aren't stored yet to the event log of `tracker`.
+
+        Args:
+            tracker: The tracker whose new events should be stored.
+            timeout: Expiration time of the stored events in seconds.
+        """
+        new_events = tracker.unpersisted_events()
+        latest_session_start = None
+        if new_events is not None:
+            latest_session_start = self._index_of_latest_session_start(new_events)
+
+        number_of_stored_events = None
+        if new_events is None or latest_session_start is not None:
+            # the absolute position of the new events is only needed to index the
+            # latest session start
+            number_of_stored_events, session_start = self._event_log_length(
+                tracker.sender_id
+            )
+
+        if new_events is None:
+            # the tracker only contains the events since the latest session start
+            # (unless it was retrieved including all previous sessions)
+            if self.retrieve_events_from_previous_conversation_sessions:
+                offset = number_of_stored_events
+            else:
+                offset = number_of_stored_events - session_start
+
+            # `events` doesn't contain the events which were dropped because of
+            # `max_event_history` anymore
+            offset -= tracker.appended_event_count - len(tracker.events)
+            new_events = list(itertools.islice(tracker.events, max(offset, 0), None))
+            latest_session_start = self._index_of_latest_session_start(new_events)
+
+        events_key = self._events_key(tracker.sender_id)
+        session_start_key = self._session_start_key(tracker.sender_id)
+
+        with self.red.pipeline() as pipeline:
+            if new_events:
+                pipeline.rpush(
+                    events_key, *[json.dumps(event.as_dict()) for event in new_events]
+                )
+
+            if latest_session_start is not None:
+                pipeline.set(
+                    session_start_key, number_of_stored_events + latest_session_start
+                )
+
+            if timeout:
+                pipeline.expire(events_key, timeout)
+                pipeline.expire(session_start_key, timeout)
+
+            pipeline.execute()
+
+    @staticmethod
+    def _index_of_latest_session_start(events: List[Event]) -> Optional[int]:
+        for index in reversed(range(len(events))):
+            if isinstance(events[index], SessionStarted):
+                return index
+
+        return None
+
+    def _event_log_length(self, sender_id: Text) -> Tuple[int, int]:
+        """Returns the length of the event log and the index of its session start.
+
+        Trackers which were stored as a single serialised dialogue are migrated to
+        the event log beforehand.
+
+        Args:
+            sender_id: Conversation ID of the event log.
+
+        Returns:
+            The number of stored events and the index of the latest
+            `SessionStarted` event (`0` if there is none).
+        """
+        with self.red.pipeline(transaction=False) as pipeline:
+            pipeline.llen(self._events_key(sender_id))
+            pipeline.get(self._session_start_key(sender_id))
+            pipeline.exists(self.key_prefix + sender_id)
+            number_of_events, session_start, has_legacy_tracker = pipeline.execute()
+
+        if not number_of_events and has_legacy_tracker:
+            return self._migrate_to_event_log(sender_id)
+
+        return number_of_events, int(session_start or 0)
+
+    def _migrate_to_event_log(self, sender_id: Text) -> Tuple[int, int]:
+        """Moves the events of a tracker stored as serialised dialogue to a log.
+
+        Args:
+            sender_id: Conversation ID of the stored tracker.
+
+        Returns:
+            The number of migrated events and the index of the latest
+            `SessionStarted` event (`0` if there is none).
+        """
+        legacy_key = self.key_prefix + sender_id
+        stored = self.red.get(legacy_key)
+        if stored is None:
+            return 0, 0
+
+        try:
+            dialogue = Dialogue.from_parameters(json.loads(stored))
+        except UnicodeDecodeError:
+            dialogue = self._deserialize_dialogue_from_pickle(sender_id, stored)
+
+        session_start = 0
+        for index, event in enumerate(dialogue.events):
+            if isinstance(event, SessionStarted):
+                session_start = index
+
+        logger.debug(
+            f"Migrating tracker with sender_id '{sender_id}' to the Redis event log."
         )
 
+        ttl = self.red.ttl(legacy_key)
+        events_key = self._events_key(sender_id)
+        session_start_key = self._session_start_key(sender_id)
+
+        with self.red.pipeline() as pipeline:
+            if dialogue.events:
+                pipeline.rpush(
+                    events_key,
+                    *[json.dumps(event.as_dict()) for event in dialogue.events],
+                )
+            pipeline.set(session_start_key, session_start)
+            if ttl is not None and ttl > 0:
+                pipeline.expire(events_key, ttl)
+                pipeline.expire(session_start_key, ttl)
+            pipeline.delete(legacy_key)
+            pipeline.execute()
+
+        return len(dialogue.events), session_start
+
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
 
@@ -396,20 +594,87 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             Tracker containing events from the latest conversation sessions.
         """
+        if self.use_event_log:
+            # TODO: Remove this in Rasa Open Source 3.0 along with the
+            # deprecation warning in the constructor
+            if self.retrieve_events_from_previous_conversation_sessions:
+                return self.retrieve_full_tracker(sender_id)
+
+            return self._retrieve_from_event_log(
+                sender_id, fetch_events_from_all_sessions=False
+            )
+
         stored = self.red.get(self.key_prefix + sender_id)
         if stored is not None:
             return self.deserialise_tracker(sender_id, stored)
         else:
             return None
 
+    def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Fetches tracker for `conversation_id` including all conversation sessions.
+
+        Args:
+            conversation_id: The conversation ID to retrieve the tracker for.
+
+        Returns:
+            The fetched tracker containing all events across session starts.
+        """
+        if self.use_event_log:
+            return self._retrieve_from_event_log(
+                conversation_id, fetch_events_from_all_sessions=True
+            )
+
+        return self.retrieve(conversation_id)
+
+    def _retrieve_from_event_log(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        number_of_events, session_start = self._event_log_length(sender_id)
+        if not number_of_events:
+            return None
+
+        start = 0 if fetch_events_from_all_sessions else session_start
+        serialised_events = self.red.lrange(self._events_key(sender_id), start, -1)
+        events = [json.loads(event) for event in serialised_events]
+
+        tracker = DialogueStateTracker.from_dict(
+            sender_id,
+            events,
+            self.domain.slots if self.domain else None,
+            max_event_history=self.max_event_history,
+        )
+        tracker.mark_events_as_persisted()
+
+        return tracker
+
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store."""
-        return self.red.keys(self.key_prefix + "*")
+        if not self.use_event_log:
+            return self.red.keys(self.key_prefix + "*")
+
+        events_key_prefix = self._events_key("").encode()
+        session_start_key_prefix = self._session_start_key("").encode()
+        prefix_length = len(self.key_prefix.encode())
+
+        sender_ids = set()
+        for key in self.red.keys(self.key_prefix + "*"):
+            if key.startswith(events_key_prefix):
+                sender_ids.add(key[len(events_key_prefix) :].decode())
+            elif not key.startswith(session_start_key_prefix):
+                # tracker which wasn't migrated to the event log yet
+                sender_ids.add(key[prefix_length:].decode())
+
+        return sender_ids
 
 
 class DynamoTrackerStore(TrackerStore):
     """Stores conversation history in DynamoDB"""
 
+    # boto3 resources aren't thread-safe, hence the calls stay on the event loop
+    performs_blocking_io = False
+
     def __init__(
         self,
         domain: Domain,
@@ -497,6 +762,8 @@ class DynamoTrackerStore(TrackerStore):
             else:
                 raise
 
+        tracker.mark_events_as_persisted()
+
     def _retrieve_latest_session_date(self, sender_id: Text) -> Optional[int]:
         dialogues = self.db.query(
             KeyConditionExpression=Key("sender_id").eq(sender_id),
@@ -535,9 +802,12 @@ class DynamoTrackerStore(TrackerStore):
         # `float`s are stored as `Decimal` objects - we need to convert them back
         events_with_floats = core_utils.replace_decimals_with_floats(events)
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             sender_id, events_with_floats, self.domain.slots
         )
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
@@ -554,6 +824,9 @@ class MongoTrackerStore(TrackerStore):
         conversations: returns the current conversation
     """
 
+    # `MongoClient` can be shared by several threads
+    performs_blocking_io = True
+
     def __init__(
         self,
         domain: Domain,
@@ -619,6 +892,7 @@ class MongoTrackerStore(TrackerStore):
             },
             upsert=True,
         )
+        tracker.mark_events_as_persisted()
 
     def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
         """Return events from the tracker which aren't currently stored.
@@ -630,6 +904,9 @@ class MongoTrackerStore(TrackerStore):
             List of serialised events that aren't currently stored.
 
         """
+        unpersisted_events = tracker.unpersisted_events()
+        if unpersisted_events is not None:
+            return iter(unpersisted_events)
 
         stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
         all_events = self._events_from_serialized_tracker(stored)
@@ -706,7 +983,10 @@ class MongoTrackerStore(TrackerStore):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker = DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     def retrieve_full_tracker(
         self, conversation_id: Text
@@ -716,9 +996,12 @@ class MongoTrackerStore(TrackerStore):
         if not events:
             return None
 
-        return DialogueStateTracker.from_dict(
+        tracker = DialogueStateTracker.from_dict(
             conversation_id, events, self.domain.slots
         )
+        tracker.mark_events_as_persisted()
+
+        return tracker
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
@@ -821,6 +1104,9 @@ def ensure_schema_exists(session: "Session") -> None:
 class SQLTrackerStore(TrackerStore):
     """Store which can save and retrieve trackers from an SQL database."""
 
+    # every call uses its own session of the thread-safe engine
+    performs_blocking_io = True
+
     from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
     Base: DeclarativeMeta = declarative_base()
@@ -897,6 +1183,12 @@ class SQLTrackerStore(TrackerStore):
 
         logger.debug(f"Connection to SQL database '{db}' successful.")
 
+        # connections to in-memory SQLite databases can't be shared across threads
+        if self.engine.url.drivername.startswith(
+            "sqlite"
+        ) and self.engine.url.database in (None, "", ":memory:"):
+            self.performs_blocking_io = False
+
         super().__init__(domain, event_broker, **kwargs)
 
     @staticmethod
@@ -1057,9 +1349,12 @@ class SQLTrackerStore(TrackerStore):
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
+                tracker = DialogueStateTracker.from_dict(
                     sender_id, events, self.domain.slots
                 )
+                tracker.mark_events_as_persisted()
+
+                return tracker
             else:
                 logger.debug(
                     f"Can't retrieve tracker matching "
@@ -1139,12 +1434,17 @@ class SQLTrackerStore(TrackerStore):
                 )
             session.commit()
 
+        tracker.mark_events_as_persisted()
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
     def _additional_events(
         self, session: "Session", tracker: DialogueStateTracker
     ) -> Iterator:
         """Return events from the tracker which aren't currently stored."""
+        unpersisted_events = tracker.unpersisted_events()
+        if unpersisted_events is not None:
+            return iter(unpersisted_events)
+
         number_of_events_since_last_session = self._event_query(
             session,
             tracker.sender_id,
@@ -1182,6 +1482,10 @@ class FailSafeTrackerStore(TrackerStore):
 
         super().__init__(tracker_store.domain, tracker_store.event_broker)
 
+    @property
+    def performs_blocking_io(self) -> bool:
+        return self._tracker_store.performs_blocking_io
+
     @property
     def domain(self) -> Optional[Domain]:
         return self._tracker_store.domain
@@ -1234,6 +1538,116 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
 
+    def close(self) -> None:
+        try:
+            self._tracker_store.close()
+        except Exception as e:
+            self.on_tracker_store_error(e)
+
+
+class AsyncTrackerStore:
+    """Asynchronous interface of a `TrackerStore`.
+
+    The methods of tracker stores which perform blocking I/O are run in an executor
+    so that waiting for the tracker store doesn't block the handling of other
+    conversations. Tracker stores with native asynchronous clients can subclass
+    this class and override its methods.
+    """
+
+    def __init__(
+        self, tracker_store: TrackerStore, executor: Optional[Executor] = None
+    ) -> None:
+        """Creates the asynchronous interface of `tracker_store`.
+
+        Args:
+            tracker_store: The tracker store which is wrapped.
+            executor: The executor which runs blocking calls of the tracker store.
+                The default executor of the event loop is used if `None`.
+        """
+        self.tracker_store = tracker_store
+        self.executor = executor
+
+    async def _run(
+        self, function: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        if not self.tracker_store.performs_blocking_io:
+            return function(*args, **kwargs)
+
+        return await asyncio.get_event_loop().run_in_executor(
+            self.executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def get_or_create_tracker(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> DialogueStateTracker:
+        """Returns tracker or creates one if the retrieval returns None.
+
+        Args:
+            sender_id: Conversation ID associated with the requested tracker.
+            max_event_history: Maximum number of events which a newly created
+                tracker keeps. The `max_event_history` of the tracker store is used
+                if `None`.
+            append_action_listen: Whether or not to append an initial `action_listen`.
+        """
+        return await self._run(
+            self.tracker_store.get_or_create_tracker,
+            sender_id,
+            max_event_history=max_event_history,
+            append_action_listen=append_action_listen,
+        )
+
+    async def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for the latest conversation session.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+
+        Returns:
+            Tracker containing events from the latest conversation sessions.
+        """
+        return await self._run(self.tracker_store.retrieve, sender_id)
+
+    async def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        """Retrieves tracker for `conversation_id` including all conversation sessions.
+
+        Args:
+            conversation_id: The conversation ID to retrieve the tracker for.
+
+        Returns:
+            The fetched tracker containing all events across session starts.
+        """
+        return await self._run(
+            self.tracker_store.retrieve_full_tracker, conversation_id
+        )
+
+    async def save(self, tracker: DialogueStateTracker) -> None:
+        """Saves the current conversation state.
+
+        Args:
+            tracker: The tracker which should be saved.
+        """
+        await self._run(self.tracker_store.save, tracker)
+
+    async def exists(self, conversation_id: Text) -> bool:
+        """Checks if tracker exists for the specified ID.
+
+        Args:
+            conversation_id: Conversation ID to check if the tracker exists.
+
+        Returns:
+            `True` if the tracker exists, `False` otherwise.
+        """
+        return await self._run(self.tracker_store.exists, conversation_id)
+
+    async def keys(self) -> List[Text]:
+        """Returns the conversation IDs of the tracker store."""
+        return await self._run(lambda: list(self.tracker_store.keys()))
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
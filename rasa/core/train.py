@@ -43,6 +43,7 @@ async def train(
         additional_arguments = {}
 
     policies = config.load(policy_config)
+    data_generation_arguments = config.load_data_generation_arguments(policy_config)
 
     agent = Agent(
         domain_file,
@@ -63,7 +64,10 @@ async def train(
         },
     )
     training_data = await agent.load_data(
-        training_resource, exclusion_percentage=exclusion_percentage, **data_load_args
+        training_resource,
+        exclusion_percentage=exclusion_percentage,
+        **data_generation_arguments,
+        **data_load_args,
     )
     if model_to_finetune:
         agent.policy_ensemble = model_to_finetune.policy_ensemble
@@ -47,6 +47,7 @@ async def load_data(
     use_story_concatenation: bool = True,
     debug_plots: bool = False,
     exclusion_percentage: Optional[int] = None,
+    story_generation_workers: int = 1,
 ) -> List["TrackerWithCachedStates"]:
     """
     Load training data from a resource.
@@ -67,6 +68,8 @@ async def load_data(
             generate debug plots during loading
         exclusion_percentage:
             how much data to exclude
+        story_generation_workers:
+            number of processes which generate the trackers from the stories
 
     Returns:
         list of loaded trackers
@@ -93,6 +96,7 @@ async def load_data(
             tracker_limit,
             use_story_concatenation,
             debug_plots,
+            story_generation_workers=story_generation_workers,
         )
         return g.generate()
     else:
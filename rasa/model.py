@@ -21,6 +21,7 @@ from rasa.shared.constants import (
     CONFIG_KEYS_CORE,
     CONFIG_KEYS_NLU,
     CONFIG_KEYS,
+    CONFIG_KEY_DATA,
     DEFAULT_DOMAIN_PATH,
     DEFAULT_MODELS_PATH,
     DEFAULT_CORE_SUBDIRECTORY_NAME,
@@ -346,8 +347,9 @@ async def model_fingerprint(file_importer: "TrainingDataImporter") -> Fingerprin
     domain.responses = {}
 
     return {
+        # the options for the data generation don't change the trained model
         FINGERPRINT_CONFIG_KEY: _get_fingerprint_of_config(
-            config, exclude_keys=CONFIG_KEYS
+            config, exclude_keys=CONFIG_KEYS + [CONFIG_KEY_DATA]
         ),
         FINGERPRINT_CONFIG_CORE_KEY: _get_fingerprint_of_config(
             config, include_keys=CONFIG_KEYS_CORE
@@ -391,6 +393,7 @@ def _get_fingerprint_of_config_without_epochs(
         return ""
 
     copied_config = copy.deepcopy(config)
+    copied_config.pop(CONFIG_KEY_DATA, None)
 
     for key in ["pipeline", "policies"]:
         if copied_config.get(key):
@@ -1,8 +1,13 @@
 import asyncio
+import logging
+import multiprocessing
 import os
+import pickle
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import ExitStack
 from typing import (
+    Any,
     Text,
     NamedTuple,
     Tuple,
@@ -37,6 +42,9 @@ from rasa.shared.constants import (
 )
 
 from rasa.core.agent import Agent
+from rasa.constants import ENV_CPU_INTER_OP_CONFIG, ENV_CPU_INTRA_OP_CONFIG
+
+logger = logging.getLogger(__name__)
 
 CODE_CORE_NEEDS_TO_BE_RETRAINED = 0b0001
 CODE_NLU_NEEDS_TO_BE_RETRAINED = 0b0010
@@ -68,6 +76,7 @@ async def train_async(
     nlu_additional_arguments: Optional[Dict] = None,
     model_to_finetune: Optional[Text] = None,
     finetuning_epoch_fraction: float = 1.0,
+    concurrent_training: bool = False,
 ) -> TrainingResult:
     """Trains a Rasa model (Core and NLU).
 
@@ -89,6 +98,8 @@ async def train_async(
             a directory in case the latest trained model should be used.
         finetuning_epoch_fraction: The fraction currently specified training epochs
             in the model configuration which should be used for finetuning.
+        concurrent_training: If `True`, NLU and Core are trained concurrently in
+            separate processes in case Core doesn't depend on the NLU model.
 
     Returns:
         An instance of `TrainingResult`.
@@ -117,6 +128,7 @@ async def train_async(
             nlu_additional_arguments=nlu_additional_arguments,
             model_to_finetune=model_to_finetune,
             finetuning_epoch_fraction=finetuning_epoch_fraction,
+            concurrent_training=concurrent_training,
         )
 
 
@@ -187,6 +199,7 @@ async def _train_async_internal(
     nlu_additional_arguments: Optional[Dict] = None,
     model_to_finetune: Optional[Text] = None,
     finetuning_epoch_fraction: float = 1.0,
+    concurrent_training: bool = False,
 ) -> TrainingResult:
     """Trains a Rasa model (Core and NLU). Use only from `train_async`.
 
@@ -207,6 +220,8 @@ async def _train_async_internal(
             a directory in case the latest trained model should be used.
         finetuning_epoch_fraction: The fraction currently specified training epochs
             in the model configuration which should be used for finetuning.
+        concurrent_training: If `True`, NLU and Core are trained concurrently in
+            separate processes in case Core doesn't depend on the NLU model.
 
     Returns:
         An instance of `TrainingResult`.
@@ -297,6 +312,7 @@ async def _train_async_internal(
                 old_model_zip_path=old_model,
                 model_to_finetune=model_to_finetune,
                 finetuning_epoch_fraction=finetuning_epoch_fraction,
+                concurrent_training=concurrent_training,
             )
         trained_model = model.package_model(
             fingerprint=new_fingerprint,
@@ -325,10 +341,36 @@ async def _do_training(
     old_model_zip_path: Optional[Text] = None,
     model_to_finetune: Optional["Text"] = None,
     finetuning_epoch_fraction: float = 1.0,
+    concurrent_training: bool = False,
 ) -> None:
     if not fingerprint_comparison_result:
         fingerprint_comparison_result = FingerprintComparisonResult()
 
+    if (
+        concurrent_training
+        and fingerprint_comparison_result.should_retrain_nlu()
+        and fingerprint_comparison_result.should_retrain_core()
+        and await _can_train_concurrently(file_importer, model_to_finetune)
+    ):
+        await _train_nlu_and_core_concurrently(
+            nlu_arguments=dict(
+                file_importer=file_importer,
+                output=output_path,
+                train_path=train_path,
+                fixed_model_name=fixed_model_name,
+                persist_nlu_training_data=persist_nlu_training_data,
+                additional_arguments=nlu_additional_arguments,
+            ),
+            core_arguments=dict(
+                file_importer=file_importer,
+                output=output_path,
+                train_path=train_path,
+                fixed_model_name=fixed_model_name,
+                additional_arguments=core_additional_arguments,
+            ),
+        )
+        return
+
     interpreter_path = None
     if fingerprint_comparison_result.should_retrain_nlu():
         model_path = await _train_nlu_with_validated_data(
@@ -375,6 +417,114 @@ async def _do_training(
         )
 
 
+async def _can_train_concurrently(
+    file_importer: TrainingDataImporter, model_to_finetune: Optional[Text]
+) -> bool:
+    """Checks whether NLU and Core can be trained in separate processes.
+
+    Args:
+        file_importer: `TrainingDataImporter` which supplies the training data.
+        model_to_finetune: Optional path to a model which should be finetuned.
+
+    Returns:
+        `True` if Core doesn't need the NLU model and the training data can be
+        passed to other processes.
+    """
+    if model_to_finetune:
+        reason = "finetuning a model"
+    elif await _core_requires_nlu_model(file_importer):
+        reason = "Core training uses the features of the NLU model"
+    else:
+        try:
+            pickle.dumps(file_importer)
+            return True
+        except Exception as e:
+            reason = f"the training data can't be passed to other processes ({e})"
+
+    logger.info(f"Training NLU and Core one after another as {reason}.")
+    return False
+
+
+async def _core_requires_nlu_model(file_importer: TrainingDataImporter) -> bool:
+    """Checks whether the Core training uses the trained NLU model.
+
+    This is the case for end-to-end training data and for policies which featurize
+    the dialogue states with the NLU pipeline (e.g. `TEDPolicy`). Policies like the
+    `RulePolicy` and the `MemoizationPolicy` only use the dialogue states themselves.
+
+    Args:
+        file_importer: `TrainingDataImporter` which supplies the training data.
+
+    Returns:
+        `True` if Core has to be trained after NLU.
+    """
+    import rasa.core.config
+
+    nlu_data, config = await asyncio.gather(
+        file_importer.get_nlu_data(), file_importer.get_config()
+    )
+    if nlu_data.has_e2e_examples():
+        return True
+
+    return any(
+        policy.featurizer.state_featurizer is not None
+        for policy in rasa.core.config.load(config)
+    )
+
+
+async def _train_nlu_and_core_concurrently(
+    nlu_arguments: Dict[Text, Any], core_arguments: Dict[Text, Any]
+) -> None:
+    """Trains NLU and Core at the same time in two separate processes.
+
+    The available CPUs are split between both processes for the TensorFlow
+    thread pools, unless these are configured explicitly via environment variables.
+
+    Args:
+        nlu_arguments: Keyword arguments for `_train_nlu_with_validated_data`.
+        core_arguments: Keyword arguments for `_train_core_with_validated_data`.
+    """
+    rasa.shared.utils.cli.print_color(
+        "Training NLU and Core models concurrently...",
+        color=rasa.shared.utils.io.bcolors.OKBLUE,
+    )
+    number_of_threads = max(1, (os.cpu_count() or 1) // 2)
+
+    # spawn fresh processes as the TensorFlow runtime can't be forked
+    executor = ProcessPoolExecutor(
+        2,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_training_process,
+        initargs=(number_of_threads, logging.getLogger("rasa").level),
+    )
+    loop = asyncio.get_event_loop()
+    try:
+        # the model can only be packaged once both trainings finished
+        await asyncio.gather(
+            loop.run_in_executor(executor, _train_nlu_in_process, nlu_arguments),
+            loop.run_in_executor(executor, _train_core_in_process, core_arguments),
+        )
+    finally:
+        executor.shutdown(wait=True)
+
+
+def _init_training_process(number_of_threads: int, log_level: int) -> None:
+    from rasa.utils.tensorflow.environment import setup_tf_environment
+
+    rasa.utils.common.set_log_level(log_level)
+    os.environ.setdefault(ENV_CPU_INTER_OP_CONFIG, str(number_of_threads))
+    os.environ.setdefault(ENV_CPU_INTRA_OP_CONFIG, str(number_of_threads))
+    setup_tf_environment()
+
+
+def _train_nlu_in_process(arguments: Dict[Text, Any]) -> Optional[Text]:
+    return rasa.utils.common.run_in_loop(_train_nlu_with_validated_data(**arguments))
+
+
+def _train_core_in_process(arguments: Dict[Text, Any]) -> Optional[Text]:
+    return rasa.utils.common.run_in_loop(_train_core_with_validated_data(**arguments))
+
+
 def _load_interpreter(
     interpreter_path: Optional[Text],
 ) -> Optional[NaturalLanguageInterpreter]:
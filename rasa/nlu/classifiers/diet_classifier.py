@@ -91,6 +91,7 @@ from rasa.utils.tensorflow.constants import (
     CONCAT_DIMENSION,
     FEATURIZERS,
     CHECKPOINT_MODEL,
+    PACKED_DATA_DIRECTORY,
     SEQUENCE,
     SENTENCE,
     SEQUENCE_LENGTH,
@@ -110,6 +111,41 @@ LABEL_SUB_KEY = IDS
 
 POSSIBLE_TAGS = [ENTITY_ATTRIBUTE_TYPE, ENTITY_ATTRIBUTE_ROLE, ENTITY_ATTRIBUTE_GROUP]
 
+# maximum number of messages which are predicted together in `process_batch`
+PREDICTION_BATCH_SIZE = 64
+
+
+def _prediction_of_example(
+    batch_out: Dict[Text, Any], index: int, sequence_length: int
+) -> Dict[Text, Any]:
+    """Extracts the outputs of a single example from the outputs of a batch.
+
+    Args:
+        batch_out: The outputs of the model for the batch.
+        index: The index of the example in the batch.
+        sequence_length: The number of tokens of the example. The entity predictions
+            are cut to this length to remove the predictions for the padding.
+
+    Returns:
+        The outputs as if the model had predicted the example on its own.
+    """
+    entity_keys = {
+        f"e_{tag}_{output}" for tag in POSSIBLE_TAGS for output in ["ids", "scores"]
+    }
+
+    out = {}
+    for key, value in batch_out.items():
+        if isinstance(value, dict):
+            out[key] = _prediction_of_example(value, index, sequence_length)
+        elif isinstance(value, np.ndarray) and value.ndim > 0:
+            value = value[index : index + 1]
+            if key in entity_keys and value.ndim > 1:
+                value = value[:, :sequence_length]
+            out[key] = value
+        else:
+            out[key] = value
+    return out
+
 
 class DIETClassifier(IntentClassifier, EntityExtractor):
     """A multi-task model for intent classification and entity extraction.
@@ -242,6 +278,10 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         TENSORBOARD_LOG_LEVEL: "epoch",
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # Directory in which the training data is stored and memory mapped from
+        # during training, instead of keeping it in memory. If `None`, the training
+        # data is kept in memory.
+        PACKED_DATA_DIRECTORY: None,
         # Specify what features to use as sequence and sentence features
         # By default all features in the pipeline are used.
         FEATURIZERS: [],
@@ -862,30 +902,38 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
             )
         self._sparse_feature_sizes = model_data.get_sparse_feature_sizes()
 
-        data_generator, validation_data_generator = train_utils.create_data_generators(
-            model_data,
-            self.component_config[BATCH_SIZES],
-            self.component_config[EPOCHS],
-            self.component_config[BATCH_STRATEGY],
-            self.component_config[EVAL_NUM_EXAMPLES],
-            self.component_config[RANDOM_SEED],
-        )
-        callbacks = train_utils.create_common_callbacks(
-            self.component_config[EPOCHS],
-            self.component_config[TENSORBOARD_LOG_DIR],
-            self.component_config[TENSORBOARD_LOG_LEVEL],
-            self.tmp_checkpoint_dir,
-        )
+        with train_utils.packed_data_directory(
+            self.component_config[PACKED_DATA_DIRECTORY]
+        ) as directory:
+            model_data = model_data.packed(directory)
 
-        self.model.fit(
-            data_generator,
-            epochs=self.component_config[EPOCHS],
-            validation_data=validation_data_generator,
-            validation_freq=self.component_config[EVAL_NUM_EPOCHS],
-            callbacks=callbacks,
-            verbose=False,
-            shuffle=False,  # we use custom shuffle inside data generator
-        )
+            (
+                data_generator,
+                validation_data_generator,
+            ) = train_utils.create_data_generators(
+                model_data,
+                self.component_config[BATCH_SIZES],
+                self.component_config[EPOCHS],
+                self.component_config[BATCH_STRATEGY],
+                self.component_config[EVAL_NUM_EXAMPLES],
+                self.component_config[RANDOM_SEED],
+            )
+            callbacks = train_utils.create_common_callbacks(
+                self.component_config[EPOCHS],
+                self.component_config[TENSORBOARD_LOG_DIR],
+                self.component_config[TENSORBOARD_LOG_LEVEL],
+                self.tmp_checkpoint_dir,
+            )
+
+            self.model.fit(
+                data_generator,
+                epochs=self.component_config[EPOCHS],
+                validation_data=validation_data_generator,
+                validation_freq=self.component_config[EVAL_NUM_EPOCHS],
+                callbacks=callbacks,
+                verbose=False,
+                shuffle=False,  # we use custom shuffle inside data generator
+            )
 
     # process helpers
     def _predict(
@@ -903,6 +951,38 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         model_data = self._create_model_data([message], training=False)
         return self.model.run_inference(model_data)
 
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]]]:
+        """Predicts multiple messages with one call of the model per batch.
+
+        Returns:
+            The predictions for every message in the same format as `_predict`.
+        """
+        if self.model is None:
+            logger.debug(
+                f"There is no trained model for '{self.__class__.__name__}': The "
+                f"component is either not trained or didn't receive enough training "
+                f"data."
+            )
+            return [None] * len(messages)
+
+        predictions = []
+        for start in range(0, len(messages), PREDICTION_BATCH_SIZE):
+            batch = messages[start : start + PREDICTION_BATCH_SIZE]
+            # the sequences of a batch are padded to the same length, hence the
+            # outputs of different batches can't be merged
+            model_data = self._create_model_data(batch, training=False)
+            batch_out = self.model.run_inference(model_data, batch_size=len(batch))
+            predictions.extend(
+                _prediction_of_example(
+                    batch_out, index, len(message.get(TOKENS_NAMES[TEXT], []))
+                )
+                for index, message in enumerate(batch)
+            )
+
+        return predictions
+
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
     ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
@@ -985,8 +1065,22 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Augments the message with intents, entities, and diagnostic data."""
-        out = self._predict(message)
+        self._process_prediction(message, self._predict(message))
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Augments the messages with intents, entities, and diagnostic data.
 
+        The messages are predicted in batches, which is a lot faster than
+        predicting them one by one.
+        """
+        for message, out in zip(messages, self._predict_batch(messages)):
+            self._process_prediction(message, out)
+
+    def _process_prediction(
+        self,
+        message: Message,
+        out: Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]],
+    ) -> None:
         if self.component_config[INTENT_CLASSIFICATION]:
             label, label_ranking = self._predict_label(out)
 
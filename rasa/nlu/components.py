@@ -673,6 +673,20 @@ class Component(metaclass=ComponentMetaclass):
         """
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Processes multiple incoming messages at once.
+
+        Processes every message with
+        :meth:`rasa.nlu.components.Component.process` by default. Components
+        which can process messages more efficiently together should override this.
+
+        Args:
+            messages: The :class:`rasa.shared.nlu.training_data.message.Message` s
+                to process.
+        """
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persists this component to disk for future loading.
 
@@ -1,6 +1,5 @@
 import logging
 import os
-import re
 from typing import Any, Dict, List, Optional, Text
 
 import rasa.shared.utils.io
@@ -47,6 +46,12 @@ class RegexEntityExtractor(EntityExtractor):
 
         self.case_sensitive = self.component_config["case_sensitive"]
         self.patterns = patterns or []
+        self._compile_patterns()
+
+    def _compile_patterns(self) -> None:
+        self.pattern_matcher = pattern_utils.PatternMatcher(
+            self.patterns, self.case_sensitive
+        )
 
     def train(
         self,
@@ -61,6 +66,7 @@ class RegexEntityExtractor(EntityExtractor):
             use_only_entities=True,
             use_word_boundaries=self.component_config["use_word_boundaries"],
         )
+        self._compile_patterns()
 
         if not self.patterns:
             rasa.shared.utils.io.raise_warning(
@@ -85,25 +91,17 @@ class RegexEntityExtractor(EntityExtractor):
         """Extract entities of the given type from the given user message."""
         entities = []
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
-        for pattern in self.patterns:
-            matches = re.finditer(pattern["pattern"], message.get(TEXT), flags=flags)
-            matches = list(matches)
+        text = message.get(TEXT)
+        match_spans = self.pattern_matcher.match_spans(text)
 
-            for match in matches:
-                start_index = match.start()
-                end_index = match.end()
+        for pattern, spans in zip(self.patterns, match_spans):
+            for start_index, end_index in spans:
                 entities.append(
                     {
                         ENTITY_ATTRIBUTE_TYPE: pattern["name"],
                         ENTITY_ATTRIBUTE_START: start_index,
                         ENTITY_ATTRIBUTE_END: end_index,
-                        ENTITY_ATTRIBUTE_VALUE: message.get(TEXT)[
-                            start_index:end_index
-                        ],
+                        ENTITY_ATTRIBUTE_VALUE: text[start_index:end_index],
                     }
                 )
 
@@ -792,31 +792,48 @@ class LanguageModelFeaturizer(DenseFeaturizer):
             training_data: NLU training data to be tokenized and featurized
             config: NLU pipeline config consisting of all components.
         """
-        batch_size = 64
-
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-
-            non_empty_examples = list(
-                filter(lambda x: x.get(attribute), training_data.training_examples)
+            self._set_lm_features_in_batches(
+                training_data.training_examples, attribute
             )
 
-            batch_start_index = 0
+    def _set_lm_features_in_batches(
+        self,
+        messages: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+        batch_size: int = 64,
+    ) -> None:
+        """Computes the dense features of messages by running the model in batches.
 
-            while batch_start_index < len(non_empty_examples):
+        Args:
+            messages: The messages to featurize. Messages which don't have the
+                attribute are skipped.
+            attribute: The attribute of the messages to featurize.
+            inference_mode: Whether this is during training or during inferencing.
+            batch_size: The maximum number of messages passed to the model at once.
+        """
+        non_empty_examples = list(filter(lambda x: x.get(attribute), messages))
 
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+        batch_start_index = 0
 
-                # Construct a doc with relevant features
-                # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
+        while batch_start_index < len(non_empty_examples):
 
-                for index, ex in enumerate(batch_messages):
-                    self._set_lm_features(batch_docs[index], ex, attribute)
-                batch_start_index += batch_size
+            batch_end_index = min(
+                batch_start_index + batch_size, len(non_empty_examples)
+            )
+            # Collect batch examples
+            batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+
+            # Construct a doc with relevant features
+            # extracted(tokens, dense_features)
+            batch_docs = self._get_docs_for_batch(
+                batch_messages, attribute, inference_mode=inference_mode
+            )
+
+            for index, ex in enumerate(batch_messages):
+                self._set_lm_features(batch_docs[index], ex, attribute)
+            batch_start_index += batch_size
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Process an incoming message by computing its tokens and dense features.
@@ -824,18 +841,19 @@ class LanguageModelFeaturizer(DenseFeaturizer):
         Args:
             message: Incoming message object
         """
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process incoming messages by running the model on batches of them.
+
+        Args:
+            messages: Incoming message objects
+        """
         # process of all featurizers operates only on TEXT and ACTION_TEXT attributes,
         # because all other attributes are labels which are featurized during training
         # and their features are stored by the model itself.
         for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                self._set_lm_features(
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
-                    message,
-                    attribute,
-                )
+            self._set_lm_features_in_batches(messages, attribute, inference_mode=True)
 
     def _set_lm_features(
         self, doc: Dict[Text, Any], message: Message, attribute: Text = TEXT
@@ -563,42 +563,46 @@ class CountVectorsFeaturizer(SparseFeaturizer):
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
-        if not self.vectorizers.get(attribute):
-            return [None], [None]
-
-        sequence_features = []
-        sentence_features = []
-
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        sequence_features = [None] * len(all_tokens)
+        sentence_features = [None] * len(all_tokens)
 
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
-
-            sequence_features.append(seq_vec.tocoo())
-
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        if not self.vectorizers.get(attribute):
+            return sequence_features, sentence_features
+
+        # messages without tokens (e.g. response not present) are not featurized
+        featurized = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not featurized:
+            return sequence_features, sentence_features
+
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features]
+        # transform the tokens of all messages at once and split the rows of the
+        # matrix afterwards, which is a lot faster than transforming every message
+        # on its own
+        seq_vec = (
+            self.vectorizers[attribute]
+            .transform([token for i in featurized for token in all_tokens[i]])
+            .tocsr()
+        )
+        end = 0
+        for i in featurized:
+            start, end = end, end + len(all_tokens[i])
+            message_seq_vec = seq_vec[start:end]
+            message_seq_vec.sort_indices()
+            sequence_features[i] = message_seq_vec.tocoo()
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            # join all tokens of a message to a single string to get the features
+            # of the whole sentence
+            sentence_vec = (
+                self.vectorizers[attribute]
+                .transform([" ".join(all_tokens[i]) for i in featurized])
+                .tocsr()
+            )
+            for row, i in enumerate(featurized):
+                message_sentence_vec = sentence_vec[row : row + 1]
+                message_sentence_vec.sort_indices()
+                sentence_features[i] = message_sentence_vec.tocoo()
 
         return sequence_features, sentence_features
 
@@ -694,7 +698,10 @@ class CountVectorsFeaturizer(SparseFeaturizer):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Process incoming message and compute and set features"""
+        self.process_batch([message], **kwargs)
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process incoming messages together and compute and set their features."""
         if self.vectorizers is None:
             logger.error(
                 "There is no trained CountVectorizer: "
@@ -704,17 +711,18 @@ class CountVectorsFeaturizer(SparseFeaturizer):
             return
         for attribute in self._attributes:
 
-            message_tokens = self._get_processed_message_tokens_by_attribute(
-                message, attribute
-            )
+            messages_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-            # features shape (1, seq, dim)
+            # features shape (1, seq, dim) for every message
             sequence_features, sentence_features = self._create_features(
-                attribute, [message_tokens]
+                attribute, messages_tokens
             )
 
             self._set_attribute_features(
-                attribute, sequence_features, sentence_features, [message]
+                attribute, sequence_features, sentence_features, messages
             )
 
     def _collect_vectorizer_vocabularies(self) -> Dict[Text, Optional[Dict[Text, int]]]:
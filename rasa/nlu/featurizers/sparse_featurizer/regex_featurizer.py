@@ -1,5 +1,4 @@
 import logging
-import re
 from typing import Any, Dict, List, Optional, Text, Type, Tuple
 from pathlib import Path
 import numpy as np
@@ -68,6 +67,7 @@ class RegexFeaturizer(SparseFeaturizer):
 
         self.known_patterns = known_patterns if known_patterns else []
         self.case_sensitive = self.component_config["case_sensitive"]
+        self._compile_patterns()
         self.finetune_mode = finetune_mode
         if self.component_config["number_additional_patterns"]:
             rasa.shared.utils.io.raise_deprecation_warning(
@@ -77,6 +77,11 @@ class RegexFeaturizer(SparseFeaturizer):
                 "You can omit specifying `number_additional_patterns` in future runs."
             )
 
+    def _compile_patterns(self) -> None:
+        self.pattern_matcher = pattern_utils.PatternMatcher(
+            self.known_patterns, self.case_sensitive
+        )
+
     def _merge_new_patterns(self, new_patterns: List[Dict[Text, Text]]) -> None:
         """Updates already known patterns with new patterns extracted from data.
 
@@ -127,6 +132,7 @@ class RegexFeaturizer(SparseFeaturizer):
             self._merge_new_patterns(patterns_from_data)
         else:
             self.known_patterns = patterns_from_data
+        self._compile_patterns()
 
         for example in training_data.training_examples:
             for attribute in [TEXT, RESPONSE, ACTION_TEXT]:
@@ -192,10 +198,6 @@ class RegexFeaturizer(SparseFeaturizer):
             # nothing to featurize
             return None, None
 
-        flags = 0  # default flag
-        if not self.case_sensitive:
-            flags = re.IGNORECASE
-
         sequence_length = len(tokens)
 
         num_patterns = len(self.known_patterns)
@@ -203,25 +205,35 @@ class RegexFeaturizer(SparseFeaturizer):
         sequence_features = np.zeros([sequence_length, num_patterns])
         sentence_features = np.zeros([1, num_patterns])
 
-        for pattern_index, pattern in enumerate(self.known_patterns):
-            matches = re.finditer(
-                pattern["pattern"], message.get(attribute), flags=flags
-            )
-            matches = list(matches)
+        token_starts = np.array([t.start for t in tokens])
+        token_ends = np.array([t.end for t in tokens])
+        token_patterns = [t.get("pattern", default={}) for t in tokens]
+
+        match_spans = self.pattern_matcher.match_spans(message.get(attribute))
+        for pattern_index, (pattern, spans) in enumerate(
+            zip(self.known_patterns, match_spans)
+        ):
+            if spans:
+                spans = np.array(spans)
+                # tokens which overlap with any of the matches
+                matched = np.any(
+                    (token_starts[:, np.newaxis] < spans[:, 1])
+                    & (token_ends[:, np.newaxis] > spans[:, 0]),
+                    axis=1,
+                )
+            else:
+                matched = np.zeros(sequence_length, dtype=bool)
 
-            for token_index, t in enumerate(tokens):
-                patterns = t.get("pattern", default={})
-                patterns[pattern["name"]] = False
+            sequence_features[:, pattern_index] = matched
+            if attribute in [RESPONSE, TEXT, ACTION_TEXT] and matched.any():
+                # sentence vector should contain all patterns
+                sentence_features[0][pattern_index] = 1.0
 
-                for match in matches:
-                    if t.start < match.end() and t.end > match.start():
-                        patterns[pattern["name"]] = True
-                        sequence_features[token_index][pattern_index] = 1.0
-                        if attribute in [RESPONSE, TEXT, ACTION_TEXT]:
-                            # sentence vector should contain all patterns
-                            sentence_features[0][pattern_index] = 1.0
+            for patterns, token_matched in zip(token_patterns, matched):
+                patterns[pattern["name"]] = bool(token_matched)
 
-                t.set("pattern", patterns)
+        for t, patterns in zip(tokens, token_patterns):
+            t.set("pattern", patterns)
         return (
             scipy.sparse.coo_matrix(sequence_features),
             scipy.sparse.coo_matrix(sentence_features),
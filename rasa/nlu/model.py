@@ -11,7 +11,7 @@ import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.constants import MINIMUM_COMPATIBLE_VERSION, NLU_MODEL_NAME_PREFIX
 from rasa.shared.constants import DOCS_URL_COMPONENTS
-from rasa.nlu import components, utils
+from rasa.nlu import components, training_cache, utils
 from rasa.nlu.classifiers.classifier import IntentClassifier
 from rasa.nlu.components import Component, ComponentBuilder
 from rasa.nlu.config import RasaNLUModelConfig, component_config_from_pipeline
@@ -147,11 +147,13 @@ class Trainer:
         component_builder: Optional[ComponentBuilder] = None,
         skip_validation: bool = False,
         model_to_finetune: Optional["Interpreter"] = None,
+        cache_dir: Optional[Text] = None,
     ) -> None:
 
         self.config = cfg
         self.skip_validation = skip_validation
         self.training_data = None  # type: Optional[TrainingData]
+        self.cache = None  # type: Optional[training_cache.TrainingCache]
 
         if component_builder is None:
             # If no builder is passed, every interpreter creation will result in
@@ -163,10 +165,15 @@ class Trainer:
         if not self.skip_validation:
             components.validate_requirements(cfg.component_names)
 
+        self.component_builder = component_builder
+
         if model_to_finetune:
             self.pipeline = model_to_finetune.pipeline
         else:
             self.pipeline = self._build_pipeline(cfg, component_builder)
+            # finetuned components depend on the previous model and can't be cached
+            if cache_dir:
+                self.cache = training_cache.TrainingCache(cache_dir)
 
     def _build_pipeline(
         self, cfg: RasaNLUModelConfig, component_builder: ComponentBuilder
@@ -215,14 +222,91 @@ class Trainer:
         # data gets modified internally during the training - hence the copy
         working_data: TrainingData = copy.deepcopy(data)
 
-        for i, component in enumerate(self.pipeline):
+        fingerprints = self._cache_fingerprints(working_data)
+        start = self._restore_from_cache(working_data, fingerprints, context)
+
+        for i, component in enumerate(self.pipeline[start:], start):
             logger.info(f"Starting to train component {component.name}")
             component.prepare_partial_processing(self.pipeline[:i], context)
+            if i < len(fingerprints):
+                snapshots = training_cache.snapshot_messages(working_data)
             component.train(working_data, self.config, **context)
+            if i < len(fingerprints):
+                self._add_to_cache(
+                    i, component, fingerprints[i], working_data, snapshots
+                )
             logger.info("Finished training component.")
 
         return Interpreter(self.pipeline, context)
 
+    def _cache_fingerprints(self, training_data: TrainingData) -> List[Text]:
+        """Calculates the cache keys of the cacheable prefix of the pipeline."""
+        if not self.cache:
+            return []
+
+        fingerprints = []
+        fingerprint = training_cache.training_data_fingerprint(
+            training_data, self.config.language
+        )
+        for component in self.pipeline:
+            if not training_cache.is_cacheable(component):
+                break
+            fingerprint = training_cache.component_fingerprint(component, fingerprint)
+            fingerprints.append(fingerprint)
+
+        return fingerprints
+
+    def _restore_from_cache(
+        self,
+        working_data: TrainingData,
+        fingerprints: List[Text],
+        context: Dict[Text, Any],
+    ) -> int:
+        """Loads the longest prefix of the pipeline which was trained before.
+
+        Returns:
+            The index of the first component which has to be trained.
+        """
+        restored = 0
+        while restored < len(fingerprints) and self.cache.contains(
+            fingerprints[restored]
+        ):
+            restored += 1
+
+        for i in range(restored):
+            component, changes = self.cache.load(
+                fingerprints[i], self.component_builder, **context
+            )
+            training_cache.apply_message_changes(working_data, changes)
+            self.pipeline[i] = component
+            logger.info(f"Restored trained component {component.name} from cache.")
+
+        return restored
+
+    def _add_to_cache(
+        self,
+        index: int,
+        component: Component,
+        fingerprint: Text,
+        working_data: TrainingData,
+        snapshots: List[training_cache.MessageSnapshot],
+    ) -> None:
+        changes = training_cache.message_changes(working_data, snapshots)
+        if changes is None:
+            logger.debug(
+                f"Component {component.name} changed the training data in a way "
+                f"which can't be cached."
+            )
+            return
+
+        self.cache.store(
+            fingerprint,
+            component,
+            self._file_name(index, component.name),
+            self.config.language,
+            changes,
+        )
+
     @staticmethod
     def _file_name(index: int, name: Text) -> Text:
         return f"component_{index}_{name}"
@@ -476,6 +560,56 @@ class Interpreter:
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
 
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse multiple input texts at once and return their pipeline results.
+
+        Every component of the pipeline processes all messages together (see
+        :meth:`rasa.nlu.components.Component.process_batch`), which is considerably
+        faster than parsing the texts one by one.
+
+        Args:
+            texts: The texts to parse.
+            time: The time at which the texts were sent.
+            only_output_properties: If `True`, only output properties are returned.
+
+        Returns:
+            The pipeline results in the same order as the texts.
+        """
+        timestamp = int(time.timestamp()) if time else None
+
+        messages = []
+        for text in texts:
+            if not text:
+                # see `parse` why empty strings are not processed
+                continue
+            data = self.default_output_attributes()
+            data[TEXT] = text
+            messages.append(Message(data=data, time=timestamp))
+
+        if messages:
+            for component in self.pipeline:
+                component.process_batch(messages, **self.context)
+
+        processed_messages = iter(messages)
+        outputs = []
+        for text in texts:
+            output = self.default_output_attributes()
+            if text:
+                message = next(processed_messages)
+                if not self.has_already_warned_of_overlapping_entities:
+                    self.warn_of_overlapping_entities(message)
+                output.update(
+                    message.as_dict(only_output_properties=only_output_properties)
+                )
+            outputs.append(output)
+
+        return outputs
+
     def featurize_message(self, message: Message) -> Message:
         """
         Tokenize and featurize the input message
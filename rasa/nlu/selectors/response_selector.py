@@ -73,6 +73,7 @@ from rasa.utils.tensorflow.constants import (
     CONCAT_DIMENSION,
     FEATURIZERS,
     CHECKPOINT_MODEL,
+    PACKED_DATA_DIRECTORY,
     DENSE_DIMENSION,
     CONSTRAIN_SIMILARITIES,
     MODEL_CONFIDENCE,
@@ -237,6 +238,10 @@ class ResponseSelector(DIETClassifier):
         FEATURIZERS: [],
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # Directory in which the training data is stored and memory mapped from
+        # during training, instead of keeping it in memory. If `None`, the training
+        # data is kept in memory.
+        PACKED_DATA_DIRECTORY: None,
         # if 'True' applies sigmoid on all similarity terms and adds it
         # to the loss function to ensure that similarity values are
         # approximately bounded. Used inside softmax loss only.
@@ -489,18 +494,20 @@ class ResponseSelector(DIETClassifier):
                     return search_key
         return None
 
-    def process(self, message: Message, **kwargs: Any) -> None:
+    def _process_prediction(
+        self,
+        message: Message,
+        out: Optional[Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]],
+    ) -> None:
         """Selects most like response for message.
 
+        Sets the most likely response, the associated intent_response_key and its
+        similarity to the input.
+
         Args:
             message: Latest user message.
-            kwargs: Additional key word arguments.
-
-        Returns:
-            the most likely response, the associated intent_response_key and its
-            similarity to the input.
+            out: The prediction of the model for the message.
         """
-        out = self._predict(message)
         top_label, label_ranking = self._predict_label(out)
 
         # Get the exact intent_response_key and the associated
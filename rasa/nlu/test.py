@@ -58,6 +58,7 @@ from rasa.nlu.model import Interpreter, Trainer, TrainingData
 from rasa.nlu.components import Component
 from rasa.nlu.classifiers import fallback_classifier
 from rasa.nlu.tokenizers.tokenizer import Token
+from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.tensorflow.constants import ENTITY_RECOGNITION
 from rasa.shared.importers.importer import TrainingDataImporter
 
@@ -80,6 +81,9 @@ ENTITY_PROCESSORS = {"EntitySynonymMapper", "ResponseSelector"}
 
 EXTRACTORS_WITH_CONFIDENCES = {"CRFEntityExtractor", "DIETClassifier"}
 
+# number of test examples which are parsed together
+PARSE_BATCH_SIZE = 64
+
 
 class CVEvaluationResult(NamedTuple):
     """Stores NLU cross-validation results."""
@@ -1269,8 +1273,10 @@ def get_eval_data(
         is_entity_extractor_present(interpreter) and len(test_data.entities) > 0
     )
 
-    for example in tqdm(test_data.nlu_examples):
-        result = interpreter.parse(example.get(TEXT), only_output_properties=False)
+    examples = test_data.nlu_examples
+    for example, result in tqdm(
+        _parse_examples(interpreter, examples), total=len(examples)
+    ):
 
         if should_eval_intents:
             if fallback_classifier.is_fallback_classifier_prediction(result):
@@ -1329,6 +1335,17 @@ def get_eval_data(
     return intent_results, response_selection_results, entity_results
 
 
+def _parse_examples(
+    interpreter: Interpreter, examples: List[Message]
+) -> Iterator[Tuple[Message, Dict[Text, Any]]]:
+    for start in range(0, len(examples), PARSE_BATCH_SIZE):
+        batch = examples[start : start + PARSE_BATCH_SIZE]
+        results = interpreter.parse_batch(
+            [example.get(TEXT) for example in batch], only_output_properties=False
+        )
+        yield from zip(batch, results)
+
+
 def get_entity_extractors(interpreter: Interpreter) -> Set[Text]:
     """Finds the names of entity extractors used by the interpreter.
 
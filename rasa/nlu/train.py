@@ -82,6 +82,7 @@ async def train(
     training_data_endpoint: Optional[EndpointConfig] = None,
     persist_nlu_training_data: bool = False,
     model_to_finetune: Optional[Interpreter] = None,
+    cache_dir: Optional[Text] = None,
     **kwargs: Any,
 ) -> Tuple[Trainer, Interpreter, Optional[Text]]:
     """Loads the trainer and the data and runs the training of the model."""
@@ -94,7 +95,10 @@ async def train(
     # WARN: there is still a race condition if a model with the same name is
     # trained in another subprocess
     trainer = Trainer(
-        nlu_config, component_builder, model_to_finetune=model_to_finetune
+        nlu_config,
+        component_builder,
+        model_to_finetune=model_to_finetune,
+        cache_dir=cache_dir,
     )
     persistor = create_persistor(storage)
     if training_data_endpoint is not None:
@@ -0,0 +1,396 @@
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Text, Tuple
+
+import rasa
+import rasa.shared.utils.io
+import rasa.utils.io
+from rasa.constants import (
+    DEFAULT_NLU_TRAINING_CACHE_MAX_SIZE,
+    ENV_NLU_TRAINING_CACHE_MAX_SIZE,
+)
+from rasa.nlu import utils
+from rasa.nlu.components import Component, ComponentBuilder
+from rasa.nlu.featurizers.featurizer import Featurizer
+from rasa.nlu.tokenizers.tokenizer import Token, Tokenizer
+from rasa.shared.nlu.training_data.training_data import TrainingData
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE_NAME = "metadata.json"
+MESSAGES_FILE_NAME = "messages.pkl"
+
+# bump this if the format of the cached message changes changes
+MESSAGE_CHANGES_FORMAT_VERSION = 2
+
+# Changes of a single message made by a component during training: the values it
+# set on the message, the features it added to it and the values it set on the
+# existing tokens of the message (per message attribute and token).
+TokenChanges = Dict[Text, List[Dict[Text, Any]]]
+MessageChanges = Tuple[Dict[Text, Any], List[Any], TokenChanges]
+MessageSnapshot = Tuple[Dict[Text, Any], int, TokenChanges]
+
+
+def is_cacheable(component: Component) -> bool:
+    """Checks whether the training result of a component can be cached.
+
+    Only the components which load language models (e.g. `SpacyNLP`), tokenizers
+    and featurizers are cached: they are the expensive, deterministic first part of
+    a pipeline and they only change the training data by setting values on the
+    messages and by adding features to them.
+
+    Args:
+        component: The component.
+
+    Returns:
+        `True` if the component can be cached.
+    """
+    from rasa.nlu.utils.hugging_face.hf_transformers import HFTransformersNLP
+    from rasa.nlu.utils.mitie_utils import MitieNLP
+    from rasa.nlu.utils.spacy_utils import SpacyNLP
+
+    return isinstance(
+        component, (HFTransformersNLP, MitieNLP, SpacyNLP, Tokenizer, Featurizer)
+    )
+
+
+def training_data_fingerprint(training_data: TrainingData, language: Text) -> Text:
+    """Calculates the key for the training data which a pipeline is trained on.
+
+    In contrast to `TrainingData.fingerprint` the order of the training examples
+    matters here, as the cached message changes are restored by position.
+
+    Args:
+        training_data: The training data.
+        language: The language of the pipeline.
+
+    Returns:
+        The fingerprint.
+    """
+    return rasa.shared.utils.io.get_list_fingerprint(
+        [
+            rasa.__version__,
+            str(MESSAGE_CHANGES_FORMAT_VERSION),
+            language,
+            training_data.fingerprint(),
+            *[message.fingerprint() for message in training_data.training_examples],
+        ]
+    )
+
+
+def component_fingerprint(component: Component, upstream_fingerprint: Text) -> Text:
+    """Calculates the cache key of a pipeline stage.
+
+    Args:
+        component: The (untrained) component of this stage.
+        upstream_fingerprint: The fingerprint of the previous stage or the
+            fingerprint of the training data for the first stage.
+
+    Returns:
+        The fingerprint of the stage.
+    """
+    return rasa.shared.utils.io.get_list_fingerprint(
+        [
+            upstream_fingerprint,
+            utils.module_path_from_object(component),
+            rasa.shared.utils.io.deep_container_fingerprint(
+                component.component_config
+            ),
+        ]
+    )
+
+
+def snapshot_messages(training_data: TrainingData) -> List[MessageSnapshot]:
+    """Captures the state of the training examples before a component is trained.
+
+    Args:
+        training_data: The training data.
+
+    Returns:
+        A shallow snapshot of every training example and of its tokens.
+    """
+    return [
+        (dict(message.data), len(message.features), _token_data(message.data))
+        for message in training_data.training_examples
+    ]
+
+
+def _is_token_list(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(token, Token) for token in value)
+    )
+
+
+def _token_data(data: Dict[Text, Any]) -> TokenChanges:
+    return {
+        key: [dict(token.data) for token in value]
+        for key, value in data.items()
+        if _is_token_list(value)
+    }
+
+
+def _changed_values(
+    data: Dict[Text, Any], data_before: Dict[Text, Any]
+) -> Optional[Dict[Text, Any]]:
+    if any(key not in data for key in data_before):
+        return None
+
+    return {
+        key: value
+        for key, value in data.items()
+        if key not in data_before or data_before[key] is not value
+    }
+
+
+def _token_changes(
+    data: Dict[Text, Any],
+    data_before: Dict[Text, Any],
+    token_data_before: TokenChanges,
+) -> Optional[TokenChanges]:
+    """Collects the values which were set on tokens that existed before.
+
+    Components like the `RegexFeaturizer` annotate the tokens of a message in
+    place instead of replacing them, which `_changed_values` can't see.
+    """
+    changes = {}
+    for key, tokens_before in token_data_before.items():
+        tokens = data[key]
+        if tokens is not data_before[key]:
+            # replaced tokens are part of the changed values of the message
+            continue
+        if len(tokens) != len(tokens_before):
+            return None
+
+        token_changes = []
+        for token, token_before in zip(tokens, tokens_before):
+            changed = _changed_values(token.data, token_before)
+            if changed is None:
+                return None
+            token_changes.append(changed)
+
+        if any(token_changes):
+            changes[key] = token_changes
+
+    return changes
+
+
+def message_changes(
+    training_data: TrainingData, snapshots: List[MessageSnapshot]
+) -> Optional[List[MessageChanges]]:
+    """Collects the changes which a component made to the training examples.
+
+    Args:
+        training_data: The training data after training the component.
+        snapshots: The snapshots taken before training the component.
+
+    Returns:
+        The changes of every training example or `None` if the component changed
+        the training data in a way which can't be restored from the cache.
+    """
+    examples = training_data.training_examples
+    if len(examples) != len(snapshots):
+        return None
+
+    changes = []
+    for message, (data_before, number_of_features_before, token_data_before) in zip(
+        examples, snapshots
+    ):
+        if len(message.features) < number_of_features_before:
+            return None
+
+        changed_data = _changed_values(message.data, data_before)
+        if changed_data is None:
+            return None
+
+        token_changes = _token_changes(message.data, data_before, token_data_before)
+        if token_changes is None:
+            return None
+
+        changes.append(
+            (
+                changed_data,
+                message.features[number_of_features_before:],
+                token_changes,
+            )
+        )
+
+    return changes
+
+
+def apply_message_changes(
+    training_data: TrainingData, changes: List[MessageChanges]
+) -> None:
+    """Restores the changes which a component made to the training examples.
+
+    Args:
+        training_data: The training data to update.
+        changes: The changes which were collected by `message_changes`.
+    """
+    for message, (changed_data, added_features, token_changes) in zip(
+        training_data.training_examples, changes
+    ):
+        message.data.update(changed_data)
+        message.features.extend(added_features)
+        for key, changes_of_tokens in token_changes.items():
+            for token, changed in zip(message.data[key], changes_of_tokens):
+                token.data.update(changed)
+
+
+class TrainingCache:
+    """Local on-disk cache for the trained components of an NLU pipeline.
+
+    Every entry holds the persisted artifacts of one trained component together
+    with the changes this component made to the training examples. Entries are
+    addressed by a fingerprint which chains the component class, its
+    configuration, the fingerprint of the previous pipeline stage and the
+    fingerprint of the training data. If the cache exceeds its maximum size, the
+    least recently used entries are evicted.
+    """
+
+    def __init__(
+        self, cache_dir: Text, max_size_in_bytes: Optional[int] = None
+    ) -> None:
+        """Creates the cache.
+
+        Args:
+            cache_dir: The directory where the cache entries are stored.
+            max_size_in_bytes: The maximum size of the cache. Defaults to the value
+                of the `RASA_NLU_TRAINING_CACHE_MAX_SIZE` environment variable (in
+                megabytes).
+        """
+        if max_size_in_bytes is None:
+            max_size_in_bytes = (
+                int(
+                    os.environ.get(
+                        ENV_NLU_TRAINING_CACHE_MAX_SIZE,
+                        DEFAULT_NLU_TRAINING_CACHE_MAX_SIZE,
+                    )
+                )
+                * 1024
+                * 1024
+            )
+
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size_in_bytes = max_size_in_bytes
+        rasa.shared.utils.io.create_directory(self.cache_dir)
+
+    def _entry_dir(self, fingerprint: Text) -> Text:
+        return os.path.join(self.cache_dir, fingerprint)
+
+    def contains(self, fingerprint: Text) -> bool:
+        """Checks whether there is a cache entry for a fingerprint."""
+        return os.path.isfile(
+            os.path.join(self._entry_dir(fingerprint), MESSAGES_FILE_NAME)
+        )
+
+    def store(
+        self,
+        fingerprint: Text,
+        component: Component,
+        file_name: Text,
+        language: Optional[Text],
+        changes: List[MessageChanges],
+    ) -> None:
+        """Persists a trained component and its training data changes.
+
+        Args:
+            fingerprint: The fingerprint of the pipeline stage.
+            component: The trained component.
+            file_name: The file name the component is persisted with.
+            language: The language of the pipeline.
+            changes: The changes the component made to the training examples.
+        """
+        from rasa.nlu.model import Metadata
+
+        # the entry is written to a temporary directory first so that concurrent
+        # trainings never see incomplete entries
+        temporary_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            component_meta = dict(component.component_config)
+            update = component.persist(file_name, temporary_dir)
+            if update:
+                component_meta.update(update)
+            component_meta["class"] = utils.module_path_from_object(component)
+
+            Metadata({"language": language, "pipeline": [component_meta]}).persist(
+                temporary_dir
+            )
+            rasa.utils.io.pickle_dump(
+                os.path.join(temporary_dir, MESSAGES_FILE_NAME), changes
+            )
+
+            os.rename(temporary_dir, self._entry_dir(fingerprint))
+        except Exception as e:
+            logger.debug(
+                f"Failed to add component '{component.name}' to the training "
+                f"cache. Error: {e}"
+            )
+        finally:
+            shutil.rmtree(temporary_dir, ignore_errors=True)
+
+        self._evict()
+
+    def load(
+        self,
+        fingerprint: Text,
+        component_builder: ComponentBuilder,
+        **context: Any,
+    ) -> Tuple[Component, List[MessageChanges]]:
+        """Loads a trained component and its training data changes.
+
+        Args:
+            fingerprint: The fingerprint of the pipeline stage.
+            component_builder: The builder which is used to load the component.
+            context: The training context.
+
+        Returns:
+            The trained component and the changes it made to the training examples.
+        """
+        from rasa.nlu.model import Metadata
+
+        entry_dir = self._entry_dir(fingerprint)
+        metadata = Metadata.load(entry_dir)
+        component = component_builder.load_component(
+            metadata.for_component(0), entry_dir, metadata, **context
+        )
+        changes = rasa.utils.io.pickle_load(
+            os.path.join(entry_dir, MESSAGES_FILE_NAME)
+        )
+
+        # mark the entry as recently used
+        os.utime(entry_dir)
+
+        return component, changes
+
+    def _entries(self) -> List[Tuple[float, int, Text]]:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+
+            size = 0
+            for directory, _, files in os.walk(path):
+                size += sum(
+                    os.path.getsize(os.path.join(directory, file)) for file in files
+                )
+            entries.append((os.path.getmtime(path), size, path))
+
+        return entries
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the cache is small enough."""
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total_size <= self.max_size_in_bytes:
+                break
+
+            logger.debug(f"Evicting '{path}' from the training cache.")
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
@@ -705,33 +705,48 @@ class HFTransformersNLP(Component):
             config: NLU pipeline config consisting of all components.
 
         """
-        batch_size = 64
-
         for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            self._set_docs_in_batches(training_data.training_examples, attribute)
 
-            non_empty_examples = list(
-                filter(lambda x: x.get(attribute), training_data.training_examples)
-            )
+    def _set_docs_in_batches(
+        self,
+        messages: List[Message],
+        attribute: Text,
+        inference_mode: bool = False,
+        batch_size: int = 64,
+    ) -> None:
+        """Computes the docs of messages by running the model in batches.
 
-            batch_start_index = 0
+        Args:
+            messages: The messages to process. Messages which don't have the
+                attribute are skipped.
+            attribute: The attribute of the messages to process.
+            inference_mode: Whether this is during training or during inferencing.
+            batch_size: The maximum number of messages passed to the model at once.
+        """
+        non_empty_examples = list(filter(lambda x: x.get(attribute), messages))
 
-            while batch_start_index < len(non_empty_examples):
+        batch_start_index = 0
 
-                batch_end_index = min(
-                    batch_start_index + batch_size, len(non_empty_examples)
-                )
-                # Collect batch examples
-                batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+        while batch_start_index < len(non_empty_examples):
 
-                # Construct a doc with relevant features
-                # extracted(tokens, dense_features)
-                batch_docs = self._get_docs_for_batch(batch_messages, attribute)
+            batch_end_index = min(
+                batch_start_index + batch_size, len(non_empty_examples)
+            )
+            # Collect batch examples
+            batch_messages = non_empty_examples[batch_start_index:batch_end_index]
+
+            # Construct a doc with relevant features
+            # extracted(tokens, dense_features)
+            batch_docs = self._get_docs_for_batch(
+                batch_messages, attribute, inference_mode=inference_mode
+            )
 
-                for index, ex in enumerate(batch_messages):
+            for index, ex in enumerate(batch_messages):
 
-                    ex.set(LANGUAGE_MODEL_DOCS[attribute], batch_docs[index])
+                ex.set(LANGUAGE_MODEL_DOCS[attribute], batch_docs[index])
 
-                batch_start_index += batch_size
+            batch_start_index += batch_size
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Process an incoming message by computing its tokens and dense features.
@@ -739,14 +754,16 @@ class HFTransformersNLP(Component):
         Args:
             message: Incoming message object
         """
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process incoming messages by running the model on batches of them.
+
+        Args:
+            messages: Incoming message objects
+        """
         # process of all featurizers operates only on TEXT and ACTION_TEXT attributes,
         # because all other attributes are labels which are featurized during training
         # and their features are stored by the model itself.
         for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                message.set(
-                    LANGUAGE_MODEL_DOCS[attribute],
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
-                )
+            self._set_docs_in_batches(messages, attribute, inference_mode=True)
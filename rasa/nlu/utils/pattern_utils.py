@@ -1,5 +1,6 @@
 import re
-from typing import Dict, List, Text, Union
+import string
+from typing import Dict, List, Optional, Pattern, Text, Tuple, Union
 
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.training_data import TrainingData
@@ -154,3 +155,249 @@ def extract_patterns(
         )
 
     return patterns
+
+
+# Literal alternations with fewer elements are faster to match with `re`.
+MIN_AUTOMATON_ELEMENTS = 20
+
+# regex special characters which have to be escaped to be matched literally
+_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+_ASCII_ALPHANUMERICS = frozenset(string.ascii_letters + string.digits)
+
+# `re.IGNORECASE` considers some characters equal although their lowercase versions
+# differ (see `_equivalences` in the `re` module). Texts and elements containing one
+# character of each of these groups are matched with `re`.
+_CASE_EQUIVALENT_CHARACTERS = re.compile(
+    "[\u0131\u017f\u00b5\u0345\u1fbe\u1fd3\u1fe3\u03d0\u03f5\u03d1\u03f0"
+    "\u03d6\u03f1\u03c2\u03d5\u1e9b\ufb05]"
+)
+
+
+def _is_word_character(character: Text) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def _parse_literal_alternation(pattern: Text) -> Optional[Tuple[List[Text], bool]]:
+    r"""Parses a regex created by `_generate_lookup_regex` back into its elements.
+
+    Args:
+        pattern: The regex pattern.
+
+    Returns:
+        The literal elements and whether they are surrounded by `\b`, or `None` if
+        the pattern is not an alternation of literals.
+    """
+    if len(pattern) < 2 or pattern[0] != "(" or pattern[-1] != ")":
+        return None
+
+    alternatives = [[]]
+    index = 1
+    while index < len(pattern) - 1:
+        character = pattern[index]
+        if character == "\\":
+            index += 1
+            escaped = pattern[index]
+            if escaped == "b":
+                alternatives[-1].append(None)
+            elif escaped in _ASCII_ALPHANUMERICS:
+                # character classes, back references, ...
+                return None
+            else:
+                alternatives[-1].append(escaped)
+        elif character == "|":
+            alternatives.append([])
+        elif character in _SPECIAL_CHARACTERS:
+            return None
+        else:
+            alternatives[-1].append(character)
+        index += 1
+    if index != len(pattern) - 1:
+        # the closing parenthesis is escaped
+        return None
+
+    use_word_boundaries = alternatives[0][:1] == [None]
+    elements = []
+    for alternative in alternatives:
+        if use_word_boundaries:
+            if len(alternative) < 2 or alternative[0] or alternative[-1]:
+                return None
+            alternative = alternative[1:-1]
+        if not alternative or None in alternative:
+            return None
+        elements.append("".join(alternative))
+
+    return elements, use_word_boundaries
+
+
+class _LiteralAlternationMatcher:
+    """Aho-Corasick automaton matching an alternation of literals like `re` does.
+
+    At every position the first element of the alternation which matches is used,
+    and matches do not overlap.
+    """
+
+    def __init__(
+        self, elements: List[Text], use_word_boundaries: bool, case_sensitive: bool
+    ) -> None:
+        self.use_word_boundaries = use_word_boundaries
+        self.case_sensitive = case_sensitive
+
+        # trie of all elements: transitions, failure links and the matching
+        # (element index, element length) pairs of every node
+        self._transitions: List[Dict[Text, int]] = [{}]
+        self._outputs: List[List[Tuple[int, int]]] = [[]]
+        for element_index, element in enumerate(elements):
+            if not case_sensitive:
+                element = element.lower()
+            node = 0
+            for character in element:
+                next_node = self._transitions[node].get(character)
+                if next_node is None:
+                    next_node = len(self._transitions)
+                    self._transitions[node][character] = next_node
+                    self._transitions.append({})
+                    self._outputs.append([])
+                node = next_node
+            self._outputs[node].append((element_index, len(element)))
+
+        self._failures = [0] * len(self._transitions)
+        queue = list(self._transitions[0].values())
+        for node in queue:
+            for character, next_node in self._transitions[node].items():
+                failure = self._failures[node]
+                while failure and character not in self._transitions[failure]:
+                    failure = self._failures[failure]
+                failure = self._transitions[failure].get(character, 0)
+                self._failures[next_node] = failure
+                self._outputs[next_node] = (
+                    self._outputs[next_node] + self._outputs[failure]
+                )
+                queue.append(next_node)
+
+    @classmethod
+    def create(
+        cls, pattern: Text, case_sensitive: bool
+    ) -> Optional["_LiteralAlternationMatcher"]:
+        """Creates an automaton for the pattern if it is a large literal alternation.
+
+        Args:
+            pattern: The regex pattern.
+            case_sensitive: Whether the pattern is matched case sensitive.
+
+        Returns:
+            The automaton or `None` if the pattern has to be matched by `re`.
+        """
+        parsed = _parse_literal_alternation(pattern)
+        if not parsed or len(parsed[0]) < MIN_AUTOMATON_ELEMENTS:
+            return None
+
+        elements, use_word_boundaries = parsed
+        if not case_sensitive and any(
+            len(element.lower()) != len(element)
+            or _CASE_EQUIVALENT_CHARACTERS.search(element.lower())
+            for element in elements
+        ):
+            return None
+
+        return cls(elements, use_word_boundaries, case_sensitive)
+
+    def _is_word_boundary(self, text: Text, index: int) -> bool:
+        before = index > 0 and _is_word_character(text[index - 1])
+        after = index < len(text) and _is_word_character(text[index])
+        return before != after
+
+    def can_match(self, text: Text) -> bool:
+        """Checks if the automaton matches the text exactly like `re` would."""
+        if self.case_sensitive:
+            return True
+        lowercase_text = text.lower()
+        return len(lowercase_text) == len(text) and not (
+            _CASE_EQUIVALENT_CHARACTERS.search(lowercase_text)
+        )
+
+    def find_all(self, text: Text) -> List[Tuple[int, int]]:
+        """Finds the spans of all matches in the text.
+
+        Args:
+            text: The text to search (see `can_match`).
+
+        Returns:
+            The start and end of the matches.
+        """
+        search_text = text if self.case_sensitive else text.lower()
+
+        # the first element of the alternation which matches at every start
+        candidates: Dict[int, Tuple[int, int]] = {}
+        node = 0
+        for index, character in enumerate(search_text):
+            while node and character not in self._transitions[node]:
+                node = self._failures[node]
+            node = self._transitions[node].get(character, 0)
+
+            end = index + 1
+            for element_index, length in self._outputs[node]:
+                start = end - length
+                if self.use_word_boundaries and not (
+                    self._is_word_boundary(text, start)
+                    and self._is_word_boundary(text, end)
+                ):
+                    continue
+                candidate = candidates.get(start)
+                if candidate is None or element_index < candidate[0]:
+                    candidates[start] = (element_index, end)
+
+        spans = []
+        last_end = 0
+        for start in sorted(candidates):
+            if start >= last_end:
+                last_end = candidates[start][1]
+                spans.append((start, last_end))
+        return spans
+
+
+class PatternMatcher:
+    """Matches a list of patterns against texts.
+
+    The regexes are compiled once. Large literal alternations, which is what lookup
+    tables are turned into, are matched with an Aho-Corasick automaton instead of
+    trying every element at every position of the text.
+    """
+
+    def __init__(
+        self, patterns: List[Dict[Text, Text]], case_sensitive: bool = True
+    ) -> None:
+        """Compiles the patterns.
+
+        Args:
+            patterns: The patterns as extracted by `extract_patterns`.
+            case_sensitive: Whether the patterns are matched case sensitive.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+
+        self.patterns = patterns
+        self._regexes: List[Pattern] = []
+        self._automata: List[Optional[_LiteralAlternationMatcher]] = []
+        for pattern in patterns:
+            self._regexes.append(re.compile(pattern["pattern"], flags=flags))
+            self._automata.append(
+                _LiteralAlternationMatcher.create(pattern["pattern"], case_sensitive)
+            )
+
+    def match_spans(self, text: Text) -> List[List[Tuple[int, int]]]:
+        """Finds the matches of every pattern in the text.
+
+        Args:
+            text: The text to search.
+
+        Returns:
+            For every pattern the start and end of its matches, in the same order as
+            `re.finditer` finds them.
+        """
+        spans = []
+        for regex, automaton in zip(self._regexes, self._automata):
+            if automaton and automaton.can_match(text):
+                spans.append(automaton.find_all(text))
+            else:
+                spans.append([match.span() for match in regex.finditer(text)])
+        return spans
@@ -245,6 +245,22 @@ class SpacyNLP(Component):
                     SPACY_DOCS[attribute], self.doc_for_text(message.get(attribute))
                 )
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Creates the spaCy docs of multiple messages with spaCy's pipe."""
+        for attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            messages_with_attribute = [
+                message for message in messages if message.get(attribute)
+            ]
+            docs = self.nlp.pipe(
+                [
+                    self.preprocess_text(message.get(attribute))
+                    for message in messages_with_attribute
+                ],
+                batch_size=50,
+            )
+            for message, doc in zip(messages_with_attribute, docs):
+                message.set(SPACY_DOCS[attribute], doc)
+
     @classmethod
     def load(
         cls,
@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import json
 import logging
 import multiprocessing
 import os
@@ -66,7 +67,7 @@ import rasa.shared.core.events
 from rasa.shared.core.events import Event
 from rasa.core.lock_store import LockStore
 from rasa.core.test import test
-from rasa.core.tracker_store import TrackerStore
+from rasa.core.tracker_store import AsyncTrackerStore, TrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.core.utils import AvailableEndpoints
 from rasa.nlu.emulators.no_emulator import NoEmulator
@@ -87,6 +88,13 @@ logger = logging.getLogger(__name__)
 
 JSON_CONTENT_TYPE = "application/json"
 YAML_CONTENT_TYPE = "application/x-yaml"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# limits of the `/model/parse/batch` endpoint
+PARSE_BATCH_MAX_TEXTS = 10_000
+PARSE_BATCH_MAX_PAYLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
+PARSE_BATCH_DEFAULT_CHUNK_SIZE = 64
+PARSE_BATCH_MAX_CHUNK_SIZE = 1_000
 
 OUTPUT_CHANNEL_QUERY_KEY = "output_channel"
 USE_LATEST_INPUT_CHANNEL_AS_OUTPUT_CHANNEL = "latest"
@@ -170,10 +178,13 @@ def ensure_conversation_exists() -> "SanicView":
 
     def decorator(f: "SanicView") -> HTTPResponse:
         @wraps(f)
-        def decorated(request: Request, *args: Any, **kwargs: Any) -> HTTPResponse:
+        async def decorated(
+            request: Request, *args: Any, **kwargs: Any
+        ) -> HTTPResponse:
             conversation_id = kwargs["conversation_id"]
-            if request.app.agent.tracker_store.exists(conversation_id):
-                return f(request, *args, **kwargs)
+            tracker_store = AsyncTrackerStore(request.app.agent.tracker_store)
+            if await tracker_store.exists(conversation_id):
+                return await f(request, *args, **kwargs)
             else:
                 raise ErrorResponse(
                     HTTPStatus.NOT_FOUND, "Not found", "Conversation ID not found."
@@ -296,7 +307,7 @@ def event_verbosity_parameter(
         )
 
 
-def get_test_stories(
+async def get_test_stories(
     processor: "MessageProcessor",
     conversation_id: Text,
     until_time: Optional[float],
@@ -316,9 +327,11 @@ def get_test_stories(
         The stories for `conversation_id` in test format.
     """
     if fetch_all_sessions:
-        trackers = processor.get_trackers_for_all_conversation_sessions(conversation_id)
+        trackers = await processor.get_trackers_for_all_conversation_sessions(
+            conversation_id
+        )
     else:
-        trackers = [processor.get_tracker(conversation_id)]
+        trackers = [await processor.get_tracker(conversation_id)]
 
     if until_time is not None:
         trackers = [tracker.travel_back_in_time(until_time) for tracker in trackers]
@@ -363,7 +376,7 @@ async def update_conversation_with_events(
         The tracker for `conversation_id` with the updated events.
     """
     if rasa.shared.core.events.do_events_begin_with_session_start(events):
-        tracker = processor.get_tracker(conversation_id)
+        tracker = await processor.get_tracker(conversation_id)
     else:
         tracker = await processor.fetch_tracker_with_initial_session(conversation_id)
 
@@ -440,6 +453,90 @@ def create_ssl_context(
         return None
 
 
+def _texts_from_parse_batch_request(
+    request: Request, emulator: NoEmulator
+) -> List[Text]:
+    """Extracts the texts to parse from a `/model/parse/batch` request.
+
+    The body is either a JSON list, a JSON object with a `texts` list or NDJSON
+    with one item per line. Every item is either a text or an object in the format
+    of a `/model/parse` request.
+    """
+    if len(request.body) > PARSE_BATCH_MAX_PAYLOAD_SIZE:
+        raise ErrorResponse(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            "PayloadTooLarge",
+            f"The request body exceeds the maximum size of "
+            f"{PARSE_BATCH_MAX_PAYLOAD_SIZE} bytes.",
+        )
+
+    try:
+        if request.headers.get("Content-Type", "").startswith(NDJSON_CONTENT_TYPE):
+            items = [
+                json.loads(line)
+                for line in request.body.decode("utf-8").splitlines()
+                if line.strip()
+            ]
+        else:
+            items = json.loads(request.body)
+            if isinstance(items, dict):
+                items = items.get("texts")
+    except ValueError as e:
+        raise ErrorResponse(
+            HTTPStatus.BAD_REQUEST, "BadRequest", f"Invalid request body. Error: {e}"
+        )
+
+    if not isinstance(items, list):
+        raise ErrorResponse(
+            HTTPStatus.BAD_REQUEST,
+            "BadRequest",
+            "The request body has to be a list of texts to parse or an object with "
+            "the key 'texts'.",
+        )
+
+    if len(items) > PARSE_BATCH_MAX_TEXTS:
+        raise ErrorResponse(
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            "PayloadTooLarge",
+            f"The request contains {len(items)} texts, but at most "
+            f"{PARSE_BATCH_MAX_TEXTS} texts can be parsed in one request.",
+        )
+
+    texts = []
+    for item in items:
+        if isinstance(item, str):
+            item = {"text": item}
+        if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "BadRequest",
+                f"Invalid item '{item}'. Every item has to be a text or an object "
+                f"with the key 'text'.",
+            )
+        texts.append(emulator.normalise_request_json(item)["text"])
+
+    return texts
+
+
+def _parse_batch_chunk_size(request: Request) -> int:
+    try:
+        chunk_size = int(
+            request.args.get("chunk_size", PARSE_BATCH_DEFAULT_CHUNK_SIZE)
+        )
+    except ValueError:
+        chunk_size = 0
+
+    if not 0 < chunk_size <= PARSE_BATCH_MAX_CHUNK_SIZE:
+        raise ErrorResponse(
+            HTTPStatus.BAD_REQUEST,
+            "BadRequest",
+            f"The chunk size has to be a number between 1 and "
+            f"{PARSE_BATCH_MAX_CHUNK_SIZE}.",
+            {"parameter": "chunk_size", "in": "query"},
+        )
+    return chunk_size
+
+
 def _create_emulator(mode: Optional[Text]) -> NoEmulator:
     """Create emulator for specified mode.
     If no emulator is specified, we will use the Rasa NLU format."""
@@ -781,7 +878,7 @@ def create_app(
                         events, tracker, output_channel
                     )
 
-                app.agent.tracker_store.save(tracker)
+                await processor.async_tracker_store.save(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -831,7 +928,7 @@ def create_app(
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await AsyncTrackerStore(app.agent.tracker_store).save(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -854,7 +951,7 @@ def create_app(
         )
 
         try:
-            stories = get_test_stories(
+            stories = await get_test_stories(
                 app.agent.create_processor(),
                 conversation_id,
                 until_time,
@@ -1208,6 +1305,8 @@ def create_app(
             eval_agent = await _load_agent(
                 model_path, model_server, app.agent.remote_storage
             )
+            # only the model directory of the agent is needed
+            eval_agent.close_model()
 
         data_path = os.path.abspath(test_data_file)
 
@@ -1345,6 +1444,54 @@ def create_app(
                 f"An unexpected error occurred. Error: {e}",
             )
 
+    @app.post("/model/parse/batch")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app)
+    async def parse_batch(request: Request) -> HTTPResponse:
+        """Parses many texts and streams the results back as NDJSON.
+
+        The texts are parsed in chunks by the batched NLU pipeline. The result of
+        every text is written as one line as soon as its chunk is parsed.
+        """
+        validate_request_body(
+            request,
+            "No texts defined in request_body. Add a list of texts to the request "
+            "body in order to obtain their intents and extracted entities.",
+        )
+        emulator = _create_emulator(request.args.get("emulation_mode"))
+        texts = _texts_from_parse_batch_request(request, emulator)
+        chunk_size = _parse_batch_chunk_size(request)
+        agent = app.agent
+
+        async def stream_results(
+            response_stream: response.StreamingHTTPResponse,
+        ) -> None:
+            for start in range(0, len(texts), chunk_size):
+                try:
+                    parsed_data = await agent.parse_messages_using_nlu_interpreter(
+                        texts[start : start + chunk_size]
+                    )
+                except Exception as e:
+                    logger.debug(traceback.format_exc())
+                    # the status was already sent, hence the error is part of the
+                    # stream
+                    error = ErrorResponse(
+                        HTTPStatus.INTERNAL_SERVER_ERROR,
+                        "ParsingError",
+                        f"An unexpected error occurred. Error: {e}",
+                    )
+                    await response_stream.write(json.dumps(error.error_info) + "\n")
+                    return
+
+                await response_stream.write(
+                    "".join(
+                        json.dumps(emulator.normalise_response_json(data)) + "\n"
+                        for data in parsed_data
+                    )
+                )
+
+        return response.stream(stream_results, content_type=NDJSON_CONTENT_TYPE)
+
     @app.put("/model")
     @requires_auth(app, auth_token)
     async def load_model(request: Request) -> HTTPResponse:
@@ -1366,9 +1513,11 @@ def create_app(
                     {"parameter": "model_server", "in": "body"},
                 )
 
+        previous_agent = app.agent
         app.agent = await _load_agent(
             model_path, model_server, remote_storage, endpoints, app.agent.lock_store
         )
+        previous_agent.close_model()
 
         logger.debug(f"Successfully loaded model '{model_path}'.")
         return response.json(None, status=HTTPStatus.NO_CONTENT)
@@ -1377,8 +1526,10 @@ def create_app(
     @requires_auth(app, auth_token)
     async def unload_model(request: Request) -> HTTPResponse:
         model_file = app.agent.model_directory
+        previous_agent = app.agent
 
         app.agent = Agent(lock_store=app.agent.lock_store)
+        previous_agent.close_model()
 
         logger.debug(f"Successfully unloaded model '{model_file}'.")
         return response.json(None, status=HTTPStatus.NO_CONTENT)
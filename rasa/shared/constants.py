@@ -65,6 +65,9 @@ CONFIG_AUTOCONFIGURABLE_KEYS = (
     CONFIG_AUTOCONFIGURABLE_KEYS_CORE + CONFIG_AUTOCONFIGURABLE_KEYS_NLU
 )
 CONFIG_KEYS_CORE = ["policies"]
+# options for the generation of training data which don't change the trained model
+CONFIG_KEY_DATA = "data"
+CONFIG_KEY_STORY_GENERATION_WORKERS = "story_generation_workers"
 CONFIG_KEYS_NLU = ["language", "pipeline"]
 CONFIG_KEYS = CONFIG_KEYS_CORE + CONFIG_KEYS_NLU
 CONFIG_MANDATORY_KEYS_CORE = []
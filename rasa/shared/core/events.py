@@ -231,6 +231,55 @@ def do_events_begin_with_session_start(events: List["Event"]) -> bool:
     ]
 
 
+# attribute under which events cache the values which determine their equality
+_CACHED_MEMBERS = "_cached_members"
+
+
+def _freeze(value: Any) -> Any:
+    """Returns a hashable key which compares like the `jsonpickle` encoded value.
+
+    Two values get equal keys exactly when `jsonpickle.encode` encodes them to the
+    same string (e.g. `1`, `1.0` and `True` are all different and dict keys keep
+    their order), but creating the key is much cheaper than encoding the value.
+    Objects without JSON equivalent are still encoded with `jsonpickle`.
+    """
+    value_type = type(value)
+    if value is None or value_type is str:
+        return value
+    if value_type is int or value_type is bool:
+        return value_type, value
+    if value_type is float:
+        return float, repr(value)
+    if value_type is list or value_type is tuple:
+        return (value_type,) + tuple(_freeze(item) for item in value)
+    if value_type is dict:
+        items = {}
+        for key, item in value.items():
+            if type(key) is not str:
+                key = "null" if key is None else repr(key)
+            items[key] = _freeze(item)
+        return dict, tuple(items.items())
+
+    return object, jsonpickle.encode(value)
+
+
+def _hashable(value: Any) -> Any:
+    """Returns a hashable representation of `value` which is consistent with `==`."""
+    if isinstance(value, dict):
+        return frozenset((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+
+    try:
+        hash(value)
+    except TypeError:
+        # equal values still end up with the same hash
+        return type(value).__name__
+    return value
+
+
 class Event(ABC):
     """Describes events in conversation and how the affect the conversation state.
 
@@ -249,6 +298,32 @@ class Event(ABC):
         self.timestamp = timestamp or time.time()
         self._metadata = metadata or {}
 
+    def __setattr__(self, name: Text, value: Any) -> None:
+        # Changing any attribute might change what the event is equal to.
+        self.__dict__.pop(_CACHED_MEMBERS, None)
+        super().__setattr__(name, value)
+
+    def __members__(self) -> Any:
+        """Returns the values which determine equality and hash of the event."""
+        raise NotImplementedError
+
+    def _members(self) -> Any:
+        """Returns the cached result of `__members__`.
+
+        The cache is dropped when an attribute of the event is set. Code which
+        modifies attributes of an event in place has to call
+        `_invalidate_members` afterwards.
+        """
+        members = self.__dict__.get(_CACHED_MEMBERS)
+        if members is None:
+            members = self.__members__()
+            self.__dict__[_CACHED_MEMBERS] = members
+        return members
+
+    def _invalidate_members(self) -> None:
+        """Drops the cached result of `__members__`."""
+        self.__dict__.pop(_CACHED_MEMBERS, None)
+
     @property
     def metadata(self) -> Dict[Text, Any]:
         # Needed for compatibility with Rasa versions <1.4.0. Previous versions
@@ -481,9 +556,16 @@ class UserUttered(Event):
             metadata,
         )
 
+    def __members__(self) -> Tuple[Optional[Text], Optional[Text], Tuple]:
+        return (
+            self.text,
+            self.intent_name,
+            tuple(_freeze(entity) for entity in self.entities),
+        )
+
     def __hash__(self) -> int:
         """Returns unique hash of object."""
-        return hash(json.dumps(self.as_sub_state()))
+        return hash(self._members())
 
     @property
     def intent_name(self) -> Optional[Text]:
@@ -495,15 +577,7 @@ class UserUttered(Event):
         if not isinstance(other, UserUttered):
             return NotImplemented
 
-        return (
-            self.text,
-            self.intent_name,
-            [jsonpickle.encode(ent) for ent in self.entities],
-        ) == (
-            other.text,
-            other.intent_name,
-            [jsonpickle.encode(ent) for ent in other.entities],
-        )
+        return self._members() == other._members()
 
     def __str__(self) -> Text:
         """Returns text representation of event."""
@@ -800,6 +874,7 @@ class EntitiesAdded(SkipEventInMDStoryMixin):
         for entity in self.entities:
             if entity not in tracker.latest_message.entities:
                 tracker.latest_message.entities.append(entity)
+                tracker.latest_message._invalidate_members()
 
 
 class BotUttered(SkipEventInMDStoryMixin):
@@ -831,25 +906,21 @@ class BotUttered(SkipEventInMDStoryMixin):
         self.data = data or {}
         super().__init__(timestamp, metadata)
 
-    def __members(self) -> Tuple[Optional[Text], Text, Text]:
+    def __members__(self) -> Tuple[Optional[Text], Any, Any]:
         data_no_nones = {k: v for k, v in self.data.items() if v is not None}
         meta_no_nones = {k: v for k, v in self.metadata.items() if v is not None}
-        return (
-            self.text,
-            jsonpickle.encode(data_no_nones),
-            jsonpickle.encode(meta_no_nones),
-        )
+        return (self.text, _freeze(data_no_nones), _freeze(meta_no_nones))
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
-        return hash(self.__members())
+        return hash(self._members())
 
     def __eq__(self, other: Any) -> bool:
         """Compares object with other object."""
         if not isinstance(other, BotUttered):
             return NotImplemented
 
-        return self.__members() == other.__members()
+        return self._members() == other._members()
 
     def __str__(self) -> Text:
         """Returns text representation of event."""
@@ -944,7 +1015,10 @@ class SlotSet(Event):
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
-        return hash((self.key, jsonpickle.encode(self.value)))
+        return hash(self._members())
+
+    def __members__(self) -> Tuple[Text, Any]:
+        return self.key, _hashable(self.value)
 
     def __eq__(self, other: Any) -> bool:
         """Compares object with other object."""
@@ -1512,13 +1586,9 @@ class ActionExecuted(Event):
 
         super().__init__(timestamp, metadata)
 
-    def __members__(self) -> Tuple[Optional[Text], Optional[Text], Text]:
+    def __members__(self) -> Tuple[Optional[Text], Optional[Text], Any]:
         meta_no_nones = {k: v for k, v in self.metadata.items() if v is not None}
-        return (
-            self.action_name,
-            self.action_text,
-            jsonpickle.encode(meta_no_nones),
-        )
+        return self.action_name, self.action_text, _freeze(meta_no_nones)
 
     def __repr__(self) -> Text:
         """Returns event as string for debugging."""
@@ -1532,14 +1602,14 @@ class ActionExecuted(Event):
 
     def __hash__(self) -> int:
         """Returns unique hash for event."""
-        return hash(self.__members__())
+        return hash(self._members())
 
     def __eq__(self, other: Any) -> bool:
         """Compares object with other object."""
         if not isinstance(other, ActionExecuted):
             return NotImplemented
 
-        return self.__members__() == other.__members__()
+        return self._members() == other._members()
 
     def as_story_string(self) -> Text:
         """Returns event in Markdown format."""
@@ -1623,19 +1693,19 @@ class AgentUttered(SkipEventInMDStoryMixin):
         self.data = data
         super().__init__(timestamp, metadata)
 
+    def __members__(self) -> Tuple[Optional[Text], Any]:
+        return self.text, _freeze(self.data)
+
     def __hash__(self) -> int:
         """Returns unique hash for event."""
-        return hash((self.text, jsonpickle.encode(self.data)))
+        return hash(self._members())
 
     def __eq__(self, other: Any) -> bool:
         """Compares object with other object."""
         if not isinstance(other, AgentUttered):
             return NotImplemented
 
-        return (self.text, jsonpickle.encode(self.data)) == (
-            other.text,
-            jsonpickle.encode(other.data),
-        )
+        return self._members() == other._members()
 
     def __str__(self) -> Text:
         """Returns text representation of event."""
@@ -1,11 +1,33 @@
 from collections import defaultdict, namedtuple, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 
 import copy
+import io
+import itertools
 import logging
+import math
+import multiprocessing
+import pickle
 import random
 
 from tqdm import tqdm
-from typing import Optional, List, Text, Set, Dict, Tuple, Deque, Any
+from typing import (
+    Optional,
+    List,
+    Text,
+    Set,
+    Dict,
+    Tuple,
+    Deque,
+    Any,
+    Iterable,
+    Iterator,
+    Union,
+    Generic,
+    TypeVar,
+    Generator,
+)
 
 from rasa.shared.constants import DOCS_URL_STORIES
 from rasa.shared.core.constants import SHOULD_NOT_BE_SET
@@ -42,9 +64,93 @@ ExtractorConfig = namedtuple(
     "max_number_of_augmented_trackers "
     "tracker_limit "
     "use_story_concatenation "
+    "story_generation_workers "
     "rand",
 )
 
+# story steps with fewer incoming trackers than this per worker are not split up
+# between worker processes since sending the trackers costs more than it saves
+MIN_TRACKERS_PER_WORKER = 50
+
+
+T = TypeVar("T")
+
+
+class _SharedHistory(Generic[T]):
+    """An append-only sequence which shares its items with its copies.
+
+    Copies refer to the same underlying list and only remember how many of its
+    items belong to them. Items are never overwritten, `pop` only shortens the
+    view. The first copy which appends after the end of the shared list extends
+    it in place, other copies take a private copy of their items before they
+    diverge. Copying is therefore O(1) and branches share their common prefix.
+    """
+
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._items = list(items)
+        self._length = len(self._items)
+
+    def copy(self) -> "_SharedHistory[T]":
+        """Returns a copy which shares the items of this sequence."""
+        shared = _SharedHistory.__new__(_SharedHistory)
+        shared._items = self._items
+        shared._length = self._length
+        return shared
+
+    __copy__ = copy
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _SharedHistory, (list(self),)
+
+    def append(self, item: T) -> None:
+        """Adds an item to the end of the sequence."""
+        if len(self._items) != self._length:
+            self._items = self._items[: self._length]
+        self._items.append(item)
+        self._length += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Adds items to the end of the sequence."""
+        for item in items:
+            self.append(item)
+
+    def pop(self) -> T:
+        """Removes and returns the last item of the sequence."""
+        if not self._length:
+            raise IndexError("pop from an empty sequence")
+        self._length -= 1
+        return self._items[self._length]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[T]:
+        return itertools.islice(self._items, self._length)
+
+    def __reversed__(self) -> Iterator[T]:
+        return (self._items[index] for index in range(self._length - 1, -1, -1))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return self._items[: self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("sequence index out of range")
+        return self._items[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (_SharedHistory, deque, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    def __repr__(self) -> Text:
+        return f"{self.__class__.__name__}({list(self)})"
+
 
 class TrackerWithCachedStates(DialogueStateTracker):
     """A tracker wrapper that caches the state creation of the tracker."""
@@ -86,7 +192,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
 
     def past_states_for_hashing(
         self, domain: Domain, omit_unset_slots: bool = False,
-    ) -> Deque[FrozenState]:
+    ) -> _SharedHistory[FrozenState]:
         """Generates and caches the past states of this tracker based on the history.
 
         Args:
@@ -104,15 +210,17 @@ class TrackerWithCachedStates(DialogueStateTracker):
         # if don't have it cached, we use the domain to calculate the states
         # from the events
         if self._states_for_hashing is None:
-            states = super().past_states(domain, omit_unset_slots=omit_unset_slots)
-            self._states_for_hashing = deque(
+            states = domain.states_for_tracker_history(
+                self, omit_unset_slots=omit_unset_slots
+            )
+            self._states_for_hashing = _SharedHistory(
                 self.freeze_current_state(s) for s in states
             )
 
         return self._states_for_hashing
 
     @staticmethod
-    def _unfreeze_states(frozen_states: Deque[FrozenState]) -> List[State]:
+    def _unfreeze_states(frozen_states: Iterable[FrozenState]) -> List[State]:
         return [
             {key: dict(value) for key, value in dict(frozen_state).items()}
             for frozen_state in frozen_states
@@ -158,23 +266,43 @@ class TrackerWithCachedStates(DialogueStateTracker):
             self.is_rule_tracker,
         )
 
+    def _create_events(
+        self, evts: List[Event]
+    ) -> Union[Deque[Event], _SharedHistory[Event]]:
+        if self._max_event_history:
+            return super()._create_events(evts)
+
+        if evts and not isinstance(evts[0], Event):  # pragma: no cover
+            raise ValueError("events, if given, must be a list of events")
+        # allows to copy the tracker without copying its events
+        return _SharedHistory(evts)
+
     def copy(
         self, sender_id: Text = "", sender_source: Text = ""
     ) -> "TrackerWithCachedStates":
         """Creates a duplicate of this tracker.
 
-        A new tracker will be created and all events
-        will be replayed."""
-
-        # This is an optimization, we could use the original copy, but
-        # the states would be lost and we would need to recalculate them
+        Instead of replaying all events, the new tracker starts with a snapshot of
+        the slots and the loop state of this tracker. Events and cached states are
+        shared with this tracker until one of the trackers is updated."""
 
         tracker = self.init_copy()
         tracker.sender_id = sender_id
         tracker.sender_source = sender_source
 
-        for event in self.events:
-            tracker.update(event, skip_states=True)
+        if isinstance(self.events, _SharedHistory):
+            tracker.events = self.events.copy()
+        else:
+            tracker.events = self._create_events(list(self.events))
+        tracker.appended_event_count = self.appended_event_count
+        for name, slot in self.slots.items():
+            tracker.slots[name] = copy.copy(slot)
+        tracker._paused = self._paused
+        tracker.followup_action = self.followup_action
+        tracker.latest_action = copy.copy(self.latest_action)
+        tracker.latest_message = self.latest_message
+        tracker.latest_bot_utterance = self.latest_bot_utterance
+        tracker.active_loop = copy.copy(self.active_loop)
 
         tracker._states_for_hashing = copy.copy(self._states_for_hashing)
 
@@ -222,6 +350,106 @@ TrackerLookupDict = Dict[Optional[Text], List[TrackerWithCachedStates]]
 
 TrackersTuple = Tuple[List[TrackerWithCachedStates], List[TrackerWithCachedStates]]
 
+# trackers which ended within a story step together with the index of the event
+# which ended them and the index of the tracker within the incoming trackers
+EndTrackers = List[Tuple[int, int, TrackerWithCachedStates]]
+
+
+class _DomainPickler(pickle.Pickler):
+    """Pickles references to the domain instead of the domain itself."""
+
+    def __init__(self, file: io.BytesIO, domain: Domain) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._domain = domain
+
+    def persistent_id(self, obj: Any) -> Optional[Text]:
+        return "domain" if obj is self._domain else None
+
+
+class _DomainUnpickler(pickle.Unpickler):
+    """Replaces references to the domain with the domain of this process."""
+
+    def __init__(self, file: io.BytesIO, domain: Domain) -> None:
+        super().__init__(file)
+        self._domain = domain
+
+    def persistent_load(self, pid: Text) -> Domain:
+        if pid != "domain":
+            raise pickle.UnpicklingError(f"Unknown persistent id '{pid}'.")
+        return self._domain
+
+
+def _dumps(obj: Any, domain: Domain) -> bytes:
+    file = io.BytesIO()
+    _DomainPickler(file, domain).dump(obj)
+    return file.getvalue()
+
+
+def _loads(data: bytes, domain: Domain) -> Any:
+    return _DomainUnpickler(io.BytesIO(data), domain).load()
+
+
+def _apply_step_events(
+    block_name: Text,
+    source_name: Text,
+    events: List[Event],
+    incoming_trackers: List[TrackerWithCachedStates],
+) -> Tuple[List[TrackerWithCachedStates], EndTrackers]:
+    """Applies the events of a story step to copies of the incoming trackers.
+
+    Args:
+        block_name: Name of the story step.
+        source_name: File which contains the story step.
+        events: The events of the story step.
+        incoming_trackers: The trackers which reached the story step.
+
+    Returns:
+        The trackers which handled the events of the step and the trackers which
+        ended within the step.
+    """
+    # need to copy the tracker as multiple story steps
+    # might start with the same checkpoint and all of them
+    # will use the same set of incoming trackers
+    trackers = []
+    for tracker in incoming_trackers:
+        # sender id is used to be able for a human to see where the
+        # messages and events for this tracker came from - to do this
+        # we concatenate the story block names of the blocks that
+        # contribute to the trackers events
+        if tracker.sender_id:
+            if block_name not in tracker.sender_id.split(" > "):
+                new_sender = tracker.sender_id + " > " + block_name
+            else:
+                new_sender = tracker.sender_id
+        else:
+            new_sender = block_name
+        trackers.append(tracker.copy(new_sender, source_name))
+
+    end_trackers = []
+    for event_index, event in enumerate(events):
+        for tracker_index, tracker in enumerate(trackers):
+            if isinstance(event, (ActionReverted, UserUtteranceReverted, Restarted)):
+                end_trackers.append(
+                    (event_index, tracker_index, tracker.copy(tracker.sender_id))
+                )
+            tracker.update(event)
+
+    return trackers, end_trackers
+
+
+# the domain of a worker process in case trackers are generated in a process pool
+_worker_process_domain: Optional[Domain] = None
+
+
+def _init_worker_process(domain: Domain) -> None:
+    global _worker_process_domain
+    _worker_process_domain = domain
+
+
+def _apply_step_events_in_worker_process(payload: bytes) -> bytes:
+    result = _apply_step_events(*_loads(payload, _worker_process_domain))
+    return _dumps(result, _worker_process_domain)
+
 
 class TrainingDataGenerator:
     def __init__(
@@ -234,13 +462,18 @@ class TrainingDataGenerator:
         tracker_limit: Optional[int] = None,
         use_story_concatenation: bool = True,
         debug_plots: bool = False,
+        story_generation_workers: int = 1,
     ):
         """Given a set of story parts, generates all stories that are possible.
 
         The different story parts can end and start with checkpoints
         and this generator will match start and end checkpoints to
         connect complete stories. Afterwards, duplicate stories will be
-        removed and the data is augmented (if augmentation is enabled)."""
+        removed and the data is augmented (if augmentation is enabled).
+
+        If `story_generation_workers` is greater than `1`, the trackers which
+        reach a story step are split between that many worker processes. The
+        generated trackers are the same as with a single process."""
 
         self.story_graph = story_graph.with_cycles_removed()
         if debug_plots:
@@ -258,10 +491,13 @@ class TrainingDataGenerator:
             max_number_of_augmented_trackers=max_number_of_augmented_trackers,
             tracker_limit=tracker_limit,
             use_story_concatenation=use_story_concatenation,
+            story_generation_workers=max(story_generation_workers or 1, 1),
             rand=random.Random(42),
         )
         # hashed featurization of all finished trackers
         self.hashed_featurizations = set()
+        # worker processes which process the story steps while trackers are generated
+        self._executor: Optional[ProcessPoolExecutor] = None
 
     @staticmethod
     def _phase_name(everything_reachable_is_reached: bool, phase: int) -> Text:
@@ -303,6 +539,32 @@ class TrainingDataGenerator:
 
     def _generate(
         self, story_steps: List[StoryStep], is_rule_data: bool = False
+    ) -> List[TrackerWithCachedStates]:
+        with self._worker_processes():
+            return self._generate_trackers(story_steps, is_rule_data)
+
+    @contextmanager
+    def _worker_processes(self) -> Generator[None, None, None]:
+        if self.config.story_generation_workers <= 1:
+            yield
+            return
+
+        # every worker process receives the domain only once. The processes are
+        # spawned as TensorFlow might already be running (e.g. after NLU training).
+        self._executor = ProcessPoolExecutor(
+            self.config.story_generation_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker_process,
+            initargs=(self.domain,),
+        )
+        try:
+            yield
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _generate_trackers(
+        self, story_steps: List[StoryStep], is_rule_data: bool
     ) -> List[TrackerWithCachedStates]:
         if not story_steps:
             logger.debug(f"No {'rules' if is_rule_data else 'story blocks'} found.")
@@ -627,29 +889,9 @@ class TrainingDataGenerator:
         data while processing the story step."""
 
         events = step.explicit_events(self.domain)
+        if not events:  # small optimization
+            return [], []
 
-        trackers = []
-        if events:  # small optimization
-
-            # need to copy the tracker as multiple story steps
-            # might start with the same checkpoint and all of them
-            # will use the same set of incoming trackers
-
-            for tracker in incoming_trackers:
-                # sender id is used to be able for a human to see where the
-                # messages and events for this tracker came from - to do this
-                # we concatenate the story block names of the blocks that
-                # contribute to the trackers events
-                if tracker.sender_id:
-                    if step.block_name not in tracker.sender_id.split(" > "):
-                        new_sender = tracker.sender_id + " > " + step.block_name
-                    else:
-                        new_sender = tracker.sender_id
-                else:
-                    new_sender = step.block_name
-                trackers.append(tracker.copy(new_sender, step.source_name))
-
-        end_trackers = []
         for event in events:
             if (
                 isinstance(event, ActionExecuted)
@@ -662,26 +904,68 @@ class TrainingDataGenerator:
                     f"'{event.action_text}', which is not part "
                     f"of the training data / domain."
                 )
-            for tracker in trackers:
-                if isinstance(
-                    event, (ActionReverted, UserUtteranceReverted, Restarted)
-                ):
-                    end_trackers.append(tracker.copy(tracker.sender_id))
-                if isinstance(step, RuleStep):
-                    # The rules can specify that a form or a slot shouldn't be set,
-                    # therefore we need to distinguish between not set
-                    # and explicitly set to None
-                    if isinstance(event, ActiveLoop) and event.name is None:
-                        event.name = SHOULD_NOT_BE_SET
-
-                    if isinstance(event, SlotSet) and event.value is None:
-                        event.value = SHOULD_NOT_BE_SET
-
-                tracker.update(event)
+            if isinstance(step, RuleStep):
+                # The rules can specify that a form or a slot shouldn't be set,
+                # therefore we need to distinguish between not set
+                # and explicitly set to None
+                if isinstance(event, ActiveLoop) and event.name is None:
+                    event.name = SHOULD_NOT_BE_SET
+
+                if isinstance(event, SlotSet) and event.value is None:
+                    event.value = SHOULD_NOT_BE_SET
+
+        chunks = self._split_between_workers(incoming_trackers)
+        if len(chunks) > 1:
+            payloads = [
+                _dumps((step.block_name, step.source_name, events, chunk), self.domain)
+                for chunk in chunks
+            ]
+            results = [
+                _loads(result, self.domain)
+                for result in self._executor.map(
+                    _apply_step_events_in_worker_process, payloads
+                )
+            ]
+        else:
+            results = [
+                _apply_step_events(
+                    step.block_name, step.source_name, events, incoming_trackers
+                )
+            ]
+
+        trackers = []
+        end_trackers: EndTrackers = []
+        for chunk_trackers, chunk_end_trackers in results:
+            end_trackers.extend(
+                (event_index, len(trackers) + tracker_index, tracker)
+                for event_index, tracker_index, tracker in chunk_end_trackers
+            )
+            trackers.extend(chunk_trackers)
+        # keep the order in which a single process creates the end trackers
+        end_trackers.sort(key=lambda end_tracker: end_tracker[:2])
 
         # end trackers should be returned separately
         # to avoid using them for augmentation
-        return trackers, end_trackers
+        return trackers, [tracker for _, _, tracker in end_trackers]
+
+    def _split_between_workers(
+        self, trackers: List[TrackerWithCachedStates]
+    ) -> List[List[TrackerWithCachedStates]]:
+        if self._executor is None:
+            return [trackers]
+
+        num_chunks = min(
+            self.config.story_generation_workers,
+            len(trackers) // MIN_TRACKERS_PER_WORKER,
+        )
+        if num_chunks <= 1:
+            return [trackers]
+
+        chunk_size = math.ceil(len(trackers) / num_chunks)
+        return [
+            trackers[start : start + chunk_size]
+            for start in range(0, len(trackers), chunk_size)
+        ]
 
     def _remove_duplicate_trackers(
         self, trackers: List[TrackerWithCachedStates]
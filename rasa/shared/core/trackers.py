@@ -1,4 +1,6 @@
 import copy
+import itertools
+import json
 import logging
 import os
 import time
@@ -60,7 +62,7 @@ from rasa.shared.core.events import (
     EntitiesAdded,
     DefinePrevUserUtteredFeaturization,
 )
-from rasa.shared.core.domain import Domain, State
+from rasa.shared.core.domain import Domain, State, TrackerHistoryStates
 from rasa.shared.core.slots import Slot
 
 if TYPE_CHECKING:
@@ -122,6 +124,91 @@ class AnySlotDict(dict):
         return True
 
 
+class _PastStatesCache:
+    """Caches the states which were created for the history of a tracker.
+
+    The cached states are extended with the states for new events as long as the
+    tracker's applied events only grew since the states were created. Any other
+    change (e.g. due to `Restarted`, `ActionReverted` or `UserUtteranceReverted`
+    events) requires to create the states from scratch.
+    """
+
+    def __init__(
+        self, tracker: "DialogueStateTracker", history_states: TrackerHistoryStates
+    ) -> None:
+        self.replay_tracker = tracker.init_copy()
+        self.history_states = history_states
+        self.applied_events: List[Event] = []
+        # number of cached states which used the current latest user message
+        self._states_since_latest_message = 0
+
+    def _is_extension(self, applied_events: List[Event]) -> bool:
+        if len(applied_events) < len(self.applied_events):
+            return False
+
+        if any(
+            cached_event is not event
+            for cached_event, event in zip(self.applied_events, applied_events)
+        ):
+            return False
+
+        # these events change the latest user message which might already have been
+        # used for the creation of cached states
+        cached_states_use_latest_message = self._states_since_latest_message > 0
+        for event in applied_events[len(self.applied_events) :]:
+            if isinstance(event, UserUttered):
+                cached_states_use_latest_message = False
+            elif cached_states_use_latest_message and isinstance(
+                event, (EntitiesAdded, DefinePrevUserUtteredFeaturization)
+            ):
+                return False
+
+        return True
+
+    def extend(self, applied_events: List[Event]) -> bool:
+        """Creates the states for the applied events which were added to the tracker.
+
+        Args:
+            applied_events: All applied events of the tracker.
+
+        Returns:
+            `False` if the cached states can't be extended and have to be created
+            from scratch.
+        """
+        if not self._is_extension(applied_events):
+            return False
+
+        for event in applied_events[len(self.applied_events) :]:
+            if isinstance(event, ActionExecuted):
+                self.history_states.add_state(self.replay_tracker, event.hide_rule_turn)
+                self._states_since_latest_message += 1
+            elif isinstance(event, UserUttered):
+                self._states_since_latest_message = 0
+
+            self.replay_tracker.update(event)
+            self.applied_events.append(event)
+
+        return True
+
+    def states(self) -> List[State]:
+        """Returns a copy of the cached states including the current state."""
+        history_states = self.history_states.copy()
+        history_states.add_state(self.replay_tracker, False)
+
+        # states might share sub states, the copies have to do the same
+        sub_state_copies = {}
+        states = []
+        for state in history_states.states:
+            state_copy = {}
+            for key, sub_state in state.items():
+                if id(sub_state) not in sub_state_copies:
+                    sub_state_copies[id(sub_state)] = dict(sub_state)
+                state_copy[key] = sub_state_copies[id(sub_state)]
+            states.append(state_copy)
+
+        return states
+
+
 class DialogueStateTracker:
     """Maintains the state of a conversation.
 
@@ -221,6 +308,17 @@ class DialogueStateTracker:
         self._reset()
         self.active_loop: "TrackerActiveLoop" = {}
 
+        # number of events which were appended to the tracker, including the ones
+        # which `events` dropped because of `max_event_history`
+        self.appended_event_count = 0
+        # number of appended events (counted from the first one) which are stored in
+        # a tracker store, `None` if the tracker store wasn't involved yet
+        self.persisted_event_count: Optional[int] = None
+
+        # states of the history which were created for the prediction
+        self._past_states_domain: Optional[Domain] = None
+        self._past_states_caches: Dict[Tuple, _PastStatesCache] = {}
+
     ###
     # Public tracker interface
     ###
@@ -300,6 +398,9 @@ class DialogueStateTracker:
     ) -> List[State]:
         """Generates the past states of this tracker based on the history.
 
+        The states are cached, so that subsequent calls only have to create the
+        states for events which were added in the meantime.
+
         Args:
             domain: The Domain.
             omit_unset_slots: If `True` do not include the initial values of slots.
@@ -311,12 +412,32 @@ class DialogueStateTracker:
         Returns:
             A list of states
         """
-        return domain.states_for_tracker_history(
-            self,
-            omit_unset_slots=omit_unset_slots,
-            ignore_rule_only_turns=ignore_rule_only_turns,
-            rule_only_data=rule_only_data,
+        if self._past_states_domain is not domain:
+            self._past_states_domain = domain
+            self._past_states_caches = {}
+
+        cache_key = (
+            omit_unset_slots,
+            ignore_rule_only_turns,
+            json.dumps(rule_only_data, sort_keys=True) if rule_only_data else None,
         )
+        applied_events = self.applied_events()
+
+        cache = self._past_states_caches.get(cache_key)
+        if cache is None or not cache.extend(applied_events):
+            cache = _PastStatesCache(
+                self,
+                TrackerHistoryStates(
+                    domain,
+                    omit_unset_slots=omit_unset_slots,
+                    ignore_rule_only_turns=ignore_rule_only_turns,
+                    rule_only_data=rule_only_data,
+                ),
+            )
+            cache.extend(applied_events)
+            self._past_states_caches[cache_key] = cache
+
+        return cache.states()
 
     def change_loop_to(self, loop_name: Optional[Text]) -> None:
         """Set the currently active loop.
@@ -623,6 +744,7 @@ class DialogueStateTracker:
 
         self._reset()
         self.events.extend(dialogue.events)
+        self.appended_event_count += len(dialogue.events)
         self.replay_events()
 
     def copy(self) -> "DialogueStateTracker":
@@ -654,12 +776,39 @@ class DialogueStateTracker:
 
         return Dialogue(self.sender_id, list(self.events))
 
+    def mark_events_as_persisted(self) -> None:
+        """Marks all current events of the tracker as stored in a tracker store."""
+        self.persisted_event_count = self.appended_event_count
+
+    def unpersisted_events(self) -> Optional[List[Event]]:
+        """Returns the events which weren't stored in a tracker store yet.
+
+        Returns:
+            The events after the persisted ones or `None` if it's unknown which
+            events are persisted.
+        """
+        if self.persisted_event_count is None:
+            return None
+
+        # `events` only contains the latest events if `max_event_history` is set
+        number_of_unpersisted_events = min(
+            self.appended_event_count - self.persisted_event_count, len(self.events)
+        )
+        return list(
+            itertools.islice(
+                self.events,
+                len(self.events) - number_of_unpersisted_events,
+                len(self.events),
+            )
+        )
+
     def update(self, event: Event, domain: Optional[Domain] = None) -> None:
         """Modify the state of the tracker according to an ``Event``. """
         if not isinstance(event, Event):  # pragma: no cover
             raise ValueError("event to log must be an instance of a subclass of Event.")
 
         self.events.append(event)
+        self.appended_event_count += 1
         event.apply_to(self)
 
         if domain and isinstance(event, (UserUttered, EntitiesAdded)):
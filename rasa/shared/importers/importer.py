@@ -79,6 +79,14 @@ class TrainingDataImporter:
 
         raise NotImplementedError()
 
+    def __getstate__(self) -> Dict[Text, Any]:
+        # the results of `cached_method`s are `asyncio` tasks which can't be pickled
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.startswith("_cached_")
+        }
+
     @staticmethod
     def load_from_config(
         config_path: Text,
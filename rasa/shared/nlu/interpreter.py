@@ -26,9 +26,30 @@ class NaturalLanguageInterpreter:
             "Interpreter needs to be able to parse messages into structured output."
         )
 
+    async def parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        """Parses multiple text messages.
+
+        Parses the messages one by one by default. Interpreters which can parse
+        messages more efficiently together should override this.
+
+        Args:
+            texts: The texts to parse.
+
+        Returns:
+            The parse results in the same order as the texts.
+        """
+        return [await self.parse(text) for text in texts]
+
     def featurize_message(self, message: Message) -> Optional[Message]:
         pass
 
+    def close(self) -> None:
+        """Releases the resources of the interpreter (e.g. inference pools).
+
+        Called when the interpreter is replaced or the server shuts down.
+        """
+        pass
+
 
 class RegexInterpreter(NaturalLanguageInterpreter):
     @staticmethod
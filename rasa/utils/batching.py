@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_TIME_IN_SECONDS = 0.005
+
+
+class MicroBatcher:
+    """Groups items which are submitted concurrently into batches.
+
+    Every call to `submit` adds an item to the pending batch and waits for its
+    result. The pending batch is processed as soon as it contains
+    `max_batch_size` items or `max_wait_time_in_seconds` passed since the first
+    item was added to it, whatever comes first.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_time_in_seconds: float = DEFAULT_MAX_WAIT_TIME_IN_SECONDS,
+    ) -> None:
+        """Creates the batcher.
+
+        Args:
+            process_batch: Coroutine function which receives a list of items and
+                returns one result per item (in the same order).
+            max_batch_size: Maximum number of items which are processed together.
+            max_wait_time_in_seconds: Maximum time an item waits for other items
+                before its batch is processed.
+        """
+        if max_batch_size < 1:
+            raise ValueError(
+                f"The maximum batch size has to be at least 1 (got {max_batch_size})."
+            )
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_time_in_seconds = max(0.0, max_wait_time_in_seconds)
+
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+        self.number_of_batches = 0
+        self.number_of_items = 0
+
+    @property
+    def average_batch_size(self) -> float:
+        """Returns the average number of items which were processed per batch."""
+        if not self.number_of_batches:
+            return 0.0
+        return self.number_of_items / self.number_of_batches
+
+    @property
+    def average_batch_fill(self) -> float:
+        """Returns the average batch size relative to the maximum batch size."""
+        return self.average_batch_size / self.max_batch_size
+
+    async def submit(self, item: Any) -> Any:
+        """Adds `item` to the pending batch and waits for its result.
+
+        Args:
+            item: The item which should be processed.
+
+        Returns:
+            The result which `process_batch` returned for `item`.
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.max_wait_time_in_seconds, self._flush
+            )
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size :]
+            asyncio.ensure_future(self._process(batch))
+
+    async def _process(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        # drop items whose callers stopped waiting in the meantime
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        self.number_of_batches += 1
+        self.number_of_items += len(batch)
+
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Processing a batch of {len(batch)} items returned "
+                    f"{len(results)} results."
+                )
+        except Exception as e:  # skipcq: PYL-W0703
+            # the error is raised to every caller which is waiting for this batch
+            logger.debug(f"Failed to process batch of {len(batch)} items: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
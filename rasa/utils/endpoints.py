@@ -1,4 +1,7 @@
+import asyncio
 import ssl
+import time
+import weakref
 
 import aiohttp
 import logging
@@ -10,7 +13,12 @@ from typing import Any, Optional, Text, Dict
 from rasa.shared.exceptions import FileNotFoundException
 import rasa.shared.utils.io
 import rasa.utils.io
-from rasa.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.constants import (
+    DEFAULT_CONNECTION_POOL_SIZE,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -71,8 +79,79 @@ def concat_url(base: Text, subpath: Optional[Text]) -> Text:
     return url + subpath
 
 
+# endpoints and other clients which keep connections open, by `id` so that they are
+# closed on shutdown
+_endpoints_with_sessions: "weakref.WeakValueDictionary[int, Any]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def close_session_on_shutdown(client: Any) -> None:
+    """Registers a client whose connections are closed by `close_sessions`.
+
+    Args:
+        client: Object with a `close` coroutine which closes its connections.
+    """
+    _endpoints_with_sessions[id(client)] = client
+
+
+async def close_sessions() -> None:
+    """Closes the connection pools of all endpoints and registered clients."""
+    for endpoint in list(_endpoints_with_sessions.values()):
+        await endpoint.close()
+
+
+class EndpointMetrics:
+    """Latency and connection pool usage of the requests to an endpoint."""
+
+    def __init__(self, pool_size: int) -> None:
+        self.pool_size = pool_size
+        self.requests = 0
+        self.failed_requests = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.requests_in_flight = 0
+        self.max_requests_in_flight = 0
+
+    def request_started(self) -> float:
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(
+            self.max_requests_in_flight, self.requests_in_flight
+        )
+        return time.perf_counter()
+
+    def request_finished(self, started_at: float, failed: bool) -> None:
+        latency = time.perf_counter() - started_at
+        self.requests_in_flight -= 1
+        self.requests += 1
+        self.failed_requests += int(failed)
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def as_dict(self) -> Dict[Text, Any]:
+        """Returns the metrics, latencies in seconds.
+
+        If `max_requests_in_flight` reaches `pool_size`, requests had to wait for a
+        free connection.
+        """
+        return {
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "mean_latency": self.total_latency / self.requests if self.requests else 0,
+            "max_latency": self.max_latency,
+            "requests_in_flight": self.requests_in_flight,
+            "max_requests_in_flight": self.max_requests_in_flight,
+            "pool_size": self.pool_size,
+        }
+
+
 class EndpointConfig:
-    """Configuration for an external HTTP endpoint."""
+    """Configuration for an external HTTP endpoint.
+
+    Requests are sent through a connection pool which is kept open for the lifetime of
+    the endpoint. Its size, the keep-alive of idle connections and the DNS cache can be
+    configured with the `pool_size`, `keepalive_timeout` and `dns_cache_ttl` keys.
+    """
 
     def __init__(
         self,
@@ -94,8 +173,29 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.cafile = cafile
         self.kwargs = kwargs
+        self._init_connection_pool()
 
-    def session(self) -> aiohttp.ClientSession:
+    def _init_connection_pool(self) -> None:
+        self.metrics = EndpointMetrics(
+            self.kwargs.get("pool_size", DEFAULT_CONNECTION_POOL_SIZE)
+        )
+        # sessions can only be used in the event loop they were created in
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        state = self.__dict__.copy()
+        for runtime_attribute in ["metrics", "_sessions", "_ssl_context"]:
+            del state[runtime_attribute]
+        return state
+
+    def __setstate__(self, state: Dict[Text, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_connection_pool()
+
+    def session(
+        self, connector: Optional[aiohttp.BaseConnector] = None
+    ) -> aiohttp.ClientSession:
         """Creates and returns a configured aiohttp client session."""
         # create authentication parameters
         if self.basic_auth:
@@ -109,8 +209,58 @@ class EndpointConfig:
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            connector=connector,
         )
 
+    def pooled_session(self) -> aiohttp.ClientSession:
+        """Returns the long-lived session of the endpoint for the current event loop.
+
+        The session must not be closed by the caller (see `close`).
+        """
+        loop = asyncio.get_event_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            # sessions of closed event loops can't be used or closed anymore
+            for other_loop in [other for other in self._sessions if other.is_closed()]:
+                del self._sessions[other_loop]
+
+            connector = aiohttp.TCPConnector(
+                limit=self.metrics.pool_size,
+                keepalive_timeout=self.kwargs.get(
+                    "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+                ),
+                ttl_dns_cache=self.kwargs.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL),
+            )
+            session = self._sessions[loop] = self.session(connector)
+            close_session_on_shutdown(self)
+        return session
+
+    async def close(self) -> None:
+        """Closes the connection pool of the current event loop."""
+        session = self._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None and not session.closed:
+            logger.debug(
+                f"Closing connections to '{self.url}'. Request metrics: "
+                f"{self.metrics.as_dict()}."
+            )
+            await session.close()
+
+    def ssl_context(self) -> Optional[ssl.SSLContext]:
+        """Returns the SSL context using the `cafile` of the endpoint if there is one.
+
+        Raises:
+            FileNotFoundException: If the `cafile` does not exist.
+        """
+        if self.cafile and self._ssl_context is None:
+            try:
+                self._ssl_context = ssl.create_default_context(cafile=self.cafile)
+            except FileNotFoundError as e:
+                raise FileNotFoundException(
+                    f"Failed to find certificate file, "
+                    f"'{os.path.abspath(self.cafile)}' does not exist."
+                ) from e
+        return self._ssl_context
+
     def combine_parameters(
         self, kwargs: Optional[Dict[Text, Any]] = None
     ) -> Dict[Text, Any]:
@@ -148,19 +298,12 @@ class EndpointConfig:
             del kwargs["headers"]
 
         url = concat_url(self.url, subpath)
+        sslcontext = self.ssl_context()
 
-        sslcontext = None
-        if self.cafile:
-            try:
-                sslcontext = ssl.create_default_context(cafile=self.cafile)
-            except FileNotFoundError as e:
-                raise FileNotFoundException(
-                    f"Failed to find certificate file, "
-                    f"'{os.path.abspath(self.cafile)}' does not exist."
-                ) from e
-
-        async with self.session() as session:
-            async with session.request(
+        started_at = self.metrics.request_started()
+        failed = True
+        try:
+            async with self.pooled_session().request(
                 method,
                 url,
                 headers=headers,
@@ -172,10 +315,13 @@ class EndpointConfig:
                     raise ClientResponseError(
                         response.status, response.reason, await response.content.read()
                     )
+                failed = False
                 try:
                     return await response.json()
                 except ContentTypeError:
                     return None
+        finally:
+            self.metrics.request_finished(started_at, failed)
 
     @classmethod
     def from_dict(cls, data: Dict[Text, Any]) -> "EndpointConfig":
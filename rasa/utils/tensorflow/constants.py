@@ -91,6 +91,10 @@ SENTENCE_FEATURES = "sentence_features"
 
 FEATURIZERS = "featurizers"
 CHECKPOINT_MODEL = "checkpoint_model"
+PACKED_DATA_DIRECTORY = "packed_data_directory"
+
+INFERENCE_BATCH_SIZE = "inference_batch_size"
+INFERENCE_MAX_WAIT = "inference_max_wait"
 
 MASK = "mask"
 
@@ -1,4 +1,4 @@
-from typing import List, Union, Text, Optional, Any, Tuple, Dict
+from typing import List, Union, Text, Optional, Any, Tuple, Dict, Iterator
 
 import logging
 import scipy.sparse
@@ -6,7 +6,12 @@ import numpy as np
 import tensorflow as tf
 
 from rasa.utils.tensorflow.constants import SEQUENCE, BALANCED
-from rasa.utils.tensorflow.model_data import RasaModelData, Data, FeatureArray
+from rasa.utils.tensorflow.model_data import (
+    RasaModelData,
+    Data,
+    FeatureArray,
+    PackedFeatureArray,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +62,61 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
         """Update the data after every epoch."""
         raise NotImplementedError
 
+    def as_dataset(
+        self,
+        num_parallel_calls: int = tf.data.experimental.AUTOTUNE,
+        prefetch_buffer_size: int = tf.data.experimental.AUTOTUNE,
+    ) -> tf.data.Dataset:
+        """Creates a `tf.data` input pipeline which is fed by this data generator.
+
+        The batches are sliced, padded and converted by a parallel map over the batch
+        indices and are prefetched, so that the next batches are prepared while the
+        model trains on the current one. Every iteration over the dataset covers the
+        batches of the current epoch, so shuffling, balancing and the batch size are
+        still updated by `on_epoch_end`.
+
+        The types and shapes of the batch tensors are inferred once from the first
+        batch. Only the feature dimension is fixed, so that batches of different
+        sizes and sequence lengths don't retrace the training function.
+
+        Args:
+            num_parallel_calls: The number of batches to prepare in parallel.
+            prefetch_buffer_size: The maximum number of prepared batches to buffer.
+
+        Returns:
+            The dataset. Like Keras does it for sequences, every element is a tuple
+            which only contains the input data, as the target data is part of it.
+        """
+        first_batch = self._prepare_batch_at(0)
+        output_types = tuple(tf.as_dtype(array.dtype) for array in first_batch)
+        output_shapes = [self._dynamic_shape(array) for array in first_batch]
+
+        def batch_indices() -> Iterator[int]:
+            # the number of batches is only known at the start of every epoch
+            yield from range(len(self))
+
+        def prepare_batch(index: tf.Tensor) -> Tuple[Tuple[tf.Tensor, ...]]:
+            batch = tf.numpy_function(self._prepare_batch_at, [index], output_types)
+            for tensor, shape in zip(batch, output_shapes):
+                tensor.set_shape(shape)
+            return (tuple(batch),)
+
+        return (
+            tf.data.Dataset.from_generator(batch_indices, output_types=tf.int64)
+            .map(prepare_batch, num_parallel_calls=num_parallel_calls)
+            .prefetch(prefetch_buffer_size)
+        )
+
+    def _prepare_batch_at(self, index: int) -> Tuple[np.ndarray, ...]:
+        batch, _ = self[int(index)]
+        return batch
+
+    @staticmethod
+    def _dynamic_shape(array: np.ndarray) -> List[Optional[int]]:
+        if array.ndim > 1:
+            return [None] * (array.ndim - 1) + [array.shape[-1]]
+        return [None]
+
     def _shuffle_and_balance(self, batch_size: int) -> Data:
         data = self.model_data.data
 
@@ -123,7 +183,9 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
         return tuple(batch_data)
 
     @staticmethod
-    def _pad_dense_data(array_of_dense: FeatureArray) -> np.ndarray:
+    def _pad_dense_data(
+        array_of_dense: Union[FeatureArray, PackedFeatureArray]
+    ) -> np.ndarray:
         """Pad data of different lengths.
 
         Sequential data is padded with zeros. Zeros are added to the end of data.
@@ -137,6 +199,9 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
         if array_of_dense.number_of_dimensions == 4:
             return RasaDataGenerator._pad_4d_dense_data(array_of_dense)
 
+        if isinstance(array_of_dense, PackedFeatureArray):
+            return RasaDataGenerator._pad_packed_dense_data(array_of_dense)
+
         if array_of_dense[0].ndim < 2:
             # data doesn't contain a sequence
             return array_of_dense.astype(np.float32)
@@ -153,6 +218,18 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
 
         return data_padded.astype(np.float32)
 
+    @staticmethod
+    def _pad_packed_dense_data(packed_dense: PackedFeatureArray) -> np.ndarray:
+        rows, example_positions, sequence_positions = packed_dense.rows()
+
+        data_padded = np.zeros(
+            [len(packed_dense), packed_dense.lengths.max(), packed_dense.units],
+            dtype=np.float32,
+        )
+        data_padded[example_positions, sequence_positions] = packed_dense.features[rows]
+
+        return data_padded
+
     @staticmethod
     def _pad_4d_dense_data(array_of_array_of_dense: FeatureArray) -> np.ndarray:
         # in case of dialogue data we may have 4 dimensions
@@ -201,7 +278,9 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
         return data_padded.astype(np.float32)
 
     @staticmethod
-    def _scipy_matrix_to_values(array_of_sparse: FeatureArray) -> List[np.ndarray]:
+    def _scipy_matrix_to_values(
+        array_of_sparse: Union[FeatureArray, PackedFeatureArray]
+    ) -> List[np.ndarray]:
         """Convert a scipy matrix into indices, data, and shape.
 
         Args:
@@ -213,6 +292,9 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
         if array_of_sparse.number_of_dimensions == 4:
             return RasaDataGenerator._4d_scipy_matrix_to_values(array_of_sparse)
 
+        if isinstance(array_of_sparse, PackedFeatureArray):
+            return RasaDataGenerator._packed_scipy_matrix_to_values(array_of_sparse)
+
         # we need to make sure that the matrices are coo_matrices otherwise the
         # transformation does not work (e.g. you cannot access x.row, x.col)
         if not isinstance(array_of_sparse[0], scipy.sparse.coo_matrix):
@@ -239,6 +321,33 @@ class RasaDataGenerator(tf.keras.utils.Sequence):
             shape.astype(np.int64),
         ]
 
+    @staticmethod
+    def _packed_scipy_matrix_to_values(
+        packed_sparse: PackedFeatureArray,
+    ) -> List[np.ndarray]:
+        rows, example_positions, sequence_positions = packed_sparse.rows()
+
+        # only the rows of the batch are copied
+        batch = packed_sparse.features[rows].tocoo()
+
+        indices = np.stack(
+            [
+                example_positions[batch.row],
+                sequence_positions[batch.row],
+                batch.col,
+            ],
+            axis=1,
+        )
+        shape = np.array(
+            (len(packed_sparse), packed_sparse.lengths.max(), packed_sparse.units)
+        )
+
+        return [
+            indices.astype(np.int64),
+            batch.data.astype(np.float32),
+            shape.astype(np.int64),
+        ]
+
     @staticmethod
     def _4d_scipy_matrix_to_values(
         array_of_array_of_sparse: FeatureArray,
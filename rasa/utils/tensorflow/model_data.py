@@ -1,4 +1,5 @@
 import logging
+import os
 
 import numpy as np
 import scipy.sparse
@@ -14,6 +15,7 @@ from typing import (
     Union,
     NamedTuple,
     ItemsView,
+    Iterator,
 )
 from collections import defaultdict, OrderedDict
 
@@ -211,6 +213,208 @@ class FeatureArray(np.ndarray):
             )
 
 
+class PackedFeatureArray:
+    """Stores the sequence features of all examples in a single block.
+
+    A `FeatureArray` of sequence features is an object array which holds one matrix
+    per example. A packed feature array instead stacks the rows of all examples
+    into one CSR matrix (sparse features) or one 2D array (dense features) and keeps
+    the offsets of the first row of every example. Selecting examples, e.g. to
+    shuffle, split, balance or batch the data, only selects from the example ids, so
+    the features themselves are shared and never copied.
+    """
+
+    number_of_dimensions = 3
+
+    def __init__(
+        self,
+        features: Union[scipy.sparse.csr_matrix, np.ndarray],
+        offsets: np.ndarray,
+        example_ids: Optional[np.ndarray] = None,
+    ) -> None:
+        """Creates the packed feature array.
+
+        Args:
+            features: The stacked rows of all examples.
+            offsets: The index of the first row of every example followed by the
+                total number of rows.
+            example_ids: The examples which are part of this array. Defaults to all
+                examples.
+        """
+        self.features = features
+        self.offsets = offsets
+        if example_ids is None:
+            example_ids = np.arange(len(offsets) - 1)
+        self.example_ids = example_ids
+
+    @staticmethod
+    def can_pack(feature_array: FeatureArray) -> bool:
+        """Checks whether a feature array holds one sequence matrix per example.
+
+        Args:
+            feature_array: The feature array.
+
+        Returns:
+            `True` if the feature array can be packed.
+        """
+        return (
+            isinstance(feature_array, FeatureArray)
+            and feature_array.number_of_dimensions == 3
+            and feature_array.dtype == object
+            and len(feature_array) > 0
+        )
+
+    @classmethod
+    def from_feature_array(cls, feature_array: FeatureArray) -> "PackedFeatureArray":
+        """Packs a feature array which holds one sequence matrix per example.
+
+        Args:
+            feature_array: The feature array.
+
+        Returns:
+            The packed feature array.
+        """
+        lengths = [example.shape[0] for example in feature_array]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+        # the features are converted to `float32` anyway when batches are created
+        if feature_array.is_sparse:
+            features = scipy.sparse.vstack(
+                list(feature_array), format="csr", dtype=np.float32
+            )
+        else:
+            features = np.concatenate(list(feature_array)).astype(np.float32)
+
+        return cls(features, offsets)
+
+    @staticmethod
+    def concatenate(arrays: List["PackedFeatureArray"]) -> "PackedFeatureArray":
+        """Concatenates the examples of packed feature arrays with the same features.
+
+        Args:
+            arrays: The packed feature arrays.
+
+        Returns:
+            The combined packed feature array.
+        """
+        return PackedFeatureArray(
+            arrays[0].features,
+            arrays[0].offsets,
+            np.concatenate([array.example_ids for array in arrays]),
+        )
+
+    @property
+    def is_sparse(self) -> bool:
+        """Whether the features are sparse."""
+        return scipy.sparse.issparse(self.features)
+
+    @property
+    def units(self) -> int:
+        """The number of features."""
+        return self.features.shape[-1]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """The sequence length of every example."""
+        return self.offsets[self.example_ids + 1] - self.offsets[self.example_ids]
+
+    def rows(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gets the rows of all examples in this array.
+
+        Returns:
+            The indices of the rows in the packed features, the position of the
+            example of every row and the position of every row inside its sequence.
+        """
+        lengths = self.lengths
+        example_positions = np.repeat(np.arange(len(lengths)), lengths)
+        sequence_starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        sequence_positions = np.arange(lengths.sum()) - sequence_starts
+        rows = np.repeat(self.offsets[self.example_ids], lengths) + sequence_positions
+
+        return rows, example_positions, sequence_positions
+
+    def memory_mapped(self, directory: Text) -> "PackedFeatureArray":
+        """Writes the features to disk and maps them into memory from there.
+
+        Args:
+            directory: The directory to write the features to.
+
+        Returns:
+            The packed feature array with memory mapped features.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        def mapped(name: Text, array: np.ndarray) -> np.ndarray:
+            path = os.path.join(directory, f"{name}.npy")
+            np.save(path, array)
+            return np.load(path, mmap_mode="r")
+
+        if self.is_sparse:
+            features = scipy.sparse.csr_matrix(
+                (
+                    mapped("data", self.features.data),
+                    mapped("indices", self.features.indices),
+                    mapped("indptr", self.features.indptr),
+                ),
+                shape=self.features.shape,
+                copy=False,
+            )
+        else:
+            features = mapped("features", self.features)
+
+        return PackedFeatureArray(features, self.offsets, self.example_ids)
+
+    def __len__(self) -> int:
+        """The number of examples."""
+        return len(self.example_ids)
+
+    def __getitem__(
+        self, key: Union[int, slice, np.ndarray]
+    ) -> Union[scipy.sparse.csr_matrix, np.ndarray, "PackedFeatureArray"]:
+        """Gets the features of an example or selects examples.
+
+        Args:
+            key: The position of an example or any numpy index which selects
+                examples.
+
+        Returns:
+            The sequence matrix of a single example or a packed feature array which
+            shares the features with this one.
+        """
+        if isinstance(key, (int, np.integer)):
+            example_id = self.example_ids[key]
+            return self.features[
+                self.offsets[example_id] : self.offsets[example_id + 1]
+            ]
+
+        return PackedFeatureArray(self.features, self.offsets, self.example_ids[key])
+
+    def __iter__(self) -> Iterator[Union[scipy.sparse.csr_matrix, np.ndarray]]:
+        """Iterates over the sequence matrices of the examples."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        """Gets the state for pickling.
+
+        Only the rows of the examples in this array are pickled, e.g. for the data
+        example which is persisted with a model.
+        """
+        rows, _, _ = self.rows()
+        features = self.features[rows]
+        if not self.is_sparse:
+            # don't keep a reference to memory mapped features
+            features = np.array(features)
+
+        return {
+            "features": features,
+            "offsets": np.concatenate([[0], np.cumsum(self.lengths)]).astype(
+                np.int64
+            ),
+            "example_ids": np.arange(len(self)),
+        }
+
+
 class FeatureSignature(NamedTuple):
     """Signature of feature arrays.
 
@@ -230,7 +434,7 @@ class FeatureSignature(NamedTuple):
 #   "feature array containing dense features for every training example",
 #   "feature array containing sparse features for every training example"
 # ]}
-Data = Dict[Text, Dict[Text, List[FeatureArray]]]
+Data = Dict[Text, Dict[Text, List[Union[FeatureArray, PackedFeatureArray]]]]
 
 
 class RasaModelData:
@@ -335,7 +539,13 @@ class RasaModelData:
         for key, attribute_data in self.data.items():
             out_data[key] = {}
             for sub_key, features in attribute_data.items():
-                out_data[key][sub_key] = [feature[:1] for feature in features]
+                # views would keep all examples of the feature arrays alive
+                out_data[key][sub_key] = [
+                    feature[:1].copy()
+                    if isinstance(feature, np.ndarray)
+                    else feature[:1]
+                    for feature in features
+                ]
         return out_data
 
     def does_feature_exist(self, key: Text, sub_key: Optional[Text] = None) -> bool:
@@ -571,20 +781,14 @@ class RasaModelData:
         """
         self._check_label_key()
 
+        # the examples are split by their ids, so that the features are only selected
+        # once for the train and once for the test data
+        example_ids = np.arange(self.num_examples)
+
         if self.label_key is None or self.label_sub_key is None:
             # randomly split data as no label key is set
-            multi_values = [
-                v
-                for attribute_data in self.data.values()
-                for data in attribute_data.values()
-                for v in data
-            ]
-            solo_values = [
-                []
-                for attribute_data in self.data.values()
-                for data in attribute_data.values()
-                for _ in data
-            ]
+            multi_ids = example_ids
+            solo_ids = np.array([], dtype=example_ids.dtype)
             stratify = None
         else:
             # make sure that examples for each label value are in both split sets
@@ -600,30 +804,65 @@ class RasaModelData:
             # which insures every label is present in the train and test data
             # this operation can be performed only for labels
             # that contain several data points
-            multi_values = [
-                f[counts > 1]
-                for attribute_data in self.data.values()
-                for features in attribute_data.values()
-                for f in features
-            ]
+            multi_ids = example_ids[counts > 1]
             # collect data points that are unique for their label
-            solo_values = [
-                f[counts == 1]
-                for attribute_data in self.data.values()
-                for features in attribute_data.values()
-                for f in features
-            ]
+            solo_ids = example_ids[counts == 1]
 
             stratify = label_ids[counts > 1]
 
-        output_values = train_test_split(
-            *multi_values,
+        train_ids, test_ids = train_test_split(
+            multi_ids,
             test_size=number_of_test_examples,
             random_state=random_seed,
             stratify=stratify,
         )
 
-        return self._convert_train_test_split(output_values, solo_values)
+        return (
+            RasaModelData(
+                self.label_key,
+                self.label_sub_key,
+                self._data_for_ids(self.data, np.concatenate([train_ids, solo_ids])),
+            ),
+            RasaModelData(
+                self.label_key,
+                self.label_sub_key,
+                self._data_for_ids(self.data, test_ids),
+            ),
+        )
+
+    def packed(self, directory: Optional[Text] = None) -> "RasaModelData":
+        """Creates a copy of the model data with packed sequence features.
+
+        Feature arrays which hold one sequence matrix per example are replaced by
+        `PackedFeatureArray`s, so that shuffling, balancing and batching the data
+        during training don't copy every sequence matrix. The labels and all other
+        features (including features which are packed already) are shared with this
+        model data. Rebind the variables which refer to this model data to the
+        returned copy, so that the unpacked features can be freed before training.
+
+        Args:
+            directory: If given, the packed features are written to this directory
+                and memory mapped from there instead of being kept in memory.
+
+        Returns:
+            The model data with packed features.
+        """
+        data = defaultdict(lambda: defaultdict(list))
+        for key, attribute_data in self.data.items():
+            for sub_key, features in attribute_data.items():
+                is_label = key == self.label_key and sub_key == self.label_sub_key
+                for index, f in enumerate(features):
+                    if not is_label and PackedFeatureArray.can_pack(f):
+                        f = PackedFeatureArray.from_feature_array(f)
+                        if directory:
+                            f = f.memory_mapped(
+                                os.path.join(directory, f"{key}_{sub_key}_{index}")
+                            )
+                    data[key][sub_key].append(f)
+
+        model_data = RasaModelData(self.label_key, self.label_sub_key, data)
+        model_data.sparse_feature_sizes = self.sparse_feature_sizes
+        return model_data
 
     def get_signature(
         self, data: Optional[Data] = None
@@ -745,6 +984,12 @@ class RasaModelData:
         for key, attribute_data in new_data.items():
             for sub_key, features in attribute_data.items():
                 for f in features:
+                    if isinstance(f[0], PackedFeatureArray):
+                        final_data[key][sub_key].append(
+                            PackedFeatureArray.concatenate(f)
+                        )
+                        continue
+
                     final_data[key][sub_key].append(
                         FeatureArray(
                             np.concatenate(np.array(f)),
@@ -844,81 +1089,6 @@ class RasaModelData:
                 f"Key '{self.label_key}.{self.label_sub_key}' not in RasaModelData."
             )
 
-    def _convert_train_test_split(
-        self, output_values: List[Any], solo_values: List[Any]
-    ) -> Tuple["RasaModelData", "RasaModelData"]:
-        """Converts the output of sklearn's train_test_split into model data.
-
-        Args:
-            output_values: output values of sklearn's train_test_split
-            solo_values: list of solo values
-
-        Returns:
-            The test and train RasaModelData
-        """
-        data_train = defaultdict(lambda: defaultdict(list))
-        data_val = defaultdict(lambda: defaultdict(list))
-
-        # output_values = x_train, x_val, y_train, y_val, z_train, z_val, etc.
-        # order is kept, e.g. same order as model data keys
-
-        # train datasets have an even index
-        index = 0
-        for key, attribute_data in self.data.items():
-            for sub_key, features in attribute_data.items():
-                for f in features:
-                    data_train[key][sub_key].append(
-                        self._combine_features(
-                            output_values[index * 2],
-                            solo_values[index],
-                            f.number_of_dimensions,
-                        )
-                    )
-                    index += 1
-
-        # val datasets have an odd index
-        index = 0
-        for key, attribute_data in self.data.items():
-            for sub_key, features in attribute_data.items():
-                for _ in features:
-                    data_val[key][sub_key].append(output_values[(index * 2) + 1])
-                    index += 1
-
-        return (
-            RasaModelData(self.label_key, self.label_sub_key, data_train),
-            RasaModelData(self.label_key, self.label_sub_key, data_val),
-        )
-
-    @staticmethod
-    def _combine_features(
-        feature_1: Union[np.ndarray, scipy.sparse.spmatrix],
-        feature_2: Union[np.ndarray, scipy.sparse.spmatrix],
-        number_of_dimensions: Optional[int] = 1,
-    ) -> FeatureArray:
-        """Concatenate features.
-
-        Args:
-            feature_1: Features to concatenate.
-            feature_2: Features to concatenate.
-
-        Returns:
-            The combined features.
-        """
-        if isinstance(feature_1, scipy.sparse.spmatrix) and isinstance(
-            feature_2, scipy.sparse.spmatrix
-        ):
-            if feature_2.shape[0] == 0:
-                return FeatureArray(feature_1, number_of_dimensions)
-            if feature_1.shape[0] == 0:
-                return FeatureArray(feature_2, number_of_dimensions)
-            return FeatureArray(
-                scipy.sparse.vstack([feature_1, feature_2]), number_of_dimensions
-            )
-
-        return FeatureArray(
-            np.concatenate([feature_1, feature_2]), number_of_dimensions
-        )
-
     @staticmethod
     def _create_label_ids(label_ids: FeatureArray) -> np.ndarray:
         """Convert various size label_ids into single dim array.
@@ -21,6 +21,8 @@ from tensorflow.python.keras.utils import version_utils
 from tensorflow.python.eager import context
 from tensorflow.python.keras.engine.data_adapter import DataHandler
 
+from rasa.utils.tensorflow.data_generator import RasaDataGenerator
+
 
 # noinspection PyMethodOverriding
 class TmpKerasModel(tf.keras.models.Model):
@@ -244,6 +246,23 @@ class TmpKerasModel(tf.keras.models.Model):
 class CustomDataHandler(DataHandler):
     """Handles iterating over epoch-level `tf.data.Iterator` objects."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the data handler.
+
+        In case the input data is a `RasaDataGenerator`, the dataset which Keras
+        creates for it is replaced with the pipeline of the data generator. Keras
+        prepares the batches of a sequence one after another on the main thread,
+        while the data generator pipeline prepares them in parallel to training.
+        """
+        super().__init__(*args, **kwargs)
+
+        data_generator = getattr(self._adapter, "_keras_sequence", None)
+        if isinstance(data_generator, RasaDataGenerator):
+            strategy = tf.distribute.get_strategy()
+            self._dataset = strategy.experimental_distribute_dataset(
+                data_generator.as_dataset()
+            )
+
     def enumerate_epochs(self) -> Generator[Tuple[int, Iterator], None, None]:
         """Yields `(epoch, tf.data.Iterator)`."""
         # TODO
@@ -255,7 +274,9 @@ class CustomDataHandler(DataHandler):
         # https://github.com/tensorflow/tensorflow/blob/v2.3.1/tensorflow/python/keras/engine/data_adapter.py#L1135-L1145
 
         with self._truncate_execution_to_epoch():
-            data_iterator = iter(self._dataset)
+            # the iterator is only created once it is needed, as creating it already
+            # starts prefetching batches
+            data_iterator = None
             for epoch in range(self._initial_epoch, self._epochs):
                 if self._insufficient_data:  # Set by `catch_stop_iteration`.
                     break
@@ -264,5 +285,7 @@ class CustomDataHandler(DataHandler):
                     # update number of steps for epoch as we might have an increasing
                     # batch size
                     self._inferred_steps = len(self._adapter._keras_sequence)
+                elif data_iterator is None:
+                    data_iterator = iter(self._dataset)
                 yield epoch, data_iterator
                 self._adapter.on_epoch_end()
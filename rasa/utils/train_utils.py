@@ -1,7 +1,21 @@
+import contextlib
 from pathlib import Path
 import copy
+import os
+import shutil
+import tempfile
 import numpy as np
-from typing import Optional, Text, Dict, Any, Union, List, Tuple, TYPE_CHECKING
+from typing import (
+    Optional,
+    Text,
+    Dict,
+    Any,
+    Union,
+    List,
+    Tuple,
+    TYPE_CHECKING,
+    Iterator,
+)
 
 import rasa.shared.utils.common
 import rasa.shared.utils.io
@@ -452,6 +466,30 @@ def create_data_generators(
     return data_generator, validation_data_generator
 
 
+@contextlib.contextmanager
+def packed_data_directory(directory: Optional[Text]) -> Iterator[Optional[Text]]:
+    """Provides a directory for the packed training data of a single training.
+
+    Args:
+        directory: The configured directory for packed training data or `None` to
+            keep the packed training data in memory.
+
+    Yields:
+        A temporary directory inside `directory`, which is removed again once the
+        training is done, or `None` if no directory was configured.
+    """
+    if not directory:
+        yield None
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    training_directory = tempfile.mkdtemp(prefix="packed-", dir=directory)
+    try:
+        yield training_directory
+    finally:
+        shutil.rmtree(training_directory, ignore_errors=True)
+
+
 def create_common_callbacks(
     epochs: int,
     tensorboard_log_dir: Optional[Text] = None,
@@ -1,9 +1,18 @@
+import asyncio
+import copy
+import json
 import logging
-from typing import Text, Any, Dict, Optional, List
+import time
+from collections import OrderedDict
+from typing import Text, Any, Dict, Optional, List, Tuple
+
+import aiohttp
+
 from rasa_addons.core.nlg.nlg_helper import rewrite_url
 from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.nlg.generator import NaturalLanguageGenerator
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
+import rasa.utils.endpoints
 from rasa.utils.endpoints import EndpointConfig
 import os
 import urllib.error
@@ -11,6 +20,12 @@ from rasa.core.nlg.interpolator import interpolate
 
 logger = logging.getLogger(__name__)
 
+# maximum number of connections to the NLG endpoint which are kept open
+DEFAULT_NLG_POOL_SIZE = 100
+# number of responses which are cached (a TTL of `0` seconds disables the cache)
+DEFAULT_NLG_CACHE_SIZE = 1000
+DEFAULT_NLG_CACHE_TTL = 0
+
 
 NLG_QUERY = """
 fragment CarouselElementFields on CarouselElement {
@@ -89,11 +104,20 @@ def nlg_request_format(
     template_name: Text,
     tracker: DialogueStateTracker,
     output_channel: Text,
+    include_events: bool = True,
     **kwargs: Any,
 ) -> Dict[Text, Any]:
-    """Create the json body for the NLG json body for the request."""
+    """Create the json body for the NLG json body for the request.
 
-    tracker_state = tracker.current_state(EventVerbosity.ALL)
+    If `include_events` is `False`, the events of the tracker are left out since
+    the NLG only needs the current conversation state.
+    """
+
+    if include_events:
+        tracker_state = tracker.current_state(EventVerbosity.ALL)
+    else:
+        tracker_state = tracker.current_state(EventVerbosity.NONE)
+        tracker_state["events"] = []
 
     return {
         "template": template_name,
@@ -103,17 +127,151 @@ def nlg_request_format(
     }
 
 
+class _ResponseCache:
+    """Least recently used cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expiration_time, value = entry
+        if expiration_time < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        # responses are modified by the caller
+        return copy.deepcopy(value)
+
+    def set(self, key: Tuple, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+async def _close_session(session: aiohttp.ClientSession) -> None:
+    """Closes a session which was created in a previous event loop."""
+    try:
+        await session.close()
+    except RuntimeError as e:
+        # the connections of closed event loops can't be closed anymore
+        logger.debug(f"Failed to close the session of a previous event loop: {e}")
+
+
 class GraphQLNaturalLanguageGenerator(NaturalLanguageGenerator):
-    """Like Rasa's CallbackNLG, but queries Botfront's GraphQL endpoint"""
+    """Like Rasa's CallbackNLG, but queries Botfront's GraphQL endpoint.
+
+    Requests share a pool of connections to the endpoint. Responses can be cached
+    by setting `cache_ttl` (in seconds) in the endpoint configuration. The
+    responses are cached per template, language, channel, arguments and slot
+    values, since Botfront can pick responses depending on any slot.
+    """
 
     def __init__(self, **kwargs) -> None:
         self.nlg_endpoint = kwargs.get("endpoint_config")
         self.url_substitution_patterns = []
+        endpoint_kwargs = {}
         if self.nlg_endpoint:
+            endpoint_kwargs = self.nlg_endpoint.kwargs
             self.url_substitution_patterns = (
-                self.nlg_endpoint.kwargs.get("url_substitutions") or []
+                endpoint_kwargs.get("url_substitutions") or []
             )
 
+        self.include_events = endpoint_kwargs.get("include_events", False)
+        self.pool_size = endpoint_kwargs.get("pool_size", DEFAULT_NLG_POOL_SIZE)
+        self._cache = _ResponseCache(
+            endpoint_kwargs.get("cache_size", DEFAULT_NLG_CACHE_SIZE),
+            endpoint_kwargs.get("cache_ttl", DEFAULT_NLG_CACHE_TTL),
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the client session which is shared by all requests.
+
+        Sessions are bound to an event loop, hence a new one is created if the
+        loop changed.
+        """
+        loop = asyncio.get_event_loop()
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is not loop
+        ):
+            loop.create_task(_close_session(self._session))
+
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            api_key = os.environ.get("API_KEY")
+            headers = {"Authorization": api_key} if api_key else {}
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            )
+            self._session_loop = loop
+            rasa.utils.endpoints.close_session_on_shutdown(self)
+
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the connections to the NLG endpoint."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _query_response(
+        self, template_name: Text, body: Dict[Text, Any]
+    ) -> Dict[Text, Any]:
+        """Fetches the response for `template_name` from the GraphQL endpoint."""
+        cache_key = None
+        if self._cache.enabled:
+            cache_key = (
+                template_name,
+                body["channel"]["name"],
+                json.dumps(body["arguments"], sort_keys=True, default=str),
+                json.dumps(body["tracker"]["slots"], sort_keys=True, default=str),
+            )
+            cached_response = self._cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug(f"Using cached NLG response for {template_name}.")
+                return cached_response
+
+        try:
+            async with self._get_session().post(
+                self.nlg_endpoint.url, json={"query": NLG_QUERY, "variables": body}
+            ) as resp:
+                response = await resp.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise urllib.error.URLError(str(e) or type(e).__name__)
+
+        if response.get("errors"):
+            raise urllib.error.URLError(
+                ", ".join([e.get("message") for e in response.get("errors")])
+            )
+        response = (response.get("data") or {}).get("getResponse") or {}
+
+        if cache_key is not None:
+            self._cache.set(cache_key, response)
+
+        return response
+
     async def generate(
         self,
         template_name: Text,
@@ -128,10 +286,13 @@ class GraphQLNaturalLanguageGenerator(NaturalLanguageGenerator):
         )
         language = tracker.latest_message.metadata.get("language") or fallback_language
 
+        is_graphql_endpoint = "graphql" in self.nlg_endpoint.url
         body = nlg_request_format(
             template_name,
             tracker,
             output_channel,
+            # the legacy route follows Rasa's NLG request format including events
+            include_events=self.include_events or not is_graphql_endpoint,
             **kwargs,
             language=language,
             projectId=os.environ.get("BF_PROJECT_ID"),
@@ -144,21 +305,8 @@ class GraphQLNaturalLanguageGenerator(NaturalLanguageGenerator):
         )
 
         try:
-            if "graphql" in self.nlg_endpoint.url:
-                from sgqlc.endpoint.http import HTTPEndpoint
-
-                logging.getLogger("sgqlc.endpoint.http").setLevel(logging.WARNING)
-
-                api_key = os.environ.get("API_KEY")
-                headers = [{"Authorization": api_key}] if api_key else []
-                response = HTTPEndpoint(self.nlg_endpoint.url, *headers)(
-                    NLG_QUERY, body
-                )
-                if response.get("errors"):
-                    raise urllib.error.URLError(
-                        ", ".join([e.get("message") for e in response.get("errors")])
-                    )
-                response = response.get("data", {}).get("getResponse", {})
+            if is_graphql_endpoint:
+                response = await self._query_response(template_name, body)
                 rewrite_url(response, self.url_substitution_patterns)
                 if "customText" in response:
                     response["text"] = response.pop("customText")
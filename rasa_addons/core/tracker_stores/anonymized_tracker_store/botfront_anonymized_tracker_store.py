@@ -203,6 +203,7 @@ class BotfrontAnonymizedTrackerStore(TrackerStore):
             self.trackers[sender_id] = serialized_tracker
             # update the last index and last time stamp for future uses
             self._store_tracker_info(sender_id, updated_info)
+            canonical_tracker.mark_events_as_persisted()
             return serialized_tracker["events"]
         else:  # the tracker  exist localy
             # Insert only the new examples
@@ -220,13 +221,17 @@ class BotfrontAnonymizedTrackerStore(TrackerStore):
             # update the last index and last time stamp for future uses
             self._store_tracker_info(sender_id, updated_info)
             self.trackers[sender_id] = serialized_tracker
+            canonical_tracker.mark_events_as_persisted()
             return serialized_tracker["events"]
 
     def _convert_tracker(self, sender_id, tracker):
         if self.domain:
-            return DialogueStateTracker.from_dict(
+            tracker = DialogueStateTracker.from_dict(
                 sender_id, tracker["events"], self.domain.slots
             )
+            # lets `stream_events` skip fetching the tracker again on save
+            tracker.mark_events_as_persisted()
+            return tracker
         else:
             logger.warning(
                 "Can't recreate tracker from mongo storage "
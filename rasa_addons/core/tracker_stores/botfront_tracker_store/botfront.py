@@ -1,10 +1,12 @@
+import json
 import logging
 import jsonpickle
 import requests
 import time
 import os
 import re
-from threading import Thread
+from collections import OrderedDict
+from threading import Condition, Lock, RLock, Thread
 
 from rasa.core.tracker_store import TrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
@@ -33,33 +35,64 @@ query trackerStore(
 }
 """
 
-INSERT_TRACKER = """
-mutation insertTracker(
-    $senderId: String!
-    $projectId: String!
-    $tracker: Any
-    $env: Environment
-) {
-    insertTrackerStore(senderId: $senderId, projectId:$projectId, tracker:$tracker, env: $env){
+# mutations of several trackers are sent together, each one under its own alias
+TRACKER_MUTATION = """
+    {alias}: {mutation}(senderId: ${alias}SenderId, projectId: $projectId, tracker: ${alias}Tracker, env: $env){{
         lastIndex
         lastTimestamp
-    }
-}
-"""
+    }}"""
 
-UPDATE_TRACKER = """
-mutation updateTracker(
-    $senderId: String!
-    $projectId: String!
-    $tracker: Any
-    $env: Environment
-) {
-    updateTrackerStore(senderId: $senderId, projectId: $projectId, tracker: $tracker, env: $env){
-        lastIndex
-        lastTimestamp
-    }
-}
-"""
+DEFAULT_FLUSH_INTERVAL = 0.2  # seconds between two flushes of the write-behind queue
+DEFAULT_MAX_BATCH_SIZE = 50  # conversations which are written in one request
+DEFAULT_MAX_PENDING_CONVERSATIONS = 1000  # save blocks on a flush beyond this
+DEFAULT_MAX_CACHE_BYTES = 64 * 1024 * 1024  # size of the local tracker cache
+
+
+class _TrackerCache(OrderedDict):
+    """Least recently used cache of serialised trackers with a limit on their size.
+
+    The size of a tracker is approximated by the length of its JSON dump.
+    """
+
+    def __init__(self, max_bytes, on_evict=None, is_pinned=None):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.is_pinned = is_pinned
+        self.size_in_bytes = 0
+        self._sizes = {}
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        if key in self:
+            del self[key]
+        size = len(json.dumps(value, default=str))
+        super().__setitem__(key, value)
+        self._sizes[key] = size
+        self.size_in_bytes += size
+
+        if self.size_in_bytes > self.max_bytes:
+            self._evict(keep=key)
+
+    def _evict(self, keep):
+        # the latest tracker is kept even if it exceeds the limit on its own
+        for evicted_key in list(self.keys()):
+            if self.size_in_bytes <= self.max_bytes:
+                break
+            if evicted_key == keep or (self.is_pinned and self.is_pinned(evicted_key)):
+                continue
+            del self[evicted_key]
+            if self.on_evict:
+                self.on_evict(evicted_key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.size_in_bytes -= self._sizes.pop(key)
 
 
 def _start_sweeper(tracker_store, break_time):
@@ -70,21 +103,54 @@ def _start_sweeper(tracker_store, break_time):
             time.sleep(break_time)
 
 
+def _start_flusher(tracker_store):
+    while not tracker_store.closed:
+        try:
+            tracker_store.flush(wait=True)
+        except Exception as e:
+            logger.error(f"Flushing trackers to Botfront failed: {e}")
+
+
 class BotfrontTrackerStore(TrackerStore):
+    # the tracker cache and the write queue are guarded by locks
+    performs_blocking_io = True
+
     def __init__(self, domain, host, **kwargs):
 
         self.project_id = os.environ.get("BF_PROJECT_ID")
         self.tracker_persist_time = kwargs.get("tracker_persist_time", 3600)
         self.test_tracker_persist_time = kwargs.get("test_tracker_persist_time", 240)
         self.max_events = kwargs.get("max_events", 100)
-        self.trackers = {}
+        self.flush_interval = kwargs.get("flush_interval", DEFAULT_FLUSH_INTERVAL)
+        self.max_batch_size = kwargs.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE)
+        self.max_pending_conversations = kwargs.get(
+            "max_pending_conversations", DEFAULT_MAX_PENDING_CONVERSATIONS
+        )
+        # trackers with queued changes are never evicted from the local cache
+        self.trackers = _TrackerCache(
+            kwargs.get("max_cache_bytes", DEFAULT_MAX_CACHE_BYTES),
+            on_evict=self._forget_tracker_info,
+            is_pinned=self._has_unsaved_changes,
+        )
         self.test_trackers = {}
         self.trackers_info = (
             {}
         )  # in this stucture we will keep the last index and the last timestamp of events in the db for a said tracker
+        # write-behind queue: the changes of each conversation which still have to be
+        # sent to Botfront
+        self.pending_writes = OrderedDict()
+        self._queued_timestamps = {}
+        self._writes_in_flight = set()
+        self._lock = RLock()
+        self._closing = Condition(self._lock)
+        self._flush_lock = Lock()
+        self.closed = False
         self.sweeper = Thread(target=_start_sweeper, args=(self, 30))
         self.sweeper.setDaemon(True)
         self.sweeper.start()
+        self.flusher = Thread(target=_start_flusher, args=(self,))
+        self.flusher.setDaemon(True)
+        self.flusher.start()
         api_key = os.environ.get("API_KEY")
         headers = [{"Authorization": api_key}] if api_key else []
         self.graphql_endpoint = HTTPEndpoint(host, *headers)
@@ -122,29 +188,40 @@ class BotfrontTrackerStore(TrackerStore):
         )
         return data.get("trackerStore")
 
-    def _insert_tracker_gql(self, sender_id, tracker):
-        data = self._graphql_query(
-            INSERT_TRACKER,
-            {
-                "senderId": sender_id,
-                "projectId": self.project_id,
-                "tracker": tracker,
-                "env": self.environment,
-            },
-        )
-        return data.get("insertTrackerStore")
+    def _write_trackers_gql(self, writes):
+        """Sends the changes of several trackers to Botfront in one request.
 
-    def _update_tracker_gql(self, sender_id, tracker):
-        data = self._graphql_query(
-            UPDATE_TRACKER,
-            {
-                "senderId": sender_id,
-                "projectId": self.project_id,
-                "tracker": tracker,
-                "env": self.environment,
-            },
+        Returns:
+            The last index and timestamp of every tracker (`None` if it failed).
+        """
+        variables = {"projectId": self.project_id, "env": self.environment}
+        declarations = ["$projectId: String!", "$env: Environment"]
+        mutations = []
+        for index, (sender_id, write) in enumerate(writes):
+            alias = f"t{index}"
+            variables[f"{alias}SenderId"] = sender_id
+            variables[f"{alias}Tracker"] = write["tracker"]
+            declarations += [f"${alias}SenderId: String!", f"${alias}Tracker: Any"]
+            mutation = "insertTrackerStore" if write["insert"] else "updateTrackerStore"
+            mutations.append(TRACKER_MUTATION.format(alias=alias, mutation=mutation))
+
+        query = "mutation({}) {{{}\n}}".format(
+            " ".join(declarations), "".join(mutations)
         )
-        return data.get("updateTrackerStore")
+        try:
+            response = self.graphql_endpoint(query, variables)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.error(f"Something went wrong saving trackers to {self.host}: {e}")
+            return [None] * len(writes)
+
+        if response.get("errors"):
+            # the trackers without errors are saved nonetheless
+            logger.error(
+                f"Something went wrong saving trackers to {self.host}: "
+                + ", ".join([e.get("message") for e in response.get("errors")])
+            )
+        data = response.get("data") or {}
+        return [data.get(f"t{index}") for index in range(len(writes))]
 
     def _get_last_index(self, sender_id):
         info = self.trackers_info.get(sender_id, -1)
@@ -171,6 +248,13 @@ class BotfrontTrackerStore(TrackerStore):
                 "last_timestamp": tracker_info["lastTimestamp"],
             }
 
+    def _has_unsaved_changes(self, sender_id):
+        return sender_id in self.pending_writes or sender_id in self._writes_in_flight
+
+    def _forget_tracker_info(self, sender_id):
+        self.trackers_info.pop(sender_id, None)
+        self._queued_timestamps.pop(sender_id, None)
+
     def save(self, canonical_tracker):
         serialized_tracker = self._serialize_tracker_to_dict(canonical_tracker)
         sender_id = canonical_tracker.sender_id
@@ -181,38 +265,133 @@ class BotfrontTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(canonical_tracker)
 
-        # Fetch here just in case retrieve wasn't called first
-        tracker = self.trackers.get(sender_id)
-
-        if tracker is None:  # the tracker does not exist localy ( first save)
-            updated_info = self._insert_tracker_gql(sender_id, serialized_tracker)
+        with self._lock:
+            self._enqueue_write(sender_id, serialized_tracker)
             self.trackers[sender_id] = serialized_tracker
-            # update the last index and last time stamp for future uses
-            self._store_tracker_info(sender_id, updated_info)
-            return serialized_tracker["events"]
-        else:  # the tracker  exist localy
-            # Insert only the new examples
-            last_timestamp = self._get_last_timestamp(sender_id)
-            new_events = list(
-                filter(
-                    lambda x: x["timestamp"] > last_timestamp,
-                    serialized_tracker["events"],
-                )
+            too_many_pending_writes = (
+                len(self.pending_writes) >= self.max_pending_conversations
+            )
+
+        # backpressure: write the queued trackers before accepting more
+        if too_many_pending_writes:
+            self.flush()
+
+        canonical_tracker.mark_events_as_persisted()
+        return serialized_tracker["events"]
+
+    def _enqueue_write(self, sender_id, serialized_tracker):
+        """Adds the changes of a tracker to the write-behind queue.
+
+        Changes of a conversation which is already queued are merged so that only
+        one mutation is sent for it.
+        """
+        events = serialized_tracker["events"]
+        write = self.pending_writes.get(sender_id)
+
+        if write is None and self.trackers.get(sender_id) is None:
+            # the tracker does not exist localy ( first save)
+            write = {"insert": True, "tracker": serialized_tracker}
+        elif write is not None and write["insert"]:
+            write["tracker"] = serialized_tracker
+        else:
+            # Insert only the new examples, including the ones which are queued or
+            # currently being written
+            last_timestamp = max(
+                self._get_last_timestamp(sender_id),
+                self._queued_timestamps.get(sender_id, 0),
             )
+            new_events = write["tracker"]["events"] if write else []
+            new_events = new_events + [
+                event for event in events if event["timestamp"] > last_timestamp
+            ]
             tracker_shallow_copy = {key: val for key, val in serialized_tracker.items()}
             tracker_shallow_copy["events"] = new_events
-            # only send the new events to the remote tracker
-            updated_info = self._update_tracker_gql(sender_id, tracker_shallow_copy)
-            # update the last index and last time stamp for future uses
-            self._store_tracker_info(sender_id, updated_info)
-            self.trackers[sender_id] = serialized_tracker
-            return serialized_tracker["events"]
+            write = {"insert": False, "tracker": tracker_shallow_copy}
+
+        if events:
+            self._queued_timestamps[sender_id] = events[-1]["timestamp"]
+        self.pending_writes[sender_id] = write
+
+    def flush(self, wait=False):
+        """Sends queued tracker changes to Botfront.
+
+        Args:
+            wait: Wait `flush_interval` seconds (or until the store is closed) before
+                sending the changes, so that more of them are merged in one request.
+        """
+        if wait:
+            with self._lock:
+                if not self.closed:
+                    self._closing.wait(self.flush_interval)
+
+        # only one flush at a time, otherwise two writes for the same conversation
+        # could be in flight and arrive out of order
+        with self._flush_lock:
+            with self._lock:
+                writes = []
+                while self.pending_writes and len(writes) < self.max_batch_size:
+                    writes.append(self.pending_writes.popitem(last=False))
+                self._writes_in_flight.update(sender_id for sender_id, _ in writes)
+
+            if not writes:
+                return
+
+            tracker_infos = self._write_trackers_gql(writes)
+
+            with self._lock:
+                for (sender_id, write), tracker_info in zip(writes, tracker_infos):
+                    self._writes_in_flight.discard(sender_id)
+                    if tracker_info is None:
+                        self._requeue_write(sender_id, write)
+                    else:
+                        # update the last index and last time stamp for future uses
+                        self._store_tracker_info(sender_id, tracker_info)
+
+    def _requeue_write(self, sender_id, write):
+        newer_write = self.pending_writes.pop(sender_id, None)
+        if newer_write is not None:
+            if write["insert"]:
+                # the latest tracker contains all events of the failed insert
+                write = {
+                    "insert": True,
+                    "tracker": self.trackers.get(sender_id, newer_write["tracker"]),
+                }
+            else:
+                write = {
+                    "insert": newer_write["insert"],
+                    "tracker": {
+                        **newer_write["tracker"],
+                        "events": write["tracker"]["events"]
+                        + newer_write["tracker"]["events"],
+                    },
+                }
+        self.pending_writes[sender_id] = write
+        self.pending_writes.move_to_end(sender_id, last=False)
+
+    def close(self):
+        """Stops the background writes after sending all queued changes."""
+        with self._lock:
+            self.closed = True
+            self._closing.notify_all()
+
+        while self.pending_writes:
+            number_of_pending_writes = len(self.pending_writes)
+            self.flush()
+            if len(self.pending_writes) >= number_of_pending_writes:
+                logger.error(
+                    f"Could not write {number_of_pending_writes} trackers to Botfront "
+                    f"before shutting down."
+                )
+                break
 
     def _convert_tracker(self, sender_id, tracker):
         if self.domain:
-            return DialogueStateTracker.from_dict(
+            tracker = DialogueStateTracker.from_dict(
                 sender_id, tracker["events"], self.domain.slots
             )
+            # lets `stream_events` skip fetching the tracker again on save
+            tracker.mark_events_as_persisted()
+            return tracker
         else:
             logger.warning(
                 "Can't recreate tracker from mongo storage "
@@ -243,6 +422,10 @@ class BotfrontTrackerStore(TrackerStore):
     def retrieve(self, sender_id):
         if self.botfront_test_regex.match(sender_id):
             return self.test_trackers.get(sender_id)
+        with self._lock:
+            if self._has_unsaved_changes(sender_id):
+                # the local copy is more recent than what Botfront knows about
+                return self._convert_tracker(sender_id, self.trackers.get(sender_id))
         last_index = self._get_last_index(sender_id)
         # retreive all new info since the last sync (given by last index)
         new_tracker_info = self._fetch_tracker(sender_id, last_index)
@@ -251,8 +434,11 @@ class BotfrontTrackerStore(TrackerStore):
         # ortherwise you will get synchornication issues when working with multiple rasa instances
         # the tracker exist on the remote and may exist locally
         if new_tracker_info is not None:
-            self._store_tracker_info(sender_id, new_tracker_info)
-            tracker = self._update_tracker(sender_id, new_tracker_info.get("tracker"))
+            with self._lock:
+                self._store_tracker_info(sender_id, new_tracker_info)
+                tracker = self._update_tracker(
+                    sender_id, new_tracker_info.get("tracker")
+                )
             return self._convert_tracker(sender_id, tracker)
 
         # the tracker do not exist yet
@@ -266,25 +452,28 @@ class BotfrontTrackerStore(TrackerStore):
         for key in list(
             trackers.keys()
         ):
-            ## wraped in a try block so if an exception occurs it does not stop the sweep mechanism
-            try:
-                tracker = trackers.get(key)
-                max_event_time = time.time() - persist_time
-                latest_event = float("inf")
+            # a tracker must not be dropped while `save` queues a write for it,
+            # as the next write would then send all of its events again
+            with self._lock:
+                if self._has_unsaved_changes(key):
+                    continue
+                ## wraped in a try block so if an exception occurs it does not stop the sweep mechanism
                 try:
-                    latest_event = tracker.latest_message.timestamp
-                except:
-                    latest_event = tracker.get("latest_event_time", float("inf"))
-                    pass
-                if latest_event < max_event_time:
-                    logger.debug("SWEEPER: Removing botfront test tracker {}".format(key))
-                    if key in trackers:
-                        del trackers[key]
-                    if key in self.trackers_info:
-                        del self.trackers_info[key]
-            except Exception as e:
-                print(e)
-                pass
+                    tracker = trackers.get(key)
+                    max_event_time = time.time() - persist_time
+                    latest_event = float("inf")
+                    try:
+                        latest_event = tracker.latest_message.timestamp
+                    except:
+                        latest_event = tracker.get("latest_event_time", float("inf"))
+                        pass
+                    if latest_event < max_event_time:
+                        logger.debug("SWEEPER: Removing botfront test tracker {}".format(key))
+                        if key in trackers:
+                            del trackers[key]
+                        self._forget_tracker_info(key)
+                except Exception:
+                    logger.exception(f"SWEEPER: Failed to clean up tracker {key}.")
 
     def sweep(self):
         self.cleanup_trackers(self.test_trackers, self.test_tracker_persist_time)
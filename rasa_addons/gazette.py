@@ -1,10 +1,13 @@
+import functools
 import os
 import warnings
+from collections import Counter, defaultdict
 import rasa
 
-from typing import Any, Text, Dict, Optional
+from typing import Any, Text, Dict, List, Optional, Tuple
 
 import rasa.shared.utils.io
+import rasa.utils.io
 from rasa.nlu import utils
 from rasa.nlu.components import Component
 from rasa.nlu.config import RasaNLUModelConfig
@@ -15,13 +18,124 @@ from rasa.nlu.model import Metadata
 
 from fuzzy_matcher import process
 
+NGRAM_SIZE = 3
+NGRAM_PADDING = "\0" * (NGRAM_SIZE - 1)
+
+
+def _ngrams(value: Text) -> Counter:
+    padded = NGRAM_PADDING + value + NGRAM_PADDING
+    return Counter(
+        padded[index : index + NGRAM_SIZE]
+        for index in range(len(padded) - NGRAM_SIZE + 1)
+    )
+
+
+class GazetteIndex:
+    """Trigram index of the lower cased elements of a gazette.
+
+    Only elements which can score more than `min_score` are passed to the scorer of
+    `fuzzy_matcher`: if the edit distance of two strings is at most `k`, they share
+    at least `len - NGRAM_SIZE + 1 - k * NGRAM_SIZE` trigrams, `len` being the length
+    of the longer (`ratio`) or of the shorter (`partial_ratio`) string.
+    """
+
+    def __init__(self, elements: List[Text]) -> None:
+        self.elements = [element.lower() for element in elements]
+        self.ngrams = defaultdict(list)
+        self.elements_by_length = defaultdict(list)
+        for element_index, element in enumerate(self.elements):
+            for ngram, count in _ngrams(element).items():
+                self.ngrams[ngram].append((element_index, count))
+            self.elements_by_length[len(element)].append(element_index)
+        self.ngrams = dict(self.ngrams)
+        self.elements_by_length = dict(self.elements_by_length)
+
+    def _min_common_ngrams(
+        self, value_length: int, element_length: int, mode: Text, min_score: int
+    ) -> Optional[int]:
+        """Returns how many trigrams an element needs to share with the value.
+
+        `None` means that the element cannot score more than `min_score`.
+        """
+        if mode == "ratio":
+            length = max(value_length, element_length)
+            max_distance = length * (100 - min_score) // 100
+            if abs(value_length - element_length) > max_distance:
+                return None
+        else:
+            length = min(value_length, element_length)
+            max_distance = value_length * (100 - min_score) // 100
+        return length - NGRAM_SIZE + 1 - max_distance * NGRAM_SIZE
+
+    def _candidates(self, value: Text, mode: Text, min_score: int) -> List[int]:
+        common_ngrams = defaultdict(int)
+        for ngram, count in _ngrams(value).items():
+            for element_index, element_count in self.ngrams.get(ngram, []):
+                common_ngrams[element_index] += min(count, element_count)
+
+        min_common_ngrams = {
+            element_length: self._min_common_ngrams(
+                len(value), element_length, mode, min_score
+            )
+            for element_length in self.elements_by_length
+        }
+        candidates = {
+            element_index
+            for element_index, count in common_ngrams.items()
+            if min_common_ngrams[len(self.elements[element_index])] is not None
+            and count >= min_common_ngrams[len(self.elements[element_index])]
+        }
+        # elements which are close enough even without any common trigram
+        for element_length, min_count in min_common_ngrams.items():
+            if min_count is not None and min_count <= 0:
+                candidates.update(self.elements_by_length[element_length])
+        return sorted(candidates)
+
+    def best_match(
+        self, value: Text, mode: Text, min_score: int, limit: int = 5
+    ) -> Tuple[Optional[Text], Optional[int]]:
+        """Finds the element with the best score (the first one in case of a tie).
+
+        Args:
+            value: The lower cased value to match.
+            mode: The `fuzzy_matcher` scorer.
+            min_score: Elements scoring `min_score` or less are never returned.
+            limit: Number of suggestions `fuzzy_matcher` considers for other modes.
+
+        Returns:
+            The best element and its score, or `None`s if no element is good enough.
+        """
+        if mode not in ["ratio", "partial_ratio"]:
+            matches = process.extract(value, self.elements, limit=limit, scorer=mode)
+            return matches[0] if len(matches) else (None, None)
+
+        scorer = process.ratio if mode == "ratio" else process.partial_ratio
+        best, best_score = None, None
+        for element_index in self._candidates(value, mode, min_score):
+            score = scorer(value, self.elements[element_index])
+            if best_score is None or score > best_score:
+                best, best_score = self.elements[element_index], score
+        if best_score is None or best_score <= min_score:
+            return None, None
+        return best, best_score
+
 
 class Gazette(Component):
     name = "Gazette"
-    defaults = {"max_num_suggestions": 5, "entities": [], "mode": "ratio", "min_score": 80}
+    defaults = {
+        "max_num_suggestions": 5,
+        "entities": [],
+        "mode": "ratio",
+        "min_score": 80,
+        # number of matched entity values which are remembered
+        "cache_size": 10000,
+    }
 
     def __init__(
-        self, component_config: Text = None, gazette: Optional[Dict] = None
+        self,
+        component_config: Text = None,
+        gazette: Optional[Dict] = None,
+        index: Optional[Dict[Text, GazetteIndex]] = None,
     ) -> None:
         super(Gazette, self).__init__(component_config)
         self.component_config["entities"] = gazette["entities"] if gazette and "entities" in gazette else []
@@ -31,6 +145,24 @@ class Gazette(Component):
             self._load_config()
         self.limit = self.component_config.get("max_num_suggestions")
         self.entities = self.component_config.get("entities", [])
+        self._build_index(index)
+
+    def _build_index(self, index: Optional[Dict[Text, GazetteIndex]] = None) -> None:
+        self.index = index if index is not None else {
+            name: GazetteIndex(elements) for name, elements in self.gazette.items()
+        }
+        self._best_match = functools.lru_cache(
+            maxsize=self.component_config.get("cache_size")
+        )(self._find_best_match)
+
+    def _find_best_match(
+        self, entity_name: Text, value: Text, mode: Text, min_score: int
+    ) -> Tuple[Optional[Text], Optional[int]]:
+        if entity_name not in self.index:
+            return None, None
+        return self.index[entity_name].best_match(
+            value, mode, min_score, limit=self.limit
+        )
 
     def process(self, message: Message, **kwargs: Any) -> None:
 
@@ -43,14 +175,12 @@ class Gazette(Component):
                 continue
 
             # We use lower case in order to have case-insensitive matching
-            locase_gazettes = [g.lower() for g in self.gazette.get(entity["entity"], [])]
-            matches = process.extract(
+            primary, score = self._best_match(
+                entity["entity"],
                 entity["value"].lower(),
-                locase_gazettes,
-                limit=self.limit,
-                scorer=config["mode"],
+                config["mode"],
+                config["min_score"],
             )
-            primary, score = matches[0] if len(matches) else (None, None)
             if primary is not None and score > config["min_score"]:
                 entity["value"] = primary
 
@@ -71,13 +201,16 @@ class Gazette(Component):
             self.gazette = gazette_dict
             self.entities = [{"name": entity}
                              for entity in list(gazette_dict.keys())]
+            self._build_index()
 
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         file_name = file_name + ".json"
         utils.write_json_to_file(os.path.join(
             model_dir, file_name), {"gazette": self.gazette, "entities": self.entities}, indent=4)
+        index_file_name = file_name + ".index.pkl"
+        rasa.utils.io.pickle_dump(os.path.join(model_dir, index_file_name), self.index)
 
-        return {"file": file_name}
+        return {"file": file_name, "index_file": index_file_name}
 
     @classmethod
     def load(
@@ -91,7 +224,15 @@ class Gazette(Component):
         try:
             file = os.path.join(
                 model_dir, component_meta.get("file", "gazette.json"))
-            return Gazette(component_meta, rasa.shared.utils.io.read_json_file(file))
+            index = None
+            if component_meta.get("index_file"):
+                # models trained before the index existed build it when loaded
+                index = rasa.utils.io.pickle_load(
+                    os.path.join(model_dir, component_meta["index_file"])
+                )
+            return Gazette(
+                component_meta, rasa.shared.utils.io.read_json_file(file), index
+            )
         except:
             warnings.warn("Could not load gazette.")
             return Gazette(component_meta, None)
@@ -0,0 +1,248 @@
+import json
+import threading
+from typing import Any
+from unittest.mock import Mock
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, BotUttered, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
+from rasa_addons.core.tracker_stores.botfront_tracker_store.botfront import (
+    BotfrontTrackerStore,
+)
+
+
+def _tracker_store(monkeypatch: MonkeyPatch, **kwargs: Any) -> BotfrontTrackerStore:
+    # the background flusher does not write anything during the tests
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        "http://localhost:3000/graphql",
+        flush_interval=3600,
+        **kwargs,
+    )
+    monkeypatch.setattr(tracker_store, "_fetch_tracker", Mock(return_value=None))
+    monkeypatch.setattr(tracker_store, "graphql_endpoint", Mock(side_effect=_mutate))
+    return tracker_store
+
+
+def _mutate(query: str, variables: dict) -> dict:
+    aliases = [
+        key[: -len("SenderId")] for key in variables if key.endswith("SenderId")
+    ]
+    return {
+        "data": {
+            alias: {
+                "lastIndex": len(variables[f"{alias}Tracker"]["events"]),
+                "lastTimestamp": variables[f"{alias}Tracker"]["events"][-1][
+                    "timestamp"
+                ],
+            }
+            for alias in aliases
+        }
+    }
+
+
+def _sent_trackers(tracker_store: BotfrontTrackerStore) -> list:
+    return [
+        (
+            variables[f"{key[: -len('SenderId')]}SenderId"],
+            variables[f"{key[: -len('SenderId')]}Tracker"],
+        )
+        for (_, variables), _ in tracker_store.graphql_endpoint.call_args_list
+        for key in variables
+        if key.endswith("SenderId")
+    ]
+
+
+def test_save_does_not_fetch_retrieved_tracker_again(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch, event_broker=Mock())
+
+    tracker = tracker_store.get_or_create_tracker("some-user")
+    tracker = tracker_store.retrieve("some-user")
+    tracker_store._fetch_tracker.reset_mock()
+    tracker_store.event_broker.publish.reset_mock()
+
+    tracker.update(UserUttered("hi"))
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    tracker_store._fetch_tracker.assert_not_called()
+    published_events = [
+        call.args[0]["event"]
+        for call in tracker_store.event_broker.publish.call_args_list
+    ]
+    assert published_events == [UserUttered.type_name, BotUttered.type_name]
+    assert tracker.persisted_event_count == len(tracker.events) == 3
+    assert isinstance(tracker.events[0], ActionExecuted)
+
+
+def test_save_coalesces_writes_into_one_request(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch)
+
+    first = tracker_store.get_or_create_tracker("first")
+    first.update(UserUttered("hi"))
+    tracker_store.save(first)
+    second = tracker_store.get_or_create_tracker("second")
+    tracker_store.graphql_endpoint.assert_not_called()
+
+    tracker_store.flush()
+    assert tracker_store.graphql_endpoint.call_count == 1
+    assert [sender_id for sender_id, _ in _sent_trackers(tracker_store)] == [
+        "first",
+        "second",
+    ]
+    query = tracker_store.graphql_endpoint.call_args.args[0]
+    assert query.count("insertTrackerStore") == 2
+
+    tracker_store.graphql_endpoint.reset_mock()
+    first.update(BotUttered("hey"))
+    tracker_store.save(first)
+    first.update(UserUttered("bye"))
+    tracker_store.save(first)
+    second.update(UserUttered("hi"))
+    tracker_store.save(second)
+    tracker_store.flush()
+
+    assert tracker_store.graphql_endpoint.call_count == 1
+    query = tracker_store.graphql_endpoint.call_args.args[0]
+    assert query.count("updateTrackerStore") == 2
+    sent = dict(_sent_trackers(tracker_store))
+    # only the events which were not written yet are sent
+    assert [event["event"] for event in sent["first"]["events"]] == [
+        BotUttered.type_name,
+        UserUttered.type_name,
+    ]
+    assert [event["event"] for event in sent["second"]["events"]] == [
+        UserUttered.type_name
+    ]
+    assert not tracker_store.pending_writes
+
+
+def test_retrieve_returns_pending_changes(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch)
+
+    tracker = tracker_store.get_or_create_tracker("some-user")
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+    tracker_store._fetch_tracker.reset_mock()
+
+    retrieved = tracker_store.retrieve("some-user")
+
+    tracker_store._fetch_tracker.assert_not_called()
+    assert list(retrieved.events) == list(tracker.events)
+
+
+def test_failed_writes_are_retried(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch)
+    tracker = tracker_store.get_or_create_tracker("some-user")
+    tracker_store.flush()
+    tracker_store.graphql_endpoint.reset_mock()
+
+    tracker_store.graphql_endpoint.side_effect = OSError("Botfront is down")
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+    tracker_store.flush()
+    assert "some-user" in tracker_store.pending_writes
+
+    tracker_store.graphql_endpoint.side_effect = _mutate
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+    tracker_store.graphql_endpoint.reset_mock()
+    tracker_store.flush()
+
+    [(_, sent)] = _sent_trackers(tracker_store)
+    assert [event["event"] for event in sent["events"]] == [
+        UserUttered.type_name,
+        BotUttered.type_name,
+    ]
+    assert not tracker_store.pending_writes
+
+
+def test_save_flushes_when_too_many_writes_are_pending(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch, max_pending_conversations=2)
+
+    tracker_store.get_or_create_tracker("first")
+    tracker_store.graphql_endpoint.assert_not_called()
+    tracker_store.get_or_create_tracker("second")
+
+    tracker_store.graphql_endpoint.assert_called_once()
+    assert not tracker_store.pending_writes
+
+
+def test_close_writes_pending_trackers(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch, max_batch_size=1)
+    for sender_id in ["first", "second", "third"]:
+        tracker_store.get_or_create_tracker(sender_id)
+
+    tracker_store.close()
+
+    assert tracker_store.graphql_endpoint.call_count == 3
+    assert not tracker_store.pending_writes
+
+
+def test_cache_evicts_least_recently_used_trackers(monkeypatch: MonkeyPatch):
+    tracker = DialogueStateTracker.from_events("sender", [UserUttered("hi")])
+    tracker_size = len(json.dumps(tracker.current_state(EventVerbosity.ALL)))
+    # room for two trackers
+    max_cache_bytes = int(tracker_size * 2.5)
+    tracker_store = _tracker_store(monkeypatch, max_cache_bytes=max_cache_bytes)
+
+    for sender_id in ["first", "second", "third", "fourth"]:
+        tracker_store.save(
+            DialogueStateTracker.from_events(sender_id, [UserUttered("hi")])
+        )
+    # trackers with unsaved changes are kept
+    assert len(tracker_store.trackers) == 4
+
+    tracker_store.flush()
+    tracker_store.retrieve("first")
+    tracker_store.save(DialogueStateTracker.from_events("fifth", [UserUttered("hi")]))
+
+    assert list(tracker_store.trackers.keys()) == ["first", "fifth"]
+    assert "second" not in tracker_store.trackers_info
+    assert tracker_store.trackers.size_in_bytes <= max_cache_bytes
+
+
+def test_concurrent_flushes_send_writes_in_order(monkeypatch: MonkeyPatch):
+    tracker_store = _tracker_store(monkeypatch)
+    tracker = tracker_store.get_or_create_tracker("some-user")
+    tracker_store.flush()
+
+    first_write_sent = threading.Event()
+    release_first_write = threading.Event()
+
+    def slow_mutate(query: str, variables: dict) -> dict:
+        if not first_write_sent.is_set():
+            first_write_sent.set()
+            release_first_write.wait(5)
+        return _mutate(query, variables)
+
+    tracker_store.graphql_endpoint.reset_mock()
+    tracker_store.graphql_endpoint.side_effect = slow_mutate
+
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+    first_flush = threading.Thread(target=tracker_store.flush)
+    first_flush.start()
+    assert first_write_sent.wait(5)
+
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+    second_flush = threading.Thread(target=tracker_store.flush)
+    second_flush.start()
+    second_flush.join(0.2)
+
+    # the second write waits until the first one is done
+    assert second_flush.is_alive()
+    assert tracker_store.graphql_endpoint.call_count == 1
+
+    release_first_write.set()
+    first_flush.join(5)
+    second_flush.join(5)
+
+    sent = [tracker["events"] for _, tracker in _sent_trackers(tracker_store)]
+    assert [[event["event"] for event in events] for events in sent] == [
+        [UserUttered.type_name],
+        [BotUttered.type_name],
+    ]
@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any, Dict, List, Text
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from rasa.shared.core.events import SlotSet, UserUttered
+from rasa.shared.core.slots import TextSlot
+from rasa.shared.core.trackers import DialogueStateTracker
+import rasa.utils.endpoints
+from rasa.utils.endpoints import EndpointConfig
+from rasa_addons.core.nlg.graphql import GraphQLNaturalLanguageGenerator
+
+
+class FakeResponse:
+    def __init__(self, body: Dict[Text, Any]) -> None:
+        self.body = body
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def json(self, content_type: Any = None) -> Dict[Text, Any]:
+        return self.body
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.requests: List[Dict[Text, Any]] = []
+
+    def post(self, url: Text, json: Dict[Text, Any]) -> FakeResponse:
+        self.requests.append(json)
+        template = json["variables"]["template"]
+        return FakeResponse(
+            {
+                "data": {
+                    "getResponse": {
+                        "customText": f"{template} for {{name}}",
+                        "metadata": {"linkTarget": "_blank"},
+                    }
+                }
+            }
+        )
+
+
+def _nlg(monkeypatch: MonkeyPatch, **kwargs: Any) -> GraphQLNaturalLanguageGenerator:
+    nlg = GraphQLNaturalLanguageGenerator(
+        endpoint_config=EndpointConfig("http://localhost:3000/graphql", **kwargs)
+    )
+    session = FakeSession()
+    monkeypatch.setattr(nlg, "_get_session", lambda: session)
+    return nlg
+
+
+def _tracker(name: Text) -> DialogueStateTracker:
+    return DialogueStateTracker.from_events(
+        "some-user",
+        [UserUttered("hi", {"name": "greet"}), SlotSet("name", name)],
+        slots=[TextSlot("name")],
+    )
+
+
+async def test_generate_sends_conversation_state_without_events(
+    monkeypatch: MonkeyPatch,
+):
+    nlg = _nlg(monkeypatch)
+
+    response = await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+
+    assert response["text"] == "utter_greet for Ada"
+    assert response["linkTarget"] == "_blank"
+    assert response["template_name"] == "utter_greet"
+
+    request = nlg._get_session().requests[0]
+    assert request["variables"]["tracker"]["events"] == []
+    assert request["variables"]["tracker"]["slots"] == {"name": "Ada"}
+    assert request["variables"]["channel"] == {"name": "webchat"}
+
+
+async def test_generate_caches_responses(monkeypatch: MonkeyPatch):
+    nlg = _nlg(monkeypatch, cache_ttl=60)
+    requests = nlg._get_session().requests
+
+    await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+    response = await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+    assert len(requests) == 1
+    assert response["text"] == "utter_greet for Ada"
+
+    # slots, channels and templates are part of the cache key
+    await nlg.generate("utter_greet", _tracker("Grace"), "webchat")
+    await nlg.generate("utter_greet", _tracker("Ada"), "rest")
+    await nlg.generate("utter_bye", _tracker("Ada"), "webchat")
+    assert len(requests) == 4
+
+
+async def test_generate_without_cache(monkeypatch: MonkeyPatch):
+    nlg = _nlg(monkeypatch)
+
+    await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+    await nlg.generate("utter_greet", _tracker("Ada"), "webchat")
+
+    assert len(nlg._get_session().requests) == 2
+
+
+def test_sessions_are_closed_when_replaced_and_on_shutdown():
+    nlg = GraphQLNaturalLanguageGenerator(
+        endpoint_config=EndpointConfig("http://localhost:3000/graphql")
+    )
+
+    async def get_session() -> Any:
+        return nlg._get_session()
+
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        first_session = first_loop.run_until_complete(get_session())
+        second_session = second_loop.run_until_complete(get_session())
+        # the session of the previous loop is closed in the background
+        second_loop.run_until_complete(asyncio.sleep(0))
+
+        assert first_session.closed
+        assert not second_session.closed
+
+        second_loop.run_until_complete(rasa.utils.endpoints.close_sessions())
+        assert second_session.closed
+    finally:
+        first_loop.close()
+        second_loop.close()
@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Text
+
+import pytest
+from fuzzy_matcher import process
+
+from rasa.shared.nlu.constants import ENTITIES
+from rasa.shared.nlu.training_data.message import Message
+from rasa_addons.gazette import Gazette, GazetteIndex
+
+CITIES = ["Helsinki", "Espoo", "Tampere", "Vantaa", "Oulu", "Turku", "Jyväskylä"]
+
+
+def _brute_force_match(value: Text, mode: Text, min_score: int):
+    matches = process.extract(value, [city.lower() for city in CITIES], scorer=mode)
+    primary, score = matches[0]
+    return (primary, score) if score > min_score else (None, None)
+
+
+@pytest.mark.parametrize("mode", ["ratio", "partial_ratio"])
+@pytest.mark.parametrize("min_score", [0, 50, 80, 100])
+@pytest.mark.parametrize(
+    "value", ["helsinky", "espo", "tampere", "vanta", "jyvaskyla", "o", "xyz"]
+)
+def test_index_matches_like_fuzzy_matcher(value: Text, mode: Text, min_score: int):
+    index = GazetteIndex(CITIES)
+
+    assert index.best_match(value, mode, min_score) == _brute_force_match(
+        value, mode, min_score
+    )
+
+
+def test_process_uses_persisted_index(tmp_path: Path):
+    gazette = Gazette(
+        {"min_score": 70},
+        {"gazette": {"city": CITIES}, "entities": [{"name": "city"}]},
+    )
+    meta = gazette.persist("component_0_Gazette", str(tmp_path))
+    loaded = Gazette.load({**gazette.component_config, **meta}, str(tmp_path))
+
+    message = Message(
+        data={ENTITIES: [{"entity": "city", "value": "Helsinky", "start": 0}]}
+    )
+    loaded.process(message)
+
+    assert loaded.index["city"].elements == [city.lower() for city in CITIES]
+    assert message.get(ENTITIES)[0]["value"] == "helsinki"
@@ -340,10 +340,10 @@ def test_train_help(run: Callable[..., RunResult]):
     help_text = """usage: rasa train [-h] [-v] [-vv] [--quiet] [--data DATA [DATA ...]]
                   [-c CONFIG] [-d DOMAIN] [--out OUT] [--dry-run]
                   [--augmentation AUGMENTATION] [--debug-plots]
-                  [--num-threads NUM_THREADS]
+                  [--num-threads NUM_THREADS] [--cache-dir CACHE_DIR]
                   [--fixed-model-name FIXED_MODEL_NAME] [--persist-nlu-data]
                   [--force] [--finetune [FINETUNE]]
-                  [--epoch-fraction EPOCH_FRACTION]
+                  [--epoch-fraction EPOCH_FRACTION] [--concurrent-training]
                   {core,nlu} ..."""
 
     lines = help_text.split("\n")
@@ -359,6 +359,7 @@ def test_train_nlu_help(run: Callable[..., RunResult]):
 
     help_text = """usage: rasa train nlu [-h] [-v] [-vv] [--quiet] [-c CONFIG] [-d DOMAIN]
                       [--out OUT] [-u NLU] [--num-threads NUM_THREADS]
+                      [--cache-dir CACHE_DIR]
                       [--fixed-model-name FIXED_MODEL_NAME]
                       [--persist-nlu-data] [--finetune [FINETUNE]]
                       [--epoch-fraction EPOCH_FRACTION]"""
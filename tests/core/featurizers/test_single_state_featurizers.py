@@ -528,3 +528,50 @@ def test_single_state_featurizer_uses_regex_interpreter(
     # RegexInterpreter cannot create features for text, therefore since featurizer
     # was trained without nlu, features for text should be empty
     assert not features
+
+
+def test_single_state_featurizer_caches_features_of_sub_states():
+    class CountingInterpreter(RegexInterpreter):
+        def __init__(self) -> None:
+            self.number_of_calls = 0
+
+        def featurize_message(self, message):
+            self.number_of_calls += 1
+            return super().featurize_message(message)
+
+    f = SingleStateFeaturizer()
+    f._default_feature_states[INTENT] = {"a": 0, "b": 1}
+    f._default_feature_states[ACTION_NAME] = {"c": 0, "d": 1, "action_listen": 2}
+    state = {
+        "user": {"intent": "a"},
+        "prev_action": {"action_name": "action_listen"},
+    }
+
+    interpreter = CountingInterpreter()
+    encoded = f.encode_state(state, interpreter)
+    encoded_again = f.encode_state(state, interpreter)
+
+    assert interpreter.number_of_calls == 2
+    assert encoded[INTENT][0] is encoded_again[INTENT][0]
+    assert encoded[INTENT] is not encoded_again[INTENT]
+
+    # features of a different interpreter are not reused
+    other_interpreter = CountingInterpreter()
+    f.encode_state(state, other_interpreter)
+    assert other_interpreter.number_of_calls == 2
+
+
+def test_prepare_for_training_clears_cached_features():
+    f = SingleStateFeaturizer()
+    interpreter = RegexInterpreter()
+    f.prepare_for_training(Domain.from_dict({"intents": ["a", "b"]}), interpreter)
+    state = {"user": {"intent": "a"}}
+    f.encode_state(state, interpreter)
+    assert len(f._features_cache())
+
+    # the intent has a different index in the new domain
+    f.prepare_for_training(Domain.from_dict({"intents": ["b", "a"]}), interpreter)
+    assert not len(f._features_cache())
+
+    encoded = f.encode_state(state, interpreter)
+    assert (encoded[INTENT][0].features != scipy.sparse.coo_matrix([[0, 1]])).nnz == 0
@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from rasa.core.policies.inference_queue import InferenceQueue
+
+
+class RecordingPredictor:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def __call__(self, batch: List[int]) -> List[int]:
+        self.batches.append(batch)
+        return [value * 2 for value in batch]
+
+
+def test_predictions_are_gathered_into_batches():
+    predictor = RecordingPredictor()
+    inference_queue = InferenceQueue(predictor, max_batch_size=4, max_wait=1.0)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(inference_queue.predict, range(8)))
+
+    assert results == [value * 2 for value in range(8)]
+    assert all(len(batch) <= 4 for batch in predictor.batches)
+    assert sorted(value for batch in predictor.batches for value in batch) == list(
+        range(8)
+    )
+
+    assert inference_queue.metrics.number_of_predictions == 8
+    assert inference_queue.metrics.number_of_batches == len(predictor.batches)
+    assert inference_queue.metrics.average_batch_fill == pytest.approx(
+        8 / (4 * len(predictor.batches))
+    )
+
+
+def test_batch_is_predicted_after_max_wait():
+    predictor = RecordingPredictor()
+    inference_queue = InferenceQueue(predictor, max_batch_size=100, max_wait=0.05)
+
+    start = time.monotonic()
+    assert inference_queue.predict(21) == 42
+
+    assert time.monotonic() - start < 5
+    assert predictor.batches == [[21]]
+    assert inference_queue.metrics.average_batch_size == 1
+    assert inference_queue.metrics.average_batch_fill == pytest.approx(0.01)
+
+
+def test_errors_are_raised_for_every_prediction_of_the_batch():
+    barrier = threading.Barrier(2)
+
+    def predict_batch(batch: List[int]) -> List[int]:
+        raise ValueError("prediction failed")
+
+    def predict(value: int) -> None:
+        barrier.wait()
+        with pytest.raises(ValueError, match="prediction failed"):
+            inference_queue.predict(value)
+
+    inference_queue = InferenceQueue(predict_batch, max_batch_size=2, max_wait=1.0)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(predict, range(2)))
+
+    assert inference_queue.metrics.number_of_batches == 0
+
+
+def test_close_stops_the_worker():
+    predictor = RecordingPredictor()
+    inference_queue = InferenceQueue(predictor, max_batch_size=4, max_wait=0.01)
+    assert inference_queue.predict(1) == 2
+    worker = inference_queue._worker
+
+    inference_queue.close()
+    worker.join(5)
+
+    assert not worker.is_alive()
+    # predictions after closing the queue are not batched anymore
+    assert inference_queue.predict(2) == 4
+    assert inference_queue._worker is None
+    assert predictor.batches == [[1], [2]]
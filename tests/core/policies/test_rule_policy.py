@@ -1,5 +1,6 @@
+import json
 from pathlib import Path
-from typing import Text
+from typing import Any, Dict, List, Text
 
 import pytest
 
@@ -3067,3 +3068,72 @@ def test_include_action_unlikely_intent():
         RegexInterpreter(),
     )
     test_utils.assert_predicted_action(prediction, domain, utter_2)
+
+
+def _rule_key(states: List[Dict[Text, Any]]) -> Text:
+    return json.dumps(states, sort_keys=True)
+
+
+def test_rule_index_only_checks_candidate_rules():
+    rules = {}
+    for i in range(2000):
+        rule_states = [
+            {PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}},
+            {
+                PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+                USER: {INTENT: f"intent_{i}"},
+            },
+        ]
+        if i % 3 == 0:
+            rule_states[-1][ACTIVE_LOOP] = {LOOP_NAME: f"loop_{i % 5}"}
+        rules[_rule_key(rule_states)] = f"utter_{i}"
+    rules[_rule_key([{PREVIOUS_ACTION: {ACTION_NAME: "utter_other"}}])] = "utter_x"
+    rules[_rule_key([{}, {USER: {INTENT: "intent_3"}}])] = "utter_start"
+
+    policy = RulePolicy(lookup={RULES: rules})
+
+    conversation_states = [
+        {PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME}},
+        {
+            PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+            USER: {INTENT: "intent_3"},
+            ACTIVE_LOOP: {LOOP_NAME: "loop_3"},
+        },
+    ]
+    # check every single rule to get the expected result
+    expected_keys = {
+        rule_key
+        for rule_key in rules
+        if all(
+            policy._is_rule_applicable(list(reversed(json.loads(rule_key))), i, state)
+            for i, state in enumerate(reversed(conversation_states))
+        )
+    }
+
+    assert len(expected_keys) == 1
+    assert policy._get_possible_keys(RULES, conversation_states) == expected_keys
+    assert len(policy._rule_index(RULES).candidates(conversation_states[-1])) == 1
+
+    # the index is compiled again if rules are removed from the lookup
+    rules.pop(next(iter(expected_keys)))
+    assert policy._get_possible_keys(RULES, conversation_states) == set()
+
+
+def test_rule_index_with_rule_which_starts_the_conversation():
+    conversation_start_rule_key = _rule_key([{}, {USER: {INTENT: GREET_INTENT_NAME}}])
+    rules = {
+        conversation_start_rule_key: UTTER_GREET_ACTION,
+        _rule_key(
+            [
+                {
+                    PREVIOUS_ACTION: {ACTION_NAME: ACTION_LISTEN_NAME},
+                    USER: {INTENT: GREET_INTENT_NAME},
+                }
+            ]
+        ): UTTER_GREET_ACTION,
+    }
+    policy = RulePolicy(lookup={RULES: rules})
+
+    assert policy._get_possible_keys(
+        RULES, [{USER: {INTENT: GREET_INTENT_NAME}}]
+    ) == {conversation_start_rule_key}
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Type
 from unittest.mock import Mock
@@ -48,10 +49,13 @@ from rasa.utils.tensorflow.constants import (
     IDS,
     EVAL_NUM_EPOCHS,
     EPOCHS,
+    INFERENCE_BATCH_SIZE,
+    INFERENCE_MAX_WAIT,
 )
 from rasa.shared.nlu.constants import ACTION_NAME
 from rasa.utils.tensorflow import model_data_utils
 from tests.core.test_policies import PolicyTestCollection
+from tests.core.utilities import get_tracker, user_uttered
 from rasa.shared.constants import DEFAULT_SENDER_ID, DEFAULT_CORE_SUBDIRECTORY_NAME
 
 UTTER_GREET_ACTION = "utter_greet"
@@ -724,6 +728,59 @@ class TestTEDPolicyWithMaxHistory(TestTEDPolicy):
         assert isinstance(loaded.featurizer.state_featurizer, SingleStateFeaturizer)
 
 
+class TestTEDPolicyWithInferenceQueue(TestTEDPolicyWithMaxHistory):
+    def create_policy(
+        self, featurizer: Optional[TrackerFeaturizer], priority: int
+    ) -> Policy:
+        return TEDPolicy(
+            priority=priority,
+            max_history=self.max_history,
+            **{INFERENCE_BATCH_SIZE: 4, INFERENCE_MAX_WAIT: 0.1},
+        )
+
+    def test_concurrent_predictions_are_batched(
+        self, trained_policy: TEDPolicy, default_domain: Domain
+    ):
+        trackers = [
+            get_tracker([ActionExecuted(ACTION_LISTEN_NAME), user_uttered(intent)])
+            for intent in default_domain.intents[:4]
+        ]
+
+        queue = trained_policy.inference_queue
+        trained_policy.inference_queue = None
+        expected = [
+            trained_policy.predict_action_probabilities(
+                tracker, default_domain, RegexInterpreter()
+            )
+            for tracker in trackers
+        ]
+        trained_policy.inference_queue = queue
+
+        with ThreadPoolExecutor(max_workers=len(trackers)) as executor:
+            predictions = list(
+                executor.map(
+                    lambda tracker: trained_policy.predict_action_probabilities(
+                        tracker, default_domain, RegexInterpreter()
+                    ),
+                    trackers,
+                )
+            )
+
+        for prediction, expected_prediction in zip(predictions, expected):
+            assert np.allclose(
+                prediction.probabilities, expected_prediction.probabilities
+            )
+        assert queue.metrics.number_of_predictions == len(trackers)
+        assert queue.metrics.number_of_batches < len(trackers)
+
+
+def test_inference_queue_requires_max_history_featurizer():
+    with pytest.warns(UserWarning, match=INFERENCE_BATCH_SIZE):
+        policy = TEDPolicy(**{INFERENCE_BATCH_SIZE: 4})
+
+    assert policy.inference_queue is None
+
+
 class TestTEDPolicyWithRelativeAttention(TestTEDPolicy):
     def create_policy(
         self, featurizer: Optional[TrackerFeaturizer], priority: int
@@ -1,8 +1,10 @@
+import asyncio
 import textwrap
 from datetime import datetime
-from typing import List, Text
+from typing import Any, Dict, List, Text
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 from jsonschema import ValidationError
 
@@ -609,6 +611,89 @@ async def test_remote_action_multiple_events_payload(
     assert events[2].as_dict().get("text") == "hello"
 
 
+
+async def test_remote_action_generates_responses_concurrently(
+    default_channel, default_tracker
+):
+    responses = [{"response": "utter_one"}, {"text": "hi"}, {"response": "utter_two"}]
+    all_requests_started = asyncio.Event()
+    started_requests = []
+
+    class WaitingNaturalLanguageGenerator(NaturalLanguageGenerator):
+        async def generate(
+            self, template_name: Text, tracker, output_channel: Text, **kwargs: Any
+        ) -> Dict[Text, Any]:
+            started_requests.append(template_name)
+            if len(started_requests) == 2:
+                all_requests_started.set()
+            # only finishes if the other request was started in the meantime
+            await asyncio.wait_for(all_requests_started.wait(), timeout=5)
+            return {"text": template_name}
+
+    bot_messages = await RemoteAction._utter_responses(
+        responses, default_channel, WaitingNaturalLanguageGenerator(), default_tracker
+    )
+
+    assert [message.text for message in bot_messages] == [
+        "utter_one",
+        "hi",
+        "utter_two",
+    ]
+    assert bot_messages[0].metadata["utter_action"] == "utter_one"
+
+
+async def test_remote_action_sends_deltas(
+    default_channel, default_nlg, domain: Domain, monkeypatch: MonkeyPatch
+):
+    endpoint = EndpointConfig(
+        "https://example.com/delta/webhooks/actions", delta_requests=True
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+    tracker = DialogueStateTracker.from_events(
+        "delta-sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")]
+    )
+    requests = []
+    # the events the action server has cached for the conversation
+    cached_events = []
+
+    async def request(json: Dict[Text, Any], **kwargs: Any) -> Dict[Text, Any]:
+        requests.append(json)
+        if json["events_offset"] > len(cached_events):
+            raise ClientResponseError(409, "Conflict", '{"missing": ["events"]}')
+        cached_events[json["events_offset"] :] = json["tracker"]["events"]
+        return {
+            "events": [],
+            "responses": [],
+            "domain_digest": json["domain_digest"],
+            "events_watermark": len(cached_events),
+        }
+
+    monkeypatch.setattr(endpoint, "request", request)
+
+    await remote_action.run(default_channel, default_nlg, tracker, domain)
+    assert requests[0]["domain"] == domain.as_dict()
+    assert requests[0]["events_offset"] == 0
+    assert len(requests[0]["tracker"]["events"]) == 2
+
+    tracker.update(ActionExecuted("my_action"))
+    await remote_action.run(default_channel, default_nlg, tracker, domain)
+    assert "domain" not in requests[1]
+    assert requests[1]["domain_digest"] == domain.fingerprint()
+    assert requests[1]["events_offset"] == 2
+    assert [event["event"] for event in requests[1]["tracker"]["events"]] == [
+        ActionExecuted.type_name
+    ]
+    assert requests[1]["tracker"]["slots"] == tracker.current_state()["slots"]
+
+    # the action server lost its cache
+    cached_events.clear()
+    await remote_action.run(default_channel, default_nlg, tracker, domain)
+    assert requests[2]["events_offset"] == 3
+    assert requests[3]["events_offset"] == 0
+    assert requests[3]["domain"] == domain.as_dict()
+    assert len(cached_events) == len(tracker.events)
+
+
 async def test_remote_action_without_endpoint(
     default_channel, default_nlg, default_tracker, domain: Domain
 ):
@@ -22,6 +22,7 @@ from rasa.core.agent import Agent, load_agent
 from rasa.core.channels.channel import UserMessage
 from rasa.shared.core.domain import InvalidDomain, Domain
 from rasa.shared.constants import INTENT_MESSAGE_PREFIX
+from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 from rasa.core.policies.ensemble import PolicyEnsemble, SimplePolicyEnsemble
 from rasa.core.policies.memoization import AugmentedMemoizationPolicy, MemoizationPolicy
 from rasa.utils.endpoints import EndpointConfig
@@ -380,6 +381,39 @@ async def test_agent_update_model_none_domain(trained_rasa_model: Text):
     assert tracker.events[3].intent["name"] == "greet"
 
 
+def test_agent_update_model_closes_replaced_interpreter():
+    interpreter = Mock(spec=NaturalLanguageInterpreter)
+    agent = Agent(interpreter=interpreter)
+
+    agent.update_model(None, None, agent.fingerprint, interpreter)
+    interpreter.close.assert_not_called()
+
+    new_interpreter = Mock(spec=NaturalLanguageInterpreter)
+    agent.update_model(None, None, agent.fingerprint, new_interpreter)
+
+    interpreter.close.assert_called_once()
+    assert agent.interpreter is new_interpreter
+
+    agent.close_model()
+    new_interpreter.close.assert_called_once()
+
+
+def test_agent_update_model_closes_replaced_policy_ensemble():
+    ensemble = Mock(spec=PolicyEnsemble)
+    agent = Agent()
+    agent.policy_ensemble = ensemble
+
+    agent.update_model(None, ensemble, agent.fingerprint)
+    ensemble.close.assert_not_called()
+
+    new_ensemble = Mock(spec=PolicyEnsemble)
+    agent.update_model(None, new_ensemble, agent.fingerprint)
+    ensemble.close.assert_called_once()
+
+    agent.close_model()
+    new_ensemble.close.assert_called_once()
+
+
 async def test_load_agent_on_not_existing_path():
     agent = await load_agent(model_path="some-random-path")
 
@@ -1,9 +1,10 @@
 import json
 import logging
 import textwrap
+import time
 from asyncio.events import AbstractEventLoop
 from pathlib import Path
-from typing import Union, Text, List, Optional, Type, Dict, Any
+from typing import Union, Text, List, Optional, Type, Dict, Any, Callable
 
 import aio_pika.exceptions
 import aiormq.exceptions
@@ -20,10 +21,12 @@ from tests.conftest import AsyncMock
 import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.core.brokers.broker import EventBroker
+from rasa.core.brokers.buffered import BUFFER_CONFIG_KEY, BufferedEventBroker
 from rasa.core.brokers.file import FileEventBroker
 from rasa.core.brokers.kafka import KafkaEventBroker, KafkaProducerInitializationError
 from rasa.core.brokers.pika import PikaEventBroker, DEFAULT_QUEUE_NAME
 from rasa.core.brokers.sql import SQLEventBroker
+from rasa.core.constants import POSTGRESQL_POOL_SIZE, POSTGRESQL_SCHEMA
 from rasa.shared.core.events import Event, Restarted, SlotSet, UserUttered
 from rasa.shared.exceptions import ConnectionException, RasaException
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
@@ -395,3 +398,196 @@ async def test_sql_connection_error(monkeypatch: MonkeyPatch):
     )
     with pytest.raises(ConnectionException):
         await EventBroker.create(cfg)
+
+
+def test_sql_broker_publish_batch_keeps_order_of_events():
+    broker = SQLEventBroker(db=":memory:")
+    events = [
+        {"sender_id": f"sender_{i % 3}", "event": "slot", "value": i}
+        for i in range(1000)
+    ]
+
+    broker.publish_batch(events)
+
+    with broker.session_scope() as session:
+        rows = session.query(broker.SQLBrokerEvent).order_by(
+            broker.SQLBrokerEvent.id
+        )
+        assert [json.loads(row.data) for row in rows] == events
+
+
+def test_sql_broker_uses_default_postgresql_schema(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(POSTGRESQL_SCHEMA, "schema")
+    monkeypatch.setenv(POSTGRESQL_POOL_SIZE, "10")
+
+    kwargs = SQLEventBroker._create_engine_kwargs("postgresql://localhost/events")
+
+    assert kwargs["pool_size"] == 10
+    assert "connect_args" not in kwargs
+
+
+async def test_buffered_sql_broker_inserts_events_on_close(tmp_path: Path):
+    db = str(tmp_path / "events.db")
+    cfg = EndpointConfig(
+        type="sql",
+        dialect="sqlite",
+        db=db,
+        buffer={"max_batch_size": 100, "flush_interval": 60},
+    )
+    broker = await EventBroker.create(cfg)
+    assert isinstance(broker, BufferedEventBroker)
+
+    for e in TEST_EVENTS:
+        broker.publish(e.as_dict())
+    await broker.close()
+
+    reopened = SQLEventBroker(db=db)
+    with reopened.session_scope() as session:
+        events_types = [
+            json.loads(event.data)["event"]
+            for event in session.query(reopened.SQLBrokerEvent).all()
+        ]
+
+    assert events_types == ["user", "slot", "restart"]
+
+
+class FlakyEventBroker(EventBroker):
+    def __init__(self) -> None:
+        self.is_reachable = True
+        self.batches = []
+
+    def publish(self, event: Dict[Text, Any]) -> None:
+        self.publish_batch([event])
+
+    def publish_batch(self, events: List[Dict[Text, Any]]) -> None:
+        if not self.is_reachable:
+            raise ConnectionException("Broker is down.")
+        self.batches.append(events)
+
+    @property
+    def published_events(self) -> List[Dict[Text, Any]]:
+        return [event for batch in self.batches for event in batch]
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    start = time.time()
+    while not condition() and time.time() - start < timeout:
+        time.sleep(0.01)
+    assert condition()
+
+
+async def test_buffered_broker_publishes_in_batches():
+    broker = FlakyEventBroker()
+    buffered = BufferedEventBroker(broker, max_batch_size=2, flush_interval=0.1)
+    events = [{"event": "slot", "value": i} for i in range(5)]
+
+    for event in events:
+        buffered.publish(event)
+
+    _wait_for(lambda: len(broker.published_events) == len(events))
+    assert broker.published_events == events
+    assert all(len(batch) <= 2 for batch in broker.batches)
+    assert buffered.metrics.number_of_published_events == len(events)
+
+    await buffered.close()
+
+
+async def test_buffered_broker_spools_events_while_broker_is_down(tmp_path: Path):
+    broker = FlakyEventBroker()
+    broker.is_reachable = False
+    buffered = BufferedEventBroker(
+        broker,
+        max_queue_size=2,
+        flush_interval=0.01,
+        retry_delay_in_seconds=0.01,
+        spool_path=str(tmp_path / "spool.jsonl"),
+    )
+    events = [{"event": "slot", "value": i} for i in range(10)]
+
+    for event in events:
+        buffered.publish(event)
+
+    assert buffered.metrics.number_of_spooled_events > 0
+    _wait_for(lambda: buffered.metrics.number_of_failed_batches > 0)
+
+    broker.is_reachable = True
+
+    _wait_for(lambda: len(broker.published_events) == len(events))
+    # the spooled events are published after the events of the queue
+    assert broker.published_events == events
+    assert buffered.metrics.spool_size == 0
+
+    await buffered.close()
+
+
+async def test_buffered_broker_spools_events_when_broker_fails(tmp_path: Path):
+    spool_path = tmp_path / "spool.jsonl"
+    broker = FlakyEventBroker()
+    broker.is_reachable = False
+    buffered = BufferedEventBroker(
+        broker,
+        flush_interval=0.01,
+        retry_delay_in_seconds=60,
+        spool_path=str(spool_path),
+    )
+    events = [{"event": "slot", "value": i} for i in range(3)]
+
+    for event in events:
+        buffered.publish(event)
+
+    # the events of the failed batch are on disk, even though the queue isn't full
+    _wait_for(lambda: buffered.metrics.spool_size == len(events))
+    spooled = [
+        json.loads(line) for line in spool_path.read_text().splitlines() if line
+    ]
+    assert spooled == events
+    assert buffered.metrics.number_of_failed_batches > 0
+    assert buffered.metrics.queue_size == 0
+
+    # new events are kept behind the spooled ones
+    buffered.publish({"event": "slot", "value": 3})
+    assert len(spool_path.read_text().splitlines()) == len(events) + 1
+
+    await buffered.close()
+
+
+async def test_buffered_broker_replays_spool_after_restart(tmp_path: Path):
+    spool_path = str(tmp_path / "spool.jsonl")
+    broker = FlakyEventBroker()
+    broker.is_reachable = False
+    buffered = BufferedEventBroker(
+        broker, retry_delay_in_seconds=0.01, spool_path=spool_path, close_timeout=1
+    )
+    events = [{"event": "slot", "value": i} for i in range(3)]
+
+    for event in events:
+        buffered.publish(event)
+    await buffered.close()
+
+    assert not broker.published_events
+
+    broker.is_reachable = True
+    restarted = BufferedEventBroker(broker, spool_path=spool_path)
+
+    _wait_for(lambda: len(broker.published_events) == len(events))
+    assert broker.published_events == events
+
+    await restarted.close()
+
+
+async def test_buffered_broker_from_config(tmp_path: Path):
+    config = EndpointConfig(
+        **{
+            "type": "file",
+            "path": str(tmp_path / "events.log"),
+            BUFFER_CONFIG_KEY: {"max_batch_size": 10},
+        }
+    )
+
+    broker = await EventBroker.create(config)
+
+    assert isinstance(broker, BufferedEventBroker)
+    assert isinstance(broker.broker, FileEventBroker)
+    assert broker.max_batch_size == 10
+
+    await broker.close()
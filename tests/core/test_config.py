@@ -19,6 +19,7 @@ from rasa.shared.core.constants import (
 )
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import ActionExecuted
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.shared.core.training_data.story_writer.yaml_story_writer import (
     YAMLStoryWriter,
 )
@@ -34,6 +35,44 @@ def test_load_config(filename):
     assert isinstance(loaded[1], ExamplePolicy)
 
 
+@pytest.mark.parametrize(
+    "config, expected_arguments",
+    [
+        ({}, {}),
+        ({"policies": [], "data": None}, {}),
+        ({"data": {"story_generation_workers": 4}}, {"story_generation_workers": 4}),
+    ],
+)
+def test_load_data_generation_arguments(
+    config: Dict[Text, Any], expected_arguments: Dict[Text, Any]
+):
+    assert rasa.core.config.load_data_generation_arguments(config) == (
+        expected_arguments
+    )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"data": ["story_generation_workers"]},
+        {"data": {"story_generation_workers": 0}},
+        {"data": {"story_generation_workers": "4"}},
+    ],
+)
+def test_load_invalid_data_generation_arguments(config: Dict[Text, Any]):
+    with pytest.raises(InvalidConfigException):
+        rasa.core.config.load_data_generation_arguments(config)
+
+
+def test_load_data_generation_arguments_from_config_with_empty_data_key():
+    assert (
+        rasa.core.config.load_data_generation_arguments(
+            "data/test_config/config_defaults.yml"
+        )
+        == {}
+    )
+
+
 @pytest.mark.parametrize(
     "config, expected_config, expected_triggered_action",
     [
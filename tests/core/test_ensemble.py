@@ -18,6 +18,7 @@ from rasa.shared.core.generator import TrackerWithCachedStates
 from rasa.shared.core.events import UserUttered, ActiveLoop, Event, SlotSet
 from rasa.core.policies.fallback import FallbackPolicy
 from rasa.core.policies.form_policy import FormPolicy
+from rasa.core.policies.inference_queue import InferenceQueue
 from rasa.core.policies.policy import Policy, PolicyPrediction
 from rasa.core.policies.ensemble import (
     PolicyEnsemble,
@@ -91,6 +92,22 @@ class WorkingPolicy(Policy):
         return isinstance(other, WorkingPolicy)
 
 
+def test_close_stops_inference_queues_and_prediction_executor():
+    policy = WorkingPolicy()
+    policy.inference_queue = InferenceQueue(
+        lambda batch: batch, max_batch_size=4, max_wait=0.01
+    )
+    ensemble = PolicyEnsemble([policy])
+    executor = ensemble.prediction_executor()
+    assert executor is not None
+
+    ensemble.close()
+
+    assert policy.inference_queue._closed
+    assert executor._shutdown
+    assert ensemble.prediction_executor() is None
+
+
 def test_policy_loading_simple(tmp_path: Path):
     original_policy_ensemble = PolicyEnsemble([WorkingPolicy()])
     original_policy_ensemble.train([], None, RegexInterpreter())
@@ -1,7 +1,10 @@
+import asyncio
+from typing import Text
+
 import pytest
 from aioresponses import aioresponses
 
-from rasa.core.interpreter import RasaNLUHttpInterpreter
+from rasa.core.interpreter import RasaNLUHttpInterpreter, RasaNLUInterpreter
 from rasa.utils.endpoints import EndpointConfig
 from tests.utilities import latest_request, json_of_latest_request
 
@@ -28,3 +31,49 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+class _FakeNLUInterpreter:
+    def __init__(self):
+        self.parsed_texts = []
+
+    def parse(self, text):
+        self.parsed_texts.append(text)
+        return {"text": text}
+
+    def parse_batch(self, texts):
+        return [self.parse(text) for text in texts]
+
+
+@pytest.mark.parametrize("inference_executor", ["none", "thread"])
+async def test_rasa_nlu_interpreter_parse(inference_executor: Text):
+    interpreter = RasaNLUInterpreter(
+        "some/model", lazy_init=True, inference_executor=inference_executor
+    )
+    interpreter.interpreter = _FakeNLUInterpreter()
+
+    assert await interpreter.parse("hello") == {"text": "hello"}
+    interpreter.close()
+
+
+async def test_rasa_nlu_interpreter_batches_concurrent_messages():
+    interpreter = RasaNLUInterpreter(
+        "some/model",
+        lazy_init=True,
+        inference_executor="thread",
+        max_batch_size=4,
+        max_wait_time_in_seconds=0.05,
+    )
+    interpreter.interpreter = _FakeNLUInterpreter()
+    texts = [f"message {i}" for i in range(4)]
+
+    results = await asyncio.gather(*[interpreter.parse(text) for text in texts])
+
+    assert [result["text"] for result in results] == texts
+    assert interpreter._batcher.number_of_batches == 1
+    interpreter.close()
+
+
+def test_rasa_nlu_interpreter_with_unknown_executor():
+    with pytest.raises(ValueError):
+        RasaNLUInterpreter("some/model", lazy_init=True, inference_executor="gpu")
@@ -96,6 +96,7 @@ async def test_close_resources(loop: AbstractEventLoop):
         await run.close_resources(app, loop)
 
     assert len(warnings) == 0
+    app.agent.close_model.assert_called_once()
 
 
 async def test_close_resources_with_sync(loop: AbstractEventLoop):
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -17,7 +20,7 @@ from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
-from typing import Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
+from typing import Any, Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
 from unittest.mock import Mock
 
 import rasa.core.tracker_store
@@ -35,6 +38,7 @@ from rasa.shared.core.events import (
 )
 from rasa.shared.exceptions import ConnectionException
 from rasa.core.tracker_store import (
+    AsyncTrackerStore,
     TrackerStore,
     InMemoryTrackerStore,
     RedisTrackerStore,
@@ -69,6 +73,18 @@ def test_get_or_create():
     get_or_create_tracker_store(InMemoryTrackerStore(test_domain))
 
 
+def test_get_or_create_limits_event_history_of_created_tracker():
+    tracker_store = InMemoryTrackerStore(test_domain)
+
+    tracker = tracker_store.get_or_create_tracker(
+        DEFAULT_SENDER_ID, max_event_history=2
+    )
+
+    assert tracker.events.maxlen == 2
+    # the tracker store is shared by all conversations and isn't changed
+    assert tracker_store.max_event_history is None
+
+
 # noinspection PyPep8Naming
 @mock_dynamodb2
 def test_dynamo_get_or_create():
@@ -190,6 +206,129 @@ def test_redis_tracker_store_valid_key_prefix(domain: Domain):
     )
 
 
+class MockedRedisEventLogTrackerStore(RedisTrackerStore):
+    def __init__(self, _domain: Domain, **kwargs: Any) -> None:
+        super().__init__(_domain, use_event_log=True, **kwargs)
+
+        import fakeredis
+
+        self.red = fakeredis.FakeStrictRedis()
+
+
+def _session_events(message: Text) -> List[Event]:
+    return [
+        ActionExecuted(ACTION_SESSION_START_NAME),
+        SessionStarted(),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(message),
+    ]
+
+
+def test_redis_event_log_appends_only_new_events(domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(domain)
+    events_key = tracker_store._events_key(DEFAULT_SENDER_ID)
+
+    tracker = DialogueStateTracker.from_events(
+        DEFAULT_SENDER_ID, _session_events("hi")
+    )
+    tracker_store.save(tracker)
+    assert tracker_store.red.llen(events_key) == 4
+
+    tracker = tracker_store.retrieve(DEFAULT_SENDER_ID)
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+    assert tracker_store.red.llen(events_key) == 5
+
+    # saving again doesn't store any events twice
+    tracker_store.save(tracker)
+    assert tracker_store.red.llen(events_key) == 5
+
+    assert tracker_store.retrieve(DEFAULT_SENDER_ID) == tracker
+    # the tracker isn't stored as serialised dialogue
+    assert tracker_store.red.get(tracker_store.key_prefix + DEFAULT_SENDER_ID) is None
+
+
+def test_redis_event_log_stores_events_beyond_max_event_history(domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(domain)
+    tracker_store.max_event_history = 3
+    events_key = tracker_store._events_key(DEFAULT_SENDER_ID)
+
+    tracker = tracker_store.get_or_create_tracker(DEFAULT_SENDER_ID)
+    for message in ["hi", "hey", "bye"]:
+        tracker.update(UserUttered(message))
+        tracker_store.save(tracker)
+
+    # the tracker only keeps the latest events, but all of them are stored
+    assert len(tracker.events) == 3
+    assert tracker_store.red.llen(events_key) == 4
+
+
+def test_redis_event_log_retrieves_latest_session(domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(domain)
+
+    tracker = DialogueStateTracker.from_events(
+        DEFAULT_SENDER_ID, _session_events("first session")
+    )
+    tracker_store.save(tracker)
+
+    second_session = _session_events("second session")
+    tracker = tracker_store.retrieve(DEFAULT_SENDER_ID)
+    tracker.update_with_events(second_session, domain)
+    tracker_store.save(tracker)
+
+    tracker = tracker_store.retrieve(DEFAULT_SENDER_ID)
+    assert list(tracker.events) == second_session[1:]
+
+    # new events of the retrieved tracker are appended after the latest session
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    full_tracker = tracker_store.retrieve_full_tracker(DEFAULT_SENDER_ID)
+    assert len(full_tracker.events) == 9
+    assert full_tracker.latest_bot_utterance.text == "hey"
+    assert (
+        len(tracker_store.retrieve(DEFAULT_SENDER_ID).events)
+        == len(tracker.events)
+        == 4
+    )
+
+
+def test_redis_event_log_migrates_serialised_tracker(domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(domain)
+    legacy_key = tracker_store.key_prefix + DEFAULT_SENDER_ID
+
+    events = _session_events("first session") + _session_events("second session")
+    tracker = DialogueStateTracker.from_events(DEFAULT_SENDER_ID, events)
+    tracker_store.red.set(legacy_key, tracker_store.serialise_tracker(tracker))
+
+    assert set(tracker_store.keys()) == {DEFAULT_SENDER_ID}
+
+    retrieved = tracker_store.retrieve(DEFAULT_SENDER_ID)
+    assert len(retrieved.events) == 3
+    assert tracker_store.red.get(legacy_key) is None
+    assert tracker_store.retrieve_full_tracker(DEFAULT_SENDER_ID) == tracker
+
+    retrieved.update(BotUttered("hey"))
+    tracker_store.save(retrieved)
+
+    assert tracker_store.red.llen(tracker_store._events_key(DEFAULT_SENDER_ID)) == 9
+    assert set(tracker_store.keys()) == {DEFAULT_SENDER_ID}
+
+
+def test_redis_event_log_sets_expiration(domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(domain, record_exp=3000)
+
+    tracker = DialogueStateTracker.from_events(
+        DEFAULT_SENDER_ID, _session_events("hi")
+    )
+    tracker_store.save(tracker)
+
+    assert 0 < tracker_store.red.ttl(tracker_store._events_key(DEFAULT_SENDER_ID))
+    assert 0 < tracker_store.red.ttl(
+        tracker_store._session_start_key(DEFAULT_SENDER_ID)
+    )
+
+
 def test_exception_tracker_store_from_endpoint_config(
     domain: Domain, monkeypatch: MonkeyPatch, endpoints_path: Text
 ):
@@ -965,3 +1104,124 @@ def test_tracker_store_connection_error(config: Dict, domain: Domain):
 
     with pytest.raises(ConnectionException):
         TrackerStore.create(store, domain)
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (InMemoryTrackerStore, {}),
+        (MockedRedisEventLogTrackerStore, {}),
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+    ],
+)
+def test_stream_events_uses_persisted_event_count(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    domain: Domain,
+    monkeypatch: MonkeyPatch,
+):
+    event_broker = Mock()
+    tracker_store = tracker_store_type(domain, **tracker_store_kwargs)
+    tracker_store.event_broker = event_broker
+
+    tracker = tracker_store.get_or_create_tracker(DEFAULT_SENDER_ID)
+    assert tracker.persisted_event_count == len(tracker.events)
+
+    tracker = tracker_store.retrieve(DEFAULT_SENDER_ID)
+    assert tracker.persisted_event_count == len(tracker.events)
+
+    # the number of stored events is known without retrieving the tracker again
+    monkeypatch.setattr(tracker_store, "retrieve", Mock())
+    event_broker.publish.reset_mock()
+
+    tracker.update(UserUttered("hi"))
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    tracker_store.retrieve.assert_not_called()
+    published_events = [
+        call.args[0]["event"] for call in event_broker.publish.call_args_list
+    ]
+    assert published_events == [UserUttered.type_name, BotUttered.type_name]
+    assert tracker.persisted_event_count == len(tracker.events)
+
+
+def test_redis_event_log_saves_tracker_with_new_session_twice(domain: Domain):
+    tracker_store = MockedRedisEventLogTrackerStore(domain)
+    tracker = DialogueStateTracker.from_events(
+        DEFAULT_SENDER_ID, _session_events("first session")
+    )
+    tracker_store.save(tracker)
+
+    # the tracker still contains the events of the previous session
+    tracker.update_with_events(_session_events("second session"), domain)
+    tracker_store.save(tracker)
+    tracker.update(BotUttered("hey"))
+    tracker_store.save(tracker)
+
+    assert tracker_store.retrieve_full_tracker(DEFAULT_SENDER_ID) == tracker
+    assert len(tracker_store.retrieve(DEFAULT_SENDER_ID).events) == 4
+
+
+class BlockingTrackerStore(InMemoryTrackerStore):
+    performs_blocking_io = True
+
+    def __init__(self, domain: Domain, barrier: threading.Barrier) -> None:
+        super().__init__(domain)
+        self.barrier = barrier
+
+    def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        # only passes if all retrievals are waiting at the same time
+        self.barrier.wait(timeout=5)
+        return super().retrieve(sender_id)
+
+
+async def test_async_tracker_store_runs_blocking_calls_concurrently(domain: Domain):
+    number_of_conversations = 4
+    tracker_store = BlockingTrackerStore(
+        domain, threading.Barrier(number_of_conversations)
+    )
+    executor = ThreadPoolExecutor(max_workers=number_of_conversations)
+    async_tracker_store = AsyncTrackerStore(
+        FailSafeTrackerStore(tracker_store), executor
+    )
+
+    try:
+        trackers = await asyncio.gather(
+            *[
+                async_tracker_store.retrieve(str(conversation_id))
+                for conversation_id in range(number_of_conversations)
+            ]
+        )
+    finally:
+        executor.shutdown()
+
+    assert trackers == [None] * number_of_conversations
+
+
+def test_only_thread_safe_tracker_stores_perform_blocking_io(domain: Domain):
+    class CustomTrackerStore(TrackerStore):
+        pass
+
+    # tracker stores have to opt in to being used by several threads
+    assert not CustomTrackerStore(domain).performs_blocking_io
+    assert not DynamoTrackerStore.performs_blocking_io
+    assert RedisTrackerStore.performs_blocking_io
+    assert SQLTrackerStore.performs_blocking_io
+
+
+async def test_async_tracker_store(domain: Domain):
+    tracker_store = InMemoryTrackerStore(domain)
+    async_tracker_store = AsyncTrackerStore(tracker_store)
+
+    assert not await async_tracker_store.exists(DEFAULT_SENDER_ID)
+
+    tracker = await async_tracker_store.get_or_create_tracker(DEFAULT_SENDER_ID)
+    tracker.update(UserUttered("hi"))
+    await async_tracker_store.save(tracker)
+
+    assert await async_tracker_store.exists(DEFAULT_SENDER_ID)
+    assert await async_tracker_store.keys() == [DEFAULT_SENDER_ID]
+    assert await async_tracker_store.retrieve(DEFAULT_SENDER_ID) == tracker
+    assert await async_tracker_store.retrieve_full_tracker(DEFAULT_SENDER_ID) == tracker
@@ -1,3 +1,5 @@
+import gc
+import weakref
 from pathlib import Path
 
 import numpy as np
@@ -36,6 +38,7 @@ from rasa.utils.tensorflow.constants import (
     INTENT_CLASSIFICATION,
     MODEL_CONFIDENCE,
     LINEAR_NORM,
+    PACKED_DATA_DIRECTORY,
 )
 from rasa.nlu.components import ComponentBuilder
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
@@ -46,6 +49,7 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.utils import train_utils
 from rasa.shared.constants import DIAGNOSTIC_DATA
 from rasa.shared.nlu.training_data.loading import load_data
+from rasa.utils.tensorflow.model_data import PackedFeatureArray, RasaModelData
 from rasa.utils.tensorflow.model_data_utils import FeatureArray
 
 
@@ -526,6 +530,70 @@ async def test_set_random_seed(component_builder, tmpdir, nlu_as_json_path: Text
     assert result_a == result_b
 
 
+async def test_train_frees_unpacked_training_data(
+    component_builder: ComponentBuilder,
+    tmp_path: Path,
+    nlu_as_json_path: Text,
+    monkeypatch: MonkeyPatch,
+):
+    unpacked_features = []
+    packed = RasaModelData.packed
+
+    def record_unpacked_features(
+        model_data: RasaModelData, *args: Any, **kwargs: Any
+    ) -> RasaModelData:
+        unpacked_features.extend(
+            weakref.ref(features)
+            for attribute_data in model_data.data.values()
+            for sub_key_features in attribute_data.values()
+            for features in sub_key_features
+            if PackedFeatureArray.can_pack(features)
+        )
+        return packed(model_data, *args, **kwargs)
+
+    freed_during_training = []
+    packed_data_files = []
+    create_data_generators = train_utils.create_data_generators
+
+    def check_unpacked_features(model_data: RasaModelData, *args: Any) -> Any:
+        gc.collect()
+        freed_during_training.extend(
+            features() is None for features in unpacked_features
+        )
+        packed_data_files.extend((tmp_path / "packed").glob("*/*/*.npy"))
+        return create_data_generators(model_data, *args)
+
+    monkeypatch.setattr(RasaModelData, "packed", record_unpacked_features)
+    monkeypatch.setattr(
+        train_utils, "create_data_generators", check_unpacked_features
+    )
+
+    _config = RasaNLUModelConfig(
+        {
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "CountVectorsFeaturizer"},
+                {
+                    "name": "DIETClassifier",
+                    EPOCHS: 1,
+                    PACKED_DATA_DIRECTORY: str(tmp_path / "packed"),
+                },
+            ],
+            "language": "en",
+        }
+    )
+    await rasa.nlu.train.train(
+        _config,
+        data=nlu_as_json_path,
+        component_builder=component_builder,
+    )
+
+    assert freed_during_training and all(freed_during_training)
+    # the packed features were memory mapped from the configured directory
+    assert packed_data_files
+    assert not list((tmp_path / "packed").iterdir())
+
+
 @pytest.mark.parametrize("log_level", ["epoch", "batch"])
 async def test_train_tensorboard_logging(
     log_level: Text,
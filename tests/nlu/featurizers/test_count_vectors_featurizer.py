@@ -733,3 +733,31 @@ def test_use_shared_vocab_exception(
         )
     else:
         new_cvf.train(data)
+
+
+def test_count_vector_featurizer_process_batch():
+    ftr = CountVectorsFeaturizer()
+    tokenizer = WhitespaceTokenizer()
+
+    train_message = Message(data={TEXT: "hello goodbye how are you"})
+    tokenizer.process(train_message)
+    ftr.train(TrainingData([train_message]))
+
+    sentences = ["hello you", "goodbye how are you hello", "unknown"]
+    messages = [Message(data={TEXT: sentence}) for sentence in sentences]
+    expected_messages = [Message(data={TEXT: sentence}) for sentence in sentences]
+    for message, expected_message in zip(messages, expected_messages):
+        tokenizer.process(message)
+        tokenizer.process(expected_message)
+        ftr.process(expected_message)
+
+    ftr.process_batch(messages)
+
+    for message, expected_message in zip(messages, expected_messages):
+        seq_vecs, sen_vecs = message.get_sparse_features(TEXT, [])
+        expected_seq_vecs, expected_sen_vecs = expected_message.get_sparse_features(
+            TEXT, []
+        )
+        assert seq_vecs.features.shape == expected_seq_vecs.features.shape
+        assert (seq_vecs.features != expected_seq_vecs.features).nnz == 0
+        assert (sen_vecs.features != expected_sen_vecs.features).nnz == 0
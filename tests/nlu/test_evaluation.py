@@ -1176,6 +1176,14 @@ class ConstantInterpreter(Interpreter):
     ) -> Dict[Text, Any]:
         return self.prediction
 
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        return [self.prediction for _ in texts]
+
 
 def test_replacing_fallback_intent():
     expected_intent = "greet"
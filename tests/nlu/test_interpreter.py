@@ -70,3 +70,23 @@ def test_create_interpreter(parameters, trained_nlu_model):
     )
 
     assert isinstance(interpreter, parameters["type"])
+
+
+def test_parse_batch_returns_same_results_as_parse(trained_nlu_model):
+    _, nlu_model_directory = get_model_subdirectories(get_model(trained_nlu_model))
+    interpreter = Interpreter.load(nlu_model_directory)
+    texts = ["hello", "", "I am looking for a mexican restaurant in the north"]
+
+    results = interpreter.parse_batch(texts)
+
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        expected = interpreter.parse(text)
+        assert result["text"] == expected["text"]
+        assert result["intent"]["name"] == expected["intent"]["name"]
+        assert result["intent"]["confidence"] == pytest.approx(
+            expected["intent"]["confidence"], abs=1e-5
+        )
+        assert [entity["value"] for entity in result["entities"]] == [
+            entity["value"] for entity in expected["entities"]
+        ]
@@ -1,10 +1,20 @@
 import os
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.nlu import registry
 import rasa.nlu.train
+from rasa.nlu.components import ComponentBuilder
 from rasa.nlu.config import RasaNLUModelConfig
+from rasa.nlu.extractors.crf_entity_extractor import CRFEntityExtractor
+from rasa.nlu.featurizers.sparse_featurizer.count_vectors_featurizer import (
+    CountVectorsFeaturizer,
+)
 from rasa.nlu.model import Interpreter, Trainer
+from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
+from rasa.nlu.tokenizers.spacy_tokenizer import SpacyTokenizer
+from rasa.nlu.training_cache import TrainingCache, is_cacheable
+from rasa.nlu.utils.spacy_utils import SpacyNLP
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.utils.tensorflow.constants import EPOCHS
 from typing import Any, Dict, List, Tuple, Text, Union
@@ -304,3 +314,134 @@ async def test_train_model_no_training_data_persisted(
 
     assert loaded.pipeline
     assert loaded.model_metadata.get("training_data") is None
+
+
+async def test_train_restores_unchanged_components_from_cache(
+    component_builder, tmpdir, nlu_as_json_path: Text, monkeypatch: MonkeyPatch
+):
+    _config = RasaNLUModelConfig(
+        {
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "CountVectorsFeaturizer"},
+                {"name": "KeywordIntentClassifier"},
+            ],
+            "language": "en",
+        }
+    )
+    cache_dir = tmpdir.mkdir("cache").strpath
+
+    trainer, interpreter, _ = await rasa.nlu.train.train(
+        _config,
+        data=nlu_as_json_path,
+        component_builder=component_builder,
+        cache_dir=cache_dir,
+    )
+    # the tokenizer and the featurizer are cached, the classifier is not
+    assert len(os.listdir(cache_dir)) == 2
+
+    def train_from_scratch(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Component should have been restored from cache.")
+
+    monkeypatch.setattr(WhitespaceTokenizer, "train", train_from_scratch)
+    monkeypatch.setattr(CountVectorsFeaturizer, "train", train_from_scratch)
+
+    cached_trainer, cached_interpreter, persisted_path = await rasa.nlu.train.train(
+        _config,
+        path=tmpdir.strpath,
+        data=nlu_as_json_path,
+        component_builder=component_builder,
+        cache_dir=cache_dir,
+    )
+
+    assert [component.name for component in cached_trainer.pipeline] == [
+        component.name for component in trainer.pipeline
+    ]
+    message = "hello, can you help me find a restaurant?"
+    assert cached_interpreter.parse(message) == interpreter.parse(message)
+    loaded = Interpreter.load(persisted_path, component_builder)
+    assert loaded.parse(message) == interpreter.parse(message)
+
+    # a changed configuration of the featurizer invalidates its cache entry
+    _config.pipeline[1]["analyzer"] = "char"
+    with pytest.raises(AssertionError):
+        await rasa.nlu.train.train(
+            _config,
+            data=nlu_as_json_path,
+            component_builder=component_builder,
+            cache_dir=cache_dir,
+        )
+
+
+async def test_train_restores_token_annotations_from_cache(
+    component_builder, tmpdir, nlu_as_json_path: Text, monkeypatch: MonkeyPatch
+):
+    _config = RasaNLUModelConfig(
+        {
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "RegexFeaturizer"},
+                {"name": "CRFEntityExtractor"},
+            ],
+            "language": "en",
+        }
+    )
+    cache_dir = tmpdir.mkdir("cache").strpath
+
+    crf_features = []
+    train_model = CRFEntityExtractor._train_model
+
+    def record_features(extractor: CRFEntityExtractor, dataset: List) -> None:
+        crf_features.append(
+            [extractor._crf_tokens_to_features(sentence) for sentence in dataset]
+        )
+        train_model(extractor, dataset)
+
+    monkeypatch.setattr(CRFEntityExtractor, "_train_model", record_features)
+
+    for _ in range(2):
+        await rasa.nlu.train.train(
+            _config,
+            data=nlu_as_json_path,
+            component_builder=component_builder,
+            cache_dir=cache_dir,
+        )
+    # the tokenizer and the `RegexFeaturizer` were restored from the cache
+    assert len(os.listdir(cache_dir)) == 2
+
+    uncached_features, cached_features = crf_features
+    assert any(
+        "0:pattern:zipcode" in token_features
+        for sentence in uncached_features
+        for token_features in sentence
+    )
+    assert cached_features == uncached_features
+
+
+def test_training_cache_includes_components_which_load_language_models():
+    pipeline = [SpacyNLP(), SpacyTokenizer(), CRFEntityExtractor()]
+
+    assert [is_cacheable(component) for component in pipeline] == [
+        True,
+        True,
+        False,
+    ]
+
+
+def test_training_cache_evicts_least_recently_used_entries(
+    tmpdir, monkeypatch: MonkeyPatch
+):
+    cache = TrainingCache(tmpdir.strpath)
+    tokenizer = WhitespaceTokenizer()
+    for fingerprint in ["first", "second", "third"]:
+        cache.store(fingerprint, tokenizer, "tokenizer", "en", [])
+    # mark "first" as recently used
+    cache.load("first", ComponentBuilder())
+
+    entry_size = sum(
+        path.size() for path in tmpdir.join("first").visit() if path.isfile()
+    )
+    monkeypatch.setattr(cache, "max_size_in_bytes", int(entry_size * 2.5))
+    cache.store("fourth", tokenizer, "tokenizer", "en", [])
+
+    assert sorted(os.listdir(tmpdir.strpath)) == ["first", "fourth"]
@@ -1,4 +1,5 @@
-from typing import Dict, List, Text
+import re
+from typing import Any, Dict, List, Text
 
 import pytest
 
@@ -181,3 +182,59 @@ def test_extract_patterns_use_only_lookup_tables_or_regex_features(
     )
 
     assert actual_patterns == expected_patterns
+
+
+@pytest.mark.parametrize("use_word_boundaries", [True, False])
+@pytest.mark.parametrize("case_sensitive", [True, False])
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I want a mapo tofu and a mapo tofu burrito",
+        "BEEF tacos, beefy tacos and taco's",
+        "lettuce_wrap lettuce wrap-wrap",
+        "Tacosıs ſtacos İtacos",
+        "",
+    ],
+)
+def test_pattern_matcher_matches_like_re(
+    text: Text, case_sensitive: bool, use_word_boundaries: bool
+):
+    elements = ["taco", "tacos", "beef", "mapo tofu", "mapo", "wrap", "lettuce wrap"]
+    elements += [
+        f"dish {index}" for index in range(pattern_utils.MIN_AUTOMATON_ELEMENTS)
+    ]
+    patterns = [
+        {"name": "zipcode", "pattern": "[0-9]{5}"},
+        {
+            "name": "plates",
+            "pattern": pattern_utils._generate_lookup_regex(
+                {"elements": elements}, use_word_boundaries
+            ),
+        },
+    ]
+
+    matcher = pattern_utils.PatternMatcher(patterns, case_sensitive)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    assert matcher.match_spans(text) == [
+        [match.span() for match in re.finditer(pattern["pattern"], text, flags=flags)]
+        for pattern in patterns
+    ]
+    # the lookup table is matched by the automaton
+    assert matcher._automata[0] is None
+    assert matcher._automata[1] is not None
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("(\\bMax\\b|\\bJohn\\b)", (["Max", "John"], True)),
+        ("(mapo\\ tofu|\\(beef\\))", (["mapo tofu", "(beef)"], False)),
+        ("[0-9]{5}", None),
+        ("(\\d|a)", None),
+        ("(\\bMax|John\\b)", None),
+        ("(a)(b)", None),
+    ],
+)
+def test_parse_literal_alternation(pattern: Text, expected: Any):
+    assert pattern_utils._parse_literal_alternation(pattern) == expected
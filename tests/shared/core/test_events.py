@@ -1,11 +1,15 @@
 import copy
 
+import jsonpickle
 import pytest
 import pytz
 import time
 from datetime import datetime
 from dateutil import parser
 from typing import Type, Optional, Text, List, Any, Dict
+from unittest.mock import Mock
+
+from _pytest.monkeypatch import MonkeyPatch
 
 import rasa.shared.utils.common
 import rasa.shared.core.events
@@ -33,8 +37,10 @@ from rasa.shared.core.events import (
     UserUtteranceReverted,
     AgentUttered,
     SessionStarted,
+    EntitiesAdded,
     format_message,
 )
+from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.constants import INTENT_NAME_KEY
 from tests.core.policies.test_rule_policy import GREET_INTENT_NAME, UTTER_GREET_ACTION
 
@@ -628,3 +634,98 @@ def test_event_executed_comparison(
 ):
     result = all(event == events[0] for event in events)
     assert result == comparison_result
+
+
+@pytest.mark.parametrize(
+    "value,other",
+    [
+        (1, 1.0),
+        (1, True),
+        (0.0, -0.0),
+        ([1, 2], (1, 2)),
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ({1: "a"}, {"1": "a"}),
+        ({None: "a"}, {"null": "a"}),
+        ({"a": [1, {"b": None}]}, {"a": [1, {"b": None}]}),
+        ({"a": [1, {"b": None}]}, {"a": [1, {"b": False}]}),
+        ({"a": {1, 2}}, {"a": {1, 2}}),
+        (float("nan"), float("nan")),
+    ],
+)
+def test_freeze_compares_like_jsonpickle(value: Any, other: Any):
+    frozen = rasa.shared.core.events._freeze(value)
+    other_frozen = rasa.shared.core.events._freeze(other)
+
+    assert (frozen == other_frozen) == (
+        jsonpickle.encode(value) == jsonpickle.encode(other)
+    )
+    if frozen == other_frozen:
+        assert hash(frozen) == hash(other_frozen)
+
+
+@pytest.mark.parametrize(
+    "event,mutate",
+    [
+        (UserUttered("hi", {"name": "greet"}), lambda e: setattr(e, "text", "hey")),
+        (BotUttered("hi", {"buttons": []}), lambda e: setattr(e, "data", {})),
+        (SlotSet("slot", [1]), lambda e: setattr(e, "value", [2])),
+        (ActionExecuted("action"), lambda e: setattr(e, "action_name", "other")),
+        (AgentUttered("hi", {"a": 1}), lambda e: setattr(e, "data", None)),
+    ],
+)
+def test_event_equality_is_updated_after_mutation(event: Event, mutate: Any):
+    original = copy.deepcopy(event)
+    assert event == original
+    assert hash(event) == hash(original)
+
+    mutate(event)
+
+    assert event != original
+
+
+def test_entities_added_updates_equality_of_user_message():
+    entity = {"entity": "name", "value": "Peter", "start": 0, "end": 5}
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("Peter")]
+    )
+    message = tracker.latest_message
+    assert message == UserUttered("Peter")
+
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(EntitiesAdded([entity]))
+
+    assert message != UserUttered("Peter")
+    assert message == UserUttered("Peter", entities=[entity])
+
+
+def test_deduplicating_events_does_not_encode_them_repeatedly(
+    monkeypatch: MonkeyPatch,
+):
+    def story(index: int) -> List[Event]:
+        return [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered(
+                "hi",
+                {"name": "greet"},
+                [{"entity": "name", "value": f"user {index % 50}", "start": 0}],
+            ),
+            SlotSet("counter", {"value": index % 20, "history": [1.0, None]}),
+            BotUttered("hello", {"buttons": [{"title": "yes"}]}, {"rank": 1}),
+            ActionExecuted("utter_greet", metadata={"model": "TED"}),
+        ]
+
+    stories = [story(index) for index in range(2000)]
+    encode = Mock(side_effect=rasa.shared.core.events.jsonpickle.encode)
+    monkeypatch.setattr(rasa.shared.core.events.jsonpickle, "encode", encode)
+
+    start = time.perf_counter()
+    unique_events = set()
+    for _ in range(3):
+        for events in stories:
+            unique_events.update(events)
+    duration = time.perf_counter() - start
+
+    assert len(unique_events) == 1 + 50 + 20 + 1 + 1
+    encode.assert_not_called()
+    # hashing 30000 events takes a few milliseconds without `jsonpickle`
+    assert duration < 10
@@ -1,4 +1,15 @@
+from typing import List, Text
+from unittest.mock import Mock
+
+from _pytest.monkeypatch import MonkeyPatch
+
 import rasa.shared.core.generator
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, ActiveLoop, SlotSet, UserUttered
+from rasa.shared.core.generator import TrackerWithCachedStates, TrainingDataGenerator
+from rasa.shared.core.training_data import loading
+from rasa.shared.core.training_data.structures import StoryGraph
 
 
 def test_subsample_array_read_only():
@@ -18,3 +29,98 @@ def test_subsample_array():
 
     assert len(r) == 5
     assert set(r).issubset(t)
+
+
+def test_shared_history_branches_do_not_affect_each_other():
+    history = rasa.shared.core.generator._SharedHistory([1, 2])
+    first = history.copy()
+    second = history.copy()
+
+    first.append(3)
+    second.append(4)
+    second.pop()
+    second.pop()
+    second.append(5)
+
+    assert list(history) == [1, 2]
+    assert list(first) == [1, 2, 3]
+    assert list(second) == [1, 5]
+    assert first[-1] == 3 and second[0:2] == [1, 5]
+    assert list(reversed(first)) == [3, 2, 1]
+    assert first == [1, 2, 3]
+
+
+def test_tracker_copy_does_not_replay_events(monkeypatch: MonkeyPatch):
+    domain = Domain.from_yaml(
+        """
+        intents:
+        - greet
+        slots:
+          name:
+            type: text
+        forms:
+          some_form: {}
+        """
+    )
+    tracker = TrackerWithCachedStates.from_events(
+        "sender",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "greet"}),
+            SlotSet("name", "Peter"),
+            ActiveLoop("some_form"),
+        ],
+        domain=domain,
+        slots=domain.slots,
+    )
+    states = tracker.past_states(domain)
+    update = Mock()
+    monkeypatch.setattr(TrackerWithCachedStates, "update", update)
+
+    tracker_copy = tracker.copy("copy")
+
+    update.assert_not_called()
+    assert list(tracker_copy.events) == list(tracker.events)
+    assert tracker_copy.current_slot_values() == tracker.current_slot_values()
+    assert tracker_copy.active_loop == tracker.active_loop
+    assert tracker_copy.latest_message == tracker.latest_message
+    assert tracker_copy.past_states(domain) == states
+
+    monkeypatch.undo()
+    tracker_copy.update(SlotSet("name", "Paul"))
+    tracker_copy.update(ActiveLoop(None))
+
+    assert tracker.get_slot("name") == "Peter"
+    assert tracker.active_loop_name == "some_form"
+    assert len(tracker.events) == 4
+    assert tracker.past_states(domain) == states
+
+
+async def test_generate_trackers_in_worker_processes(
+    domain_path: Text, monkeypatch: MonkeyPatch
+):
+    domain = Domain.load(domain_path)
+    story_steps = await loading.load_data_from_files(
+        ["data/test_yaml_stories/stories_defaultdomain.yml"], domain
+    )
+
+    def generate(story_generation_workers: int) -> List[TrackerWithCachedStates]:
+        return TrainingDataGenerator(
+            StoryGraph(story_steps),
+            domain,
+            augmentation_factor=20,
+            story_generation_workers=story_generation_workers,
+        ).generate()
+
+    trackers = generate(story_generation_workers=1)
+    # split even the few trackers of the test stories between the workers
+    monkeypatch.setattr(rasa.shared.core.generator, "MIN_TRACKERS_PER_WORKER", 2)
+    trackers_from_workers = generate(story_generation_workers=2)
+
+    assert len(trackers_from_workers) == len(trackers)
+    for tracker, tracker_from_workers in zip(trackers, trackers_from_workers):
+        assert tracker_from_workers.sender_id == tracker.sender_id
+        assert tracker_from_workers.is_augmented == tracker.is_augmented
+        assert list(tracker_from_workers.events) == list(tracker.events)
+        assert tracker_from_workers.domain is domain
+        assert tracker_from_workers.past_states(domain) == tracker.past_states(domain)
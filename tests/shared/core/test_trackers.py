@@ -422,6 +422,57 @@ def test_revert_action_event(domain: Domain):
     assert len(list(tracker.generate_all_prior_trackers())) == 3
 
 
+def test_past_states_are_extended_with_new_events(domain: Domain):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet"}, []))
+
+    states = tracker.past_states(domain)
+    assert states == domain.states_for_tracker_history(tracker)
+
+    # changing the returned states must not change the cached ones
+    states[-1].clear()
+
+    cache = tracker._past_states_caches[(False, False, None)]
+    tracker.update(DefinePrevUserUtteredFeaturization(False))
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.update(SlotSet("name", "Peter"))
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+
+    assert tracker.past_states(domain) == domain.states_for_tracker_history(tracker)
+    # the existing cache was extended instead of creating the states from scratch
+    assert tracker._past_states_caches[(False, False, None)] is cache
+
+
+@pytest.mark.parametrize(
+    "reverting_event", [ActionReverted(), UserUtteranceReverted(), Restarted()]
+)
+def test_past_states_after_reverting_events(domain: Domain, reverting_event: Event):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet"}, []))
+    tracker.update(ActionExecuted("utter_greet"))
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/goodbye", {"name": "goodbye"}, []))
+    tracker.update(ActionExecuted("utter_goodbye"))
+    tracker.past_states(domain)
+
+    tracker.update(reverting_event)
+
+    assert tracker.past_states(domain) == domain.states_for_tracker_history(tracker)
+
+
+def test_past_states_with_different_domain(domain: Domain, moodbot_domain: Domain):
+    tracker = DialogueStateTracker("default", domain.slots)
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker.update(UserUttered("/greet", {"name": "greet"}, []))
+    tracker.past_states(domain)
+
+    assert tracker.past_states(
+        moodbot_domain
+    ) == moodbot_domain.states_for_tracker_history(tracker)
+
+
 def test_revert_user_utterance_event(domain: Domain):
     tracker = DialogueStateTracker("default", domain.slots)
     # the retrieved tracker should be empty
@@ -639,6 +690,27 @@ def test_session_started_not_part_of_applied_events(empty_agent: Agent):
     assert tracker.applied_events() == list(tracker.events)[6:]
 
 
+def test_unpersisted_events_with_max_event_history():
+    tracker = DialogueStateTracker(DEFAULT_SENDER_ID, [], max_event_history=2)
+    tracker.update(UserUttered("hi"))
+    tracker.update(BotUttered("hey"))
+    tracker.mark_events_as_persisted()
+
+    tracker.update(UserUttered("bye"))
+    assert [event.text for event in tracker.unpersisted_events()] == ["bye"]
+
+    tracker.update(BotUttered("bye"))
+    tracker.update(UserUttered("hi again"))
+    # the event which was dropped from the tracker can't be returned anymore
+    assert [event.text for event in tracker.unpersisted_events()] == [
+        "bye",
+        "hi again",
+    ]
+
+    tracker.mark_events_as_persisted()
+    assert tracker.unpersisted_events() == []
+
+
 def test_get_last_event_for():
     events = [ActionExecuted("one"), user_uttered("two", 1)]
 
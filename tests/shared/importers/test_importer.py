@@ -1,4 +1,5 @@
 import os
+import pickle
 from pathlib import Path
 from typing import Text, Dict, Type, List, Any
 
@@ -391,3 +392,17 @@ async def test_read_conversation_tests(project: Text):
 
     test_stories = await importer.get_conversation_tests()
     assert len(test_stories.story_steps) == 7
+
+
+async def test_importer_can_be_pickled_after_loading_data(
+    default_importer: TrainingDataImporter,
+):
+    stories = await default_importer.get_stories()
+    nlu_data = await default_importer.get_nlu_data()
+
+    unpickled = pickle.loads(pickle.dumps(default_importer))
+
+    assert len((await unpickled.get_stories()).story_steps) == len(
+        stories.story_steps
+    )
+    assert (await unpickled.get_nlu_data()).fingerprint() == nlu_data.fingerprint()
@@ -0,0 +1,160 @@
+import logging
+import time
+from typing import Any, Callable, Iterable, List, Tuple
+
+import numpy as np
+import pytest
+import scipy.sparse
+import tensorflow as tf
+
+from rasa.utils.tensorflow.data_generator import RasaBatchDataGenerator
+from rasa.utils.tensorflow.model_data import FeatureArray, RasaModelData
+
+NUMBER_OF_EXAMPLES = 2000
+NUMBER_OF_SPARSE_FEATURES = 2000
+NUMBER_OF_DENSE_FEATURES = 300
+MAX_SEQUENCE_LENGTH = 25
+EPOCHS = 3
+
+logger = logging.getLogger(__name__)
+
+
+def _object_array(items: List[Any]) -> np.ndarray:
+    # the items have different shapes, so numpy can't stack them
+    array = np.empty(len(items), dtype=object)
+    for index, item in enumerate(items):
+        array[index] = item
+    return array
+
+
+def _model_data() -> RasaModelData:
+    sequence_lengths = np.random.randint(1, MAX_SEQUENCE_LENGTH, NUMBER_OF_EXAMPLES)
+    return RasaModelData(
+        label_key="label",
+        label_sub_key="ids",
+        data={
+            "text": {
+                "sequence": [
+                    FeatureArray(
+                        _object_array(
+                            [
+                                scipy.sparse.random(
+                                    length, NUMBER_OF_SPARSE_FEATURES, density=0.005
+                                ).tocsr()
+                                for length in sequence_lengths
+                            ]
+                        ),
+                        number_of_dimensions=3,
+                    ),
+                    FeatureArray(
+                        _object_array(
+                            [
+                                np.random.rand(length, NUMBER_OF_DENSE_FEATURES)
+                                for length in sequence_lengths
+                            ]
+                        ),
+                        number_of_dimensions=3,
+                    ),
+                ]
+            },
+            "label": {
+                "ids": [
+                    FeatureArray(
+                        np.random.randint(10, size=(NUMBER_OF_EXAMPLES, 1)),
+                        number_of_dimensions=2,
+                    )
+                ]
+            },
+        },
+    )
+
+
+@tf.function
+def _train_step(batch: Tuple[tf.Tensor, ...]) -> tf.Tensor:
+    # stands in for the forward and backward pass of a model
+    indices, values, shape, dense, _ = batch
+    sparse = tf.sparse.reshape(
+        tf.SparseTensor(indices, values, shape), (-1, NUMBER_OF_SPARSE_FEATURES)
+    )
+    hidden = tf.sparse.sparse_dense_matmul(
+        sparse, tf.ones((NUMBER_OF_SPARSE_FEATURES, NUMBER_OF_DENSE_FEATURES))
+    )
+    hidden += tf.reshape(dense, (-1, NUMBER_OF_DENSE_FEATURES))
+    for _ in range(5):
+        hidden = tf.tanh(tf.matmul(hidden, tf.ones((NUMBER_OF_DENSE_FEATURES,) * 2)))
+    return tf.reduce_sum(hidden)
+
+
+def _steps_per_second(
+    data_generator: RasaBatchDataGenerator,
+    batches_of_epoch: Callable[[], Iterable[Tuple[tf.Tensor, ...]]],
+    train_step: Callable[[Tuple[tf.Tensor, ...]], tf.Tensor],
+) -> Tuple[int, float]:
+    steps = 0
+    start = time.perf_counter()
+    for _ in range(EPOCHS):
+        for batch in batches_of_epoch():
+            train_step(tuple(tf.convert_to_tensor(tensor) for tensor in batch))
+            steps += 1
+        data_generator.on_epoch_end()
+
+    return steps, steps / (time.perf_counter() - start)
+
+
+def _assert_equal_batches(
+    sequence: RasaBatchDataGenerator,
+    pipeline: RasaBatchDataGenerator,
+    dataset: tf.data.Dataset,
+) -> None:
+    for epoch in range(EPOCHS):
+        batches = 0
+        for (sequence_batch, _), (pipeline_batch,) in zip(
+            (sequence[index] for index in range(len(sequence))), dataset
+        ):
+            assert len(pipeline_batch) == len(sequence_batch)
+            for pipeline_array, sequence_array in zip(pipeline_batch, sequence_batch):
+                np.testing.assert_array_equal(pipeline_array.numpy(), sequence_array)
+            batches += 1
+        assert batches == len(sequence) == len(pipeline)
+
+        # shuffle both generators the same way for the next epoch
+        for data_generator in [sequence, pipeline]:
+            np.random.seed(epoch)
+            data_generator.on_epoch_end()
+
+
+@pytest.mark.timeout(600, func_only=True)
+def test_data_pipeline_throughput():
+    model_data = _model_data()
+
+    def data_generator() -> RasaBatchDataGenerator:
+        np.random.seed(42)
+        return RasaBatchDataGenerator(
+            model_data, batch_size=[64, 256], epochs=EPOCHS, batch_strategy="balanced"
+        )
+
+    pipeline = data_generator()
+    dataset = pipeline.as_dataset()
+    # trace the training step only once for both runs
+    (element_spec,) = dataset.element_spec
+    train_step = _train_step.get_concrete_function(element_spec)
+
+    sequence = data_generator()
+    sequence_steps, sequence_steps_per_second = _steps_per_second(
+        sequence,
+        lambda: (sequence[index][0] for index in range(len(sequence))),
+        train_step,
+    )
+
+    pipeline_steps, pipeline_steps_per_second = _steps_per_second(
+        pipeline, lambda: (batch for (batch,) in dataset), train_step
+    )
+
+    logger.info(
+        f"Keras sequence: {sequence_steps_per_second:.2f} steps/s, "
+        f"tf.data pipeline: {pipeline_steps_per_second:.2f} steps/s"
+    )
+    assert pipeline_steps == sequence_steps
+
+    pipeline = data_generator()
+    _assert_equal_batches(data_generator(), pipeline, pipeline.as_dataset())
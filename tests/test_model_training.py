@@ -3,7 +3,7 @@ import secrets
 import tempfile
 import os
 from pathlib import Path
-from typing import Text, Dict, Any
+from typing import Text, Dict, Any, List
 from unittest.mock import Mock
 
 import pytest
@@ -284,6 +284,74 @@ def test_interpreter_of_old_model_passed_to_core_training(
     assert isinstance(kwargs["interpreter"], RasaNLUInterpreter)
 
 
+def test_nlu_and_core_are_trained_concurrently(
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+    domain_path: Text,
+    stories_path: Text,
+    nlu_data_path: Text,
+):
+    config_path = tmp_path / "config.yml"
+    rasa.shared.utils.io.write_yaml(
+        {
+            "language": "en",
+            "pipeline": [{"name": "KeywordIntentClassifier"}],
+            "policies": [{"name": "RulePolicy"}, {"name": "MemoizationPolicy"}],
+        },
+        config_path,
+    )
+    train_concurrently = AsyncMock()
+    monkeypatch.setattr(
+        rasa.model_training,
+        "_train_nlu_and_core_concurrently",
+        train_concurrently,
+    )
+    _train_nlu = mock_nlu_training(monkeypatch)
+    _train_core = mock_core_training(monkeypatch)
+
+    train(
+        domain_path,
+        str(config_path),
+        [stories_path, nlu_data_path],
+        str(tmp_path),
+        concurrent_training=True,
+    )
+
+    train_concurrently.assert_called_once()
+    _train_nlu.assert_not_called()
+    _train_core.assert_not_called()
+    _, _, kwargs = train_concurrently.mock_calls[0]
+    assert "interpreter" not in kwargs["core_arguments"]
+
+
+@pytest.mark.parametrize(
+    "policies, has_e2e_examples, expected",
+    [
+        ([{"name": "RulePolicy"}, {"name": "MemoizationPolicy"}], False, False),
+        ([{"name": "RulePolicy"}], True, True),
+        ([{"name": "RulePolicy"}, {"name": "TEDPolicy"}], False, True),
+    ],
+)
+async def test_core_requires_nlu_model(
+    policies: List[Dict[Text, Any]], has_e2e_examples: bool, expected: bool
+):
+    from rasa.model_training import _core_requires_nlu_model
+
+    importer = Mock()
+    importer.get_nlu_data = AsyncMock(
+        return_value=Mock(has_e2e_examples=lambda: has_e2e_examples)
+    )
+    importer.get_config = AsyncMock(return_value={"policies": policies})
+
+    assert await _core_requires_nlu_model(importer) == expected
+
+
+async def test_no_concurrent_training_when_finetuning():
+    from rasa.model_training import _can_train_concurrently
+
+    assert not await _can_train_concurrently(Mock(), "models/")
+
+
 def test_load_interpreter_returns_none_for_none():
     from rasa.model_training import _load_interpreter
 
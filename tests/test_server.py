@@ -10,7 +10,7 @@ from http import HTTPStatus
 from multiprocessing import Process, Manager
 from multiprocessing.managers import DictProxy
 from pathlib import Path
-from typing import List, Text, Type, Generator, NoReturn, Dict, Optional
+from typing import Any, List, Text, Type, Generator, NoReturn, Dict, Optional
 from unittest.mock import Mock, ANY
 
 import pytest
@@ -443,6 +443,55 @@ async def test_parse_on_invalid_emulation_mode(
     assert response.status == HTTPStatus.BAD_REQUEST
 
 
+async def test_parse_batch(rasa_app: SanicASGITestClient):
+    texts = ["hello", "hello ńöñàśçií", "/greet"]
+
+    _, response = await rasa_app.post("/model/parse/batch", json={"texts": texts})
+
+    assert response.status == HTTPStatus.OK
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["text"] for result in results] == texts
+    assert all(result["intent"][INTENT_NAME_KEY] == "greet" for result in results)
+
+
+async def test_parse_batch_with_ndjson(rasa_app: SanicASGITestClient):
+    texts = ["hello", "hello"]
+
+    _, response = await rasa_app.post(
+        "/model/parse/batch?chunk_size=1",
+        data="\n".join(json.dumps({"text": text}) for text in texts),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status == HTTPStatus.OK
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [result["text"] for result in results] == texts
+
+
+@pytest.mark.parametrize(
+    "endpoint, payload, expected_status",
+    [
+        ("/model/parse/batch", {"text": "hello"}, HTTPStatus.BAD_REQUEST),
+        ("/model/parse/batch", [{"no_text": "hello"}], HTTPStatus.BAD_REQUEST),
+        ("/model/parse/batch?chunk_size=0", ["hello"], HTTPStatus.BAD_REQUEST),
+        (
+            "/model/parse/batch",
+            ["hello"] * (rasa.server.PARSE_BATCH_MAX_TEXTS + 1),
+            HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+        ),
+    ],
+)
+async def test_parse_batch_with_invalid_request(
+    rasa_app: SanicASGITestClient,
+    endpoint: Text,
+    payload: Any,
+    expected_status: HTTPStatus,
+):
+    _, response = await rasa_app.post(endpoint, json=payload)
+
+    assert response.status == expected_status
+
+
 async def test_train_stack_success_with_md(
     rasa_app: SanicASGITestClient,
     domain_path: Text,
@@ -60,6 +60,52 @@ def test_data_generator_with_fixed_batch_size(model_data: RasaModelData):
         next(iterator)
 
 
+def test_data_generator_as_dataset_with_increasing_batch_size(
+    model_data: RasaModelData,
+):
+    epochs = 2
+
+    data_generator = RasaBatchDataGenerator(
+        model_data,
+        batch_size=[1, 2],
+        epochs=epochs,
+        batch_strategy="balanced",
+        shuffle=True,
+    )
+    dataset = data_generator.as_dataset()
+
+    expected_batch_sizes = [[1, 1, 1, 1, 1], [2, 2, 1]]
+
+    for _epoch in range(epochs):
+        batches = [batch for (batch,) in dataset]
+
+        assert len(batches) == len(expected_batch_sizes[_epoch])
+        for batch, expected_batch_size in zip(batches, expected_batch_sizes[_epoch]):
+            assert len(batch) == 11
+            assert len(batch[0]) == expected_batch_size
+
+        data_generator.on_epoch_end()
+
+
+def test_data_generator_as_dataset_prepares_same_batches(model_data: RasaModelData):
+    data_generator = RasaBatchDataGenerator(
+        model_data, batch_size=2, epochs=1, shuffle=False
+    )
+    dataset = data_generator.as_dataset()
+
+    for index, (batch,) in enumerate(dataset):
+        expected_batch, _ = data_generator[index]
+
+        assert len(batch) == len(expected_batch)
+        for tensor, expected_array in zip(batch, expected_batch):
+            assert tensor.dtype == expected_array.dtype
+            # only the feature dimension is fixed
+            assert tensor.shape.rank == expected_array.ndim
+            np.testing.assert_array_equal(tensor.numpy(), expected_array)
+
+    assert index == len(data_generator) - 1
+
+
 @pytest.mark.parametrize(
     "incoming_data, expected_shape",
     [
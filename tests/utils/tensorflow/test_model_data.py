@@ -1,9 +1,14 @@
 import copy
+import gc
+import pickle
+import weakref
+from pathlib import Path
 
 import pytest
 import numpy as np
 
-from rasa.utils.tensorflow.model_data import RasaModelData
+from rasa.utils.tensorflow.data_generator import RasaDataGenerator
+from rasa.utils.tensorflow.model_data import RasaModelData, PackedFeatureArray
 
 
 def test_shuffle_session_data(model_data: RasaModelData):
@@ -180,3 +185,125 @@ def test_update_key(model_data: RasaModelData):
     assert not model_data.does_feature_exist("label", "ids")
     assert model_data.does_feature_exist("intent", "ids")
     assert "label" not in model_data.data
+
+
+def test_packed_model_data(model_data: RasaModelData):
+    packed_model_data = model_data.packed()
+
+    assert packed_model_data.get_signature() == model_data.get_signature()
+    assert packed_model_data.number_of_examples() == model_data.number_of_examples()
+
+    # only sequence features are packed, 4D features are kept as they are
+    assert isinstance(packed_model_data.get("text", "sentence")[0], PackedFeatureArray)
+    assert isinstance(packed_model_data.get("text", "sentence")[1], PackedFeatureArray)
+    assert (
+        packed_model_data.get("action_text", "sequence")[0]
+        is model_data.get("action_text", "sequence")[0]
+    )
+
+    for packed, expected in zip(
+        RasaDataGenerator.prepare_batch(packed_model_data.data, 1, 4),
+        RasaDataGenerator.prepare_batch(model_data.data, 1, 4),
+    ):
+        assert packed.dtype == expected.dtype
+        np.testing.assert_array_almost_equal(packed, expected)
+
+
+def test_packed_model_data_selects_examples_without_copies(
+    model_data: RasaModelData,
+):
+    packed_model_data = model_data.packed()
+    packed = packed_model_data.get("text", "sentence")[1]
+
+    shuffled = packed_model_data.shuffled_data(packed_model_data.data)
+    train_data, test_data = packed_model_data.split(2, 42)
+    balanced = packed_model_data.balanced_data(packed_model_data.data, 2, False)
+
+    for features in [
+        shuffled["text"]["sentence"][1],
+        train_data.get("text", "sentence")[1],
+        test_data.get("text", "sentence")[1],
+        balanced["text"]["sentence"][1],
+    ]:
+        assert features.features is packed.features
+
+    assert len(train_data.get("text", "sentence")[1]) == 3
+    assert len(test_data.get("text", "sentence")[1]) == 2
+
+
+def test_packed_model_data_split_matches_split(model_data: RasaModelData):
+    train_data, test_data = model_data.split(2, 42)
+    packed_train_data, packed_test_data = model_data.packed().split(2, 42)
+
+    for data, packed_data in [
+        (train_data, packed_train_data),
+        (test_data, packed_test_data),
+    ]:
+        for packed, expected in zip(
+            RasaDataGenerator.prepare_batch(packed_data.data),
+            RasaDataGenerator.prepare_batch(data.data),
+        ):
+            np.testing.assert_array_almost_equal(packed, expected)
+
+
+def test_memory_mapped_packed_model_data(model_data: RasaModelData, tmp_path: Path):
+    packed_model_data = model_data.packed(str(tmp_path))
+
+    for features in packed_model_data.get("text", "sentence"):
+        if features.is_sparse:
+            # the sparse matrix holds a view of the memory mapped data
+            assert not features.features.data.flags.owndata
+        else:
+            assert isinstance(features.features, np.memmap)
+    assert list(tmp_path.glob("*/*.npy"))
+
+    for packed, expected in zip(
+        RasaDataGenerator.prepare_batch(packed_model_data.data),
+        RasaDataGenerator.prepare_batch(model_data.data),
+    ):
+        np.testing.assert_array_almost_equal(packed, expected)
+
+
+def test_packing_packed_model_data_shares_the_packed_features(
+    model_data: RasaModelData,
+):
+    packed_model_data = model_data.packed()
+    packed_again = packed_model_data.packed()
+
+    for features, features_again in zip(
+        packed_model_data.get("text", "sentence"),
+        packed_again.get("text", "sentence"),
+    ):
+        assert features_again is features
+
+
+def test_unpacked_features_are_freed_after_packing(model_data: RasaModelData):
+    # the fixture keeps its own model data alive
+    model_data = copy.deepcopy(model_data)
+    original_features = [
+        weakref.ref(features)
+        for attribute_data in model_data.data.values()
+        for sub_key_features in attribute_data.values()
+        for features in sub_key_features
+        if PackedFeatureArray.can_pack(features)
+    ]
+    assert original_features
+
+    data_example = model_data.first_data_example()
+    model_data = model_data.packed()
+    gc.collect()
+
+    # neither the packed model data nor the data example keep them alive
+    assert all(features() is None for features in original_features)
+    assert data_example
+
+
+def test_pickle_packed_feature_array(model_data: RasaModelData):
+    packed = model_data.packed().get("text", "sentence")[1]
+
+    data_example = pickle.loads(pickle.dumps(packed[2:3]))
+
+    assert len(data_example) == 1
+    # only the rows of the pickled examples are kept
+    assert data_example.features.shape[0] == packed[2].shape[0]
+    assert (data_example[0] != packed[2]).nnz == 0
@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from rasa.utils.batching import MicroBatcher
+
+
+async def test_micro_batcher_batches_concurrent_items():
+    received_batches = []
+
+    async def process_batch(items: List[Any]) -> List[Any]:
+        received_batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(
+        process_batch, max_batch_size=3, max_wait_time_in_seconds=0.05
+    )
+
+    results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+
+    assert results == [0, 2, 4, 6, 8]
+    assert received_batches == [[0, 1, 2], [3, 4]]
+    assert batcher.number_of_batches == 2
+    assert batcher.average_batch_size == 2.5
+    assert batcher.average_batch_fill == pytest.approx(2.5 / 3)
+
+
+async def test_micro_batcher_flushes_after_wait_time():
+    async def process_batch(items: List[Any]) -> List[Any]:
+        return items
+
+    batcher = MicroBatcher(
+        process_batch, max_batch_size=100, max_wait_time_in_seconds=0.01
+    )
+
+    assert await asyncio.wait_for(batcher.submit("a"), timeout=1) == "a"
+    assert batcher.number_of_batches == 1
+
+
+async def test_micro_batcher_raises_error_to_every_caller():
+    async def process_batch(items: List[Any]) -> List[Any]:
+        raise ValueError("broken")
+
+    batcher = MicroBatcher(process_batch, max_batch_size=2)
+
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(2), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_micro_batcher_with_invalid_batch_size():
+    async def process_batch(items: List[Any]) -> List[Any]:
+        return items
+
+    with pytest.raises(ValueError):
+        MicroBatcher(process_batch, max_batch_size=0)
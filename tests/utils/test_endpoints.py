@@ -1,12 +1,14 @@
 import logging
 from pathlib import Path
-from typing import Text, Optional, Union
+from typing import Any, Text, Optional, Union
 from unittest.mock import Mock
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 
 from rasa.shared.exceptions import FileNotFoundException
+from tests.conftest import AsyncMock
 from tests.utilities import latest_request, json_of_latest_request
 import rasa.utils.endpoints as endpoint_utils
 
@@ -235,3 +237,57 @@ def test_int_arg(value: Optional[Union[int, str]], default: int, expected_result
     if value is not None:
         request.args = {"key": value}
     assert endpoint_utils.int_arg(request, "key", default) == expected_result
+
+
+async def test_endpoint_config_reuses_session():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/", pool_size=3, keepalive_timeout=10, dns_cache_ttl=60
+    )
+
+    session = endpoint.pooled_session()
+    assert endpoint.pooled_session() is session
+    assert session.connector.limit == 3
+    assert session._default_headers == endpoint.session()._default_headers
+
+    await endpoint_utils.close_sessions()
+
+    assert session.closed
+    assert endpoint.pooled_session() is not session
+    await endpoint.close()
+
+
+async def test_endpoint_config_caches_ssl_context():
+    endpoint = endpoint_utils.EndpointConfig(
+        "https://example.com/", cafile="data/test_endpoints/cert.pem"
+    )
+
+    assert endpoint.ssl_context() is endpoint.ssl_context()
+    assert endpoint.copy() == endpoint
+
+
+async def test_endpoint_config_records_metrics(monkeypatch: MonkeyPatch):
+    endpoint = endpoint_utils.EndpointConfig("https://example.com/")
+
+    class Response:
+        status = 500
+        reason = "Internal Server Error"
+        content = Mock(read=AsyncMock(return_value=b""))
+
+        async def __aenter__(self):
+            assert endpoint.metrics.requests_in_flight == 1
+            return self
+
+        async def __aexit__(self, *args: Any) -> None:
+            pass
+
+    session = Mock(request=Mock(return_value=Response()))
+    monkeypatch.setattr(endpoint, "pooled_session", lambda: session)
+
+    with pytest.raises(endpoint_utils.ClientResponseError):
+        await endpoint.request("post")
+
+    metrics = endpoint.metrics.as_dict()
+    assert metrics["requests"] == metrics["failed_requests"] == 1
+    assert metrics["requests_in_flight"] == 0
+    assert metrics["max_requests_in_flight"] == 1
+    assert metrics["pool_size"] == 100